@@ -10,12 +10,109 @@ bl_info = {
 }
 
 import bpy
+import base64
+import errno
+import logging
+import logging.handlers
+import os
+import queue
+import re
+import selectors
+import shutil
 import socket
+import sys
+import tempfile
 import threading
+import time
 import json
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from bpy.props import StringProperty, IntProperty, BoolProperty
 from bpy.types import Operator, Panel, AddonPreferences
 
+# Worker threads only enqueue log records; a single listener thread
+# (started in register()) writes them out
+_log_queue = queue.SimpleQueue()
+_log_output = logging.StreamHandler()
+_log_output.setFormatter(logging.Formatter("[MCP Bridge] %(message)s"))
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_output)
+
+logger = logging.getLogger("BlenderMCPBridge")
+logger.setLevel(logging.INFO)
+logger.propagate = False
+logger.handlers[:] = [logging.handlers.QueueHandler(_log_queue)]  # Reload-safe
+
+# Prefer orjson when it is installed into Blender's Python; it parses
+# bytes/memoryviews directly and serializes straight to bytes
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def _json_default(obj):
+    # Binary fields (packed mesh geometry, PNGs) travel base64-encoded in JSON;
+    # msgpack carries them as raw bytes
+    if isinstance(obj, (bytes, bytearray, memoryview)):
+        return base64.b64encode(obj).decode('ascii')
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+# Bound once at import so the recv loop skips the module/attribute lookups
+if ORJSON_AVAILABLE:
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj, default=_json_default)
+else:
+    _decode = json.JSONDecoder().decode
+    _encode = json.JSONEncoder(default=_json_default).encode
+
+    def _json_loads(data):
+        return _decode(bytes(data).decode('utf-8'))
+
+    def _json_dumps(obj):
+        return _encode(obj).encode('utf-8')
+
+# msgspec's msgpack codec is used for clients that send msgpack frames
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
+if MSGSPEC_AVAILABLE:
+    _msgpack_loads = msgspec.msgpack.Decoder().decode
+    _msgpack_dumps = msgspec.msgpack.Encoder().encode
+    _DECODE_ERRORS = (json.JSONDecodeError, msgspec.DecodeError)
+else:
+    _DECODE_ERRORS = (json.JSONDecodeError,)
+
+# zstd compresses large responses for clients that ask for it
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+# Large render previews go to clients on this machine through POSIX
+# shared memory instead of the socket. On Windows a block is freed with
+# its last handle, so it cannot outlive this side until the client reads it.
+try:
+    from multiprocessing import resource_tracker, shared_memory
+    SHARED_MEMORY_AVAILABLE = os.name == 'posix'
+except ImportError:
+    SHARED_MEMORY_AVAILABLE = False
+
+# First byte of a msgpack map (fixmap, map16, map32); JSON starts with "{"
+MSGPACK_MAP_MARKERS = frozenset(range(0x80, 0x90)) | {0xde, 0xdf}
+
+
+def _on_pref_change(self, context):
+    """Refresh the panel's connection labels when host/port are edited"""
+    MCP_PT_Panel._cached_labels = (f"Host: {self.host}", f"Port: {self.port}")
+
 
 class MCPAddonPreferences(AddonPreferences):
     bl_idname = __name__
@@ -24,6 +121,7 @@ class MCPAddonPreferences(AddonPreferences):
         name="Host",
         description="Host address for MCP server connection",
         default="localhost",
+        update=_on_pref_change,
     )
     
     port: IntProperty(
@@ -32,12 +130,39 @@ class MCPAddonPreferences(AddonPreferences):
         default=9876,
         min=1024,
         max=65535,
+        update=_on_pref_change,
+    )
+    
+    rcvbuf: IntProperty(
+        name="Receive Buffer",
+        description="Kernel receive buffer size (bytes) for client sockets",
+        default=262144,
+        min=4096,
+    )
+    
+    sndbuf: IntProperty(
+        name="Send Buffer",
+        description="Kernel send buffer size (bytes) for client sockets",
+        default=262144,
+        min=4096,
+    )
+    
+    listeners: IntProperty(
+        name="Listeners",
+        description="Accept loops sharing the port through SO_REUSEPORT. "
+                    "Commands still run one at a time on Blender's main thread",
+        default=1,
+        min=1,
+        max=4,
     )
 
     def draw(self, context):
         layout = self.layout
         layout.prop(self, "host")
         layout.prop(self, "port")
+        layout.prop(self, "rcvbuf")
+        layout.prop(self, "sndbuf")
+        layout.prop(self, "listeners")
 
 
 class MCP_OT_StartServer(Operator):
@@ -52,7 +177,7 @@ class MCP_OT_StartServer(Operator):
         # Start server in background thread
         server_thread = threading.Thread(
             target=start_mcp_server,
-            args=(prefs.host, prefs.port),
+            args=(prefs.host, prefs.port, prefs.rcvbuf, prefs.sndbuf, prefs.listeners),
             daemon=True
         )
         server_thread.start()
@@ -68,8 +193,9 @@ class MCP_OT_StopServer(Operator):
     bl_options = {'REGISTER'}
 
     def execute(self, context):
-        global server_running
-        server_running = False
+        _stop_server()
+        if executor:
+            executor.shutdown(wait=False)
         self.report({'INFO'}, "MCP Server stopped")
         return {'FINISHED'}
 
@@ -81,15 +207,22 @@ class MCP_PT_Panel(Panel):
     bl_space_type = 'VIEW_3D'
     bl_region_type = 'UI'
     bl_category = 'MCP'
+    
+    # (host label, port label); rebuilt only when the preferences change
+    _cached_labels = None
 
     def draw(self, context):
         layout = self.layout
-        prefs = context.preferences.addons[__name__].preferences
+        labels = MCP_PT_Panel._cached_labels
+        if labels is None:
+            prefs = context.preferences.addons[__name__].preferences
+            _on_pref_change(prefs, context)
+            labels = MCP_PT_Panel._cached_labels
         
         box = layout.box()
         box.label(text="Connection Settings:", icon='LINKED')
-        box.label(text=f"Host: {prefs.host}")
-        box.label(text=f"Port: {prefs.port}")
+        box.label(text=labels[0])
+        box.label(text=labels[1])
         
         layout.separator()
         
@@ -108,142 +241,1207 @@ class MCP_PT_Panel(Panel):
             status_box.label(text="Server Stopped", icon='X')
 
 
+# Wire framing
+FRAME_HEADER_SIZE = 4
+RECV_BUFFER_SIZE = 65536
+MAX_FRAME_SIZE = 256 * 1024 * 1024
+DEFAULT_SOCKET_BUFFER = 262144
+FAST_PATH_MAX_SIZE = 4096
+_PARAMS_MARKERS = (b',"params":', b', "params": ')
+HAS_SENDMSG = hasattr(socket.socket, "sendmsg")
+# Frames never reach 2**31 bytes, so the top bit of a response header
+# marks a zstd-compressed body
+COMPRESSED_FLAG = 0x80000000
+COMPRESS_MIN_SIZE = 16 * 1024
+SHARED_MEMORY_MIN_SIZE = 256 * 1024
+
+# Local clients can reach the server over a Unix domain socket, which
+# skips the TCP stack; BLENDER_SOCK_PATH overrides the default path
+LOCAL_HOSTS = frozenset({"localhost", "127.0.0.1", "::1"})
+HAS_AF_UNIX = hasattr(socket, "AF_UNIX") and hasattr(os, "getuid")
+UNIX_SOCKET_PATH = os.environ.get("BLENDER_SOCK_PATH") or (
+    os.path.join(tempfile.gettempdir(), f"blender-mcp-{os.getuid()}.sock")
+    if HAS_AF_UNIX else None
+)
+
+# bpy is not thread-safe: workers queue commands here and a timer on
+# Blender's main thread runs them
+MAIN_THREAD_POLL_INTERVAL = 0.01
+# How long a worker waits for the main thread to pick up its command; the
+# MCP server's socket timeout is the same
+MAIN_THREAD_TIMEOUT = 30.0
+_main_thread_queue = queue.SimpleQueue()
+
+# Receive buffers shared by the worker threads, checked out per connection
+_buffer_pool = queue.LifoQueue()
+
+# Serialized responses of read-only actions, keyed by (action, params).
+# Entries are valid until their TTL runs out or any other action bumps
+# the scene epoch.
+RESPONSE_CACHE_TTL = 0.25
+RESPONSE_CACHE_MAX_ENTRIES = 256
+_response_cache = {}
+_scene_epoch = 0
+
+# Image files written by render_scene, keyed by the render settings and
+# frame, most recently used last. They stay valid while the scene is
+# unchanged: _scene_revision counts depsgraph updates, so edits made in
+# Blender's UI count as well as MCP commands.
+RENDER_CACHE_MAX_ENTRIES = 32
+_render_cache = {}
+_render_cache_state = None
+_scene_revision = 0
+
 # Global server state
 server_running = False
-server_socket = None
+server_sockets = []
+executor = None
+wake_sockets = []
+
+
+def _worker_count():
+    """Size the client worker pool: half the hardware threads, at least 4"""
+    return max(4, (os.cpu_count() or 1) // 2)
+
 
+def _listener_count(requested):
+    """Number of accept loops; more than one needs SO_REUSEPORT"""
+    if not hasattr(socket, "SO_REUSEPORT"):
+        return 1
+    return max(1, min(4, requested))
 
-def start_mcp_server(host, port):
-    """Start socket server to receive MCP commands"""
-    global server_running, server_socket
+
+def _probe_port(host, port):
+    """Raise OSError if host:port is already bound
     
-    server_running = True
-    server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    Listeners sharing a port with SO_REUSEPORT would also share it with
+    another Blender of the same user that listens the same way, and the
+    kernel would split connections between the two scenes. A plain bind
+    fails instead when anything holds the port.
+    """
+    probe = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    try:
+        probe.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        probe.bind((host, port))
+    finally:
+        probe.close()
+
+
+def _wake_server():
+    """Interrupt the accept loops so they notice server_running changed"""
+    for sock in list(wake_sockets):
+        try:
+            sock.send(b"\0")
+        except OSError:
+            pass
+
+
+def _stop_server():
+    """Stop accepting immediately: shut the listeners down and wake the loops"""
+    global server_running
+    server_running = False
+    for listener in list(server_sockets):
+        try:
+            listener.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass  # Not connected/listening on this platform, or already closed
+    _wake_server()
+
+
+def _tune_socket(sock, rcvbuf, sndbuf):
+    """Size kernel buffers for large payloads and disable Nagle's algorithm"""
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, rcvbuf)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, sndbuf)
+    if sock.family != getattr(socket, "AF_UNIX", None):
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+
+def _open_listener(host, port, rcvbuf, sndbuf, reuse_port):
+    """Create a non-blocking listening socket bound to host:port"""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        if reuse_port:
+            # Lets several listeners share the port; the kernel spreads
+            # incoming connections across them
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        _tune_socket(sock, rcvbuf, sndbuf)
+        sock.bind((host, port))
+        sock.listen(5)
+        sock.setblocking(False)
+    except Exception:
+        sock.close()
+        raise
+    return sock
+
+
+def _remove_stale_unix_socket(path):
+    """Remove a socket file left behind by a previous session
     
+    Raises OSError if another Blender is still listening there; taking the
+    path over would silently route its clients to this scene.
+    """
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
     try:
-        server_socket.bind((host, port))
-        server_socket.listen(5)
-        server_socket.settimeout(1.0)  # Allow periodic checking of server_running
-        
-        print(f"[MCP Bridge] Server listening on {host}:{port}")
+        probe.connect(path)
+    except OSError as e:
+        if e.errno not in (errno.ECONNREFUSED, errno.ENOENT):
+            raise
+    else:
+        raise OSError(errno.EADDRINUSE, "another server is listening on this socket")
+    finally:
+        probe.close()
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+def _open_unix_listener(path, rcvbuf, sndbuf):
+    """Create a non-blocking listening socket at a Unix domain socket path"""
+    _remove_stale_unix_socket(path)
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        _tune_socket(sock, rcvbuf, sndbuf)
+        # Created owner-only, so other users never get a window to connect
+        previous_umask = os.umask(0o077)
+        try:
+            sock.bind(path)
+        finally:
+            os.umask(previous_umask)
+        sock.listen(5)
+        sock.setblocking(False)
+    except Exception:
+        sock.close()
+        raise
+    return sock
+
+
+def _accept_loop(listener, rcvbuf, sndbuf):
+    """Accept clients on one listener until the server is stopped"""
+    global server_running
+    
+    # The selector wakes only on real events: a pending connection or a
+    # byte written to this loop's wake socket by the stop operator
+    sel = selectors.DefaultSelector()
+    wake_r, wake_w = socket.socketpair()
+    wake_sockets.append(wake_w)
+    
+    try:
+        sel.register(listener, selectors.EVENT_READ, data="accept")
+        sel.register(wake_r, selectors.EVENT_READ, data="wake")
         
         while server_running:
-            try:
-                client_socket, address = server_socket.accept()
-                print(f"[MCP Bridge] Client connected: {address}")
+            for key, _ in sel.select():
+                if key.data == "wake":
+                    wake_r.recv(64)
+                    continue
                 
-                # Handle client in a separate thread
-                client_thread = threading.Thread(
-                    target=handle_client,
-                    args=(client_socket,),
-                    daemon=True
-                )
-                client_thread.start()
+                try:
+                    client_socket, address = listener.accept()
+                except BlockingIOError:
+                    continue  # Another wakeup already took the connection
+                except Exception as e:
+                    if server_running:  # Listener shutdown is a normal stop
+                        logger.error("Accept error: %s", e)
+                    server_running = False
+                    _wake_server()
+                    break
                 
-            except socket.timeout:
-                continue  # Check server_running flag
-            except Exception as e:
-                print(f"[MCP Bridge] Accept error: {e}")
-                break
+                client_socket.setblocking(True)
+                _tune_socket(client_socket, rcvbuf, sndbuf)
+                logger.info("Client connected: %s", address)
+                
+                # Hand the client off to a pooled worker thread
+                executor.submit(handle_client, client_socket)
+                
+    except Exception as e:
+        logger.exception("Server error: %s", e)
+    finally:
+        wake_sockets.remove(wake_w)
+        sel.close()
+        wake_r.close()
+        wake_w.close()
+
+
+def start_mcp_server(host, port, rcvbuf=DEFAULT_SOCKET_BUFFER,
+                     sndbuf=DEFAULT_SOCKET_BUFFER, listeners=1):
+    """Start socket server to receive MCP commands
+    
+    One listener by default; more share the port through SO_REUSEPORT,
+    after checking that no other process holds it.
+    """
+    global server_running, executor
+    
+    server_running = True
+    count = _listener_count(listeners)
+    
+    try:
+        if count > 1:
+            _probe_port(host, port)
+        for _ in range(count):
+            server_sockets.append(
+                _open_listener(host, port, rcvbuf, sndbuf, count > 1)
+            )
+        unix_path = None
+        if host in LOCAL_HOSTS and UNIX_SOCKET_PATH and HAS_AF_UNIX:
+            try:
+                server_sockets.append(
+                    _open_unix_listener(UNIX_SOCKET_PATH, rcvbuf, sndbuf)
+                )
+                unix_path = UNIX_SOCKET_PATH
+            except OSError as e:
+                logger.warning("Unix socket %s unavailable: %s", UNIX_SOCKET_PATH, e)
+        workers = _worker_count()
+        executor = ThreadPoolExecutor(
+            max_workers=workers,
+            thread_name_prefix="mcp-worker"
+        )
+        # One receive buffer per worker bounds steady-state memory
+        for _ in range(workers - _buffer_pool.qsize()):
+            _buffer_pool.put(bytearray(RECV_BUFFER_SIZE))
+        
+        logger.info("Server listening on %s:%s (%d listener%s)",
+                    host, port, count, "s" if count > 1 else "")
+        if unix_path:
+            logger.info("Server listening on %s", unix_path)
+        
+        # Extra listeners get their own threads; the first runs here
+        threads = [
+            threading.Thread(
+                target=_accept_loop,
+                args=(listener, rcvbuf, sndbuf),
+                name="mcp-accept",
+                daemon=True
+            )
+            for listener in server_sockets[1:]
+        ]
+        for thread in threads:
+            thread.start()
+        _accept_loop(server_sockets[0], rcvbuf, sndbuf)
+        for thread in threads:
+            thread.join()
                 
     except Exception as e:
-        print(f"[MCP Bridge] Server error: {e}")
+        logger.exception("Server error: %s", e)
     finally:
-        if server_socket:
-            server_socket.close()
         server_running = False
-        print("[MCP Bridge] Server stopped")
+        _wake_server()
+        for listener in server_sockets:
+            if listener.family == getattr(socket, "AF_UNIX", None):
+                try:
+                    os.unlink(listener.getsockname())
+                except OSError:
+                    pass
+            listener.close()
+        server_sockets.clear()
+        if executor:
+            executor.shutdown(wait=False)
+            executor = None
+        logger.info("Server stopped")
+
+
+def _recv_exact(sock, buf, n):
+    """Fill the first n bytes of buf from sock; False if the peer closed"""
+    view = memoryview(buf)
+    offset = 0
+    while offset < n:
+        received = sock.recv_into(view[offset:n])
+        if not received:
+            return False
+        offset += received
+    return True
+
+
+def _send_frame(sock, payload, flags=0):
+    """Send payload prefixed with its 4-byte big-endian length
+    
+    Header and body go out in one vectored write without being joined
+    first; platforms without sendmsg (Windows) fall back to sendall.
+    """
+    header = (len(payload) | flags).to_bytes(FRAME_HEADER_SIZE, "big")
+    if not HAS_SENDMSG:
+        sock.sendall(header + payload)
+        return
+    
+    sent = sock.sendmsg([header, payload])
+    # sendmsg may write only part of the frame; finish it with sendall
+    if sent < FRAME_HEADER_SIZE:
+        sock.sendall(header[sent:] + payload)
+    elif sent < FRAME_HEADER_SIZE + len(payload):
+        sock.sendall(memoryview(payload)[sent - FRAME_HEADER_SIZE:])
+
+
+def _typed_response(result):
+    """Wrap a handler result in the MCP server's {"status", "result"} envelope"""
+    if result.get("success"):
+        return {"status": "success", "result": result}
+    return {
+        "status": "error",
+        "message": result.get("error", "Unknown error"),
+        "result": result,
+    }
+
+
+def _parse_command(data):
+    """Decode a command frame
+    
+    Small frames shaped like {"action": "<known action>", "params": {...}}
+    (compact or default json.dumps separators) only run the JSON parser
+    over the params object; anything else gets a full parse.
+    """
+    if len(data) <= FAST_PATH_MAX_SIZE:
+        raw = bytes(data)
+        if raw.startswith(b'{"action":') and raw.endswith(b'}'):
+            start = 11 if raw[10:11] == b' ' else 10
+            end = raw.find(b'"', start + 1)
+            action = _ACTION_NAMES.get(raw[start + 1:end]) \
+                if raw[start:start + 1] == b'"' else None
+            if action is not None:
+                rest = raw[end + 1:-1]
+                if not rest:
+                    return {"action": action}
+                for marker in _PARAMS_MARKERS:
+                    if rest.startswith(marker):
+                        try:
+                            params = _json_loads(rest[len(marker):])
+                        except ValueError:
+                            break  # Trailing keys; parse the whole frame
+                        if isinstance(params, dict):
+                            return {"action": action, "params": params}
+                        break
+    return _json_loads(data)
 
 
 def handle_client(client_socket):
-    """Handle individual client connections"""
+    """Handle individual client connections
+    
+    Every message in either direction is a 4-byte big-endian length
+    followed by that many bytes of UTF-8 JSON or msgpack. Responses use
+    the codec the request arrived in; large ones are zstd-compressed,
+    with the header's top bit set, when the request has
+    "compress": "zstd".
+    """
+    header = bytearray(FRAME_HEADER_SIZE)
+    compressor = None  # zstd contexts are not thread-safe; one per client
+    try:
+        buf = _buffer_pool.get_nowait()
+    except queue.Empty:
+        buf = bytearray(RECV_BUFFER_SIZE)
     try:
         while server_running:
             # Receive command
-            data = client_socket.recv(4096)
-            if not data:
+            if not _recv_exact(client_socket, header, FRAME_HEADER_SIZE):
+                break
+            
+            length = int.from_bytes(header, "big")
+            if length > MAX_FRAME_SIZE:
+                logger.warning("Frame of %d bytes exceeds limit", length)
+                break
+            if length > len(buf):
+                buf.extend(bytes(length - len(buf)))
+            if not _recv_exact(client_socket, buf, length):
                 break
             
+            if length and buf[0] in MSGPACK_MAP_MARKERS:
+                if not MSGSPEC_AVAILABLE:
+                    # Can't answer in msgpack; the MCP server reads JSON
+                    # replies too, in the {"status", "message"} envelope
+                    message = ("msgpack requires msgspec in Blender's Python; "
+                               "set BLENDER_WIRE=json on the server")
+                    _send_frame(client_socket, _json_dumps({
+                        "status": "error",
+                        "message": message,
+                        "success": False,
+                        "error": message,
+                    }))
+                    continue
+                codec, loads, dumps = "msgpack", _msgpack_loads, _msgpack_dumps
+            else:
+                codec, loads, dumps = "json", _parse_command, _json_dumps
+            
             try:
-                command = json.loads(data.decode('utf-8'))
-                print(f"[MCP Bridge] Received command: {command.get('action')}")
+                command = loads(memoryview(buf)[:length])
+                # The MCP server sends {"type", "params", "id"} and expects
+                # a {"status", "result"} envelope back
+                typed = 'action' not in command
+                compress = ZSTD_AVAILABLE and command.get('compress') == 'zstd'
+                if typed:
+                    command = {
+                        'action': command.get('type'),
+                        'params': command.get('params') or {},
+                    }
+                logger.info("Received command: %s", command.get('action'))
+                if (command.get('params') or {}).get('stream'):
+                    # The handler may send progress frames ahead of the
+                    # response; this thread is blocked until it returns
+                    command['progress'] = lambda message: _send_frame(
+                        client_socket, dumps(message))
                 
-                # Execute command and get result
-                result = execute_command(command)
+                # Execute command and get result, unless a fresh
+                # serialized answer to the same query is cached
+                variant = (codec, typed)
+                payload = _cached_response(command, variant)
+                if payload is None:
+                    epoch = _scene_epoch
+                    result = execute_command(command)
+                    payload = dumps(_typed_response(result) if typed else result)
+                    _store_response(command, variant, result, payload, epoch)
                 
                 # Send response
-                response = json.dumps(result)
-                client_socket.sendall(response.encode('utf-8'))
+                if compress and len(payload) >= COMPRESS_MIN_SIZE:
+                    if compressor is None:
+                        compressor = zstandard.ZstdCompressor(level=1)
+                    _send_frame(client_socket, compressor.compress(payload),
+                                COMPRESSED_FLAG)
+                else:
+                    _send_frame(client_socket, payload)
                 
-            except json.JSONDecodeError as e:
-                error_response = json.dumps({
+            except _DECODE_ERRORS as e:
+                error_response = dumps({
                     "success": False,
-                    "error": f"Invalid JSON: {str(e)}"
+                    "error": f"Invalid {codec}: {e}"
                 })
-                client_socket.sendall(error_response.encode('utf-8'))
+                _send_frame(client_socket, error_response)
                 
     except Exception as e:
-        print(f"[MCP Bridge] Client handler error: {e}")
+        logger.exception("Client handler error: %s", e)
     finally:
         client_socket.close()
-        print("[MCP Bridge] Client disconnected")
+        # Buffers grown by large frames are not pooled again
+        if len(buf) > RECV_BUFFER_SIZE:
+            buf = bytearray(RECV_BUFFER_SIZE)
+        _buffer_pool.put(buf)
+        logger.info("Client disconnected")
 
 
-def execute_command(command):
-    """Execute bpy command from MCP server"""
+def _cached(ttl):
+    """Mark a read-only handler whose serialized response may be reused"""
+    def decorator(handler):
+        handler.cache_ttl = ttl
+        return handler
+    return decorator
+
+
+def _cache_key(command, variant):
+    """(variant, action, params) key for a cacheable command, else None"""
+    action = command.get('action')
+    handler = _ACTIONS.get(action)
+    if handler is None or not hasattr(handler, 'cache_ttl'):
+        return None
+    try:
+        return variant, action, frozenset(command.get('params', {}).items())
+    except (AttributeError, TypeError):
+        return None  # Unhashable params are simply not cached
+
+
+def _cached_response(command, variant):
+    """Return cached response bytes for command if still valid"""
+    key = _cache_key(command, variant)
+    if key is None:
+        return None
+    entry = _response_cache.get(key)
+    if entry is None:
+        return None
+    epoch, expires, payload = entry
+    if epoch != _scene_epoch or time.monotonic() > expires:
+        _response_cache.pop(key, None)
+        return None
+    return payload
+
+
+def _store_response(command, variant, result, payload, epoch):
+    """Cache a successful read-only response computed at the given epoch"""
+    key = _cache_key(command, variant)
+    if key is None or not result.get("success"):
+        return
+    if len(_response_cache) >= RESPONSE_CACHE_MAX_ENTRIES:
+        _response_cache.clear()
+    ttl = _ACTIONS[key[1]].cache_ttl
+    _response_cache[key] = (epoch, time.monotonic() + ttl, payload)
+
+
+# Action handlers - each takes the command params and returns a result dict
+def _add_cube(params):
+    bpy.ops.mesh.primitive_cube_add(**params)
+    return {"success": True, "message": "Cube added"}
+
+
+def _add_sphere(params):
+    bpy.ops.mesh.primitive_uv_sphere_add(**params)
+    return {"success": True, "message": "Sphere added"}
+
+
+def _add_cylinder(params):
+    bpy.ops.mesh.primitive_cylinder_add(**params)
+    return {"success": True, "message": "Cylinder added"}
+
+
+def _delete_object(params):
+    obj_name = params.get('name')
+    obj = bpy.data.objects.get(obj_name) if obj_name else None
+    if obj is None:
+        return {"success": False, "error": "Object not found"}
+    bpy.data.objects.remove(obj)
+    return {"success": True, "message": f"Object '{obj_name}' deleted"}
+
+
+def _move_object(params):
+    obj_name = params.get('name')
+    obj = bpy.data.objects.get(obj_name) if obj_name else None
+    if obj is None:
+        return {"success": False, "error": "Object not found"}
+    obj.location = params.get('location', [0, 0, 0])
+    return {"success": True, "message": f"Object '{obj_name}' moved"}
+
+
+def _render(params):
+    bpy.ops.render.render(write_still=True)
+    return {"success": True, "message": "Render complete"}
+
+
+# "Sample 12/128" (Cycles), "Rendering 12 / 64 samples" (EEVEE)
+_RENDER_STATS_PROGRESS = re.compile(r'(\d+)\s*/\s*(\d+)')
+
+
+@bpy.app.handlers.persistent
+def _bump_scene_revision(*args):
+    """depsgraph_update_post / load_post handler: the scene may have changed"""
+    global _scene_revision
+    _scene_revision += 1
+
+
+def _render_cache_key(scene):
+    """What a render depends on besides the scene contents"""
+    render = scene.render
+    return (
+        scene.frame_current, render.engine, render.resolution_x,
+        render.resolution_y, render.resolution_percentage,
+        scene.camera.name if scene.camera else None,
+        render.image_settings.file_format,
+    )
+
+
+def _cached_render(key, path):
+    """Write the cached render for key to path; False if there is none"""
+    entry = _render_cache.pop(key, None)
+    if entry is None:
+        return False
+    cached_path, mtime = entry
+    try:
+        if os.stat(cached_path).st_mtime != mtime:
+            return False  # Overwritten since
+        if cached_path != path:
+            shutil.copyfile(cached_path, path)
+    except OSError:
+        return False
+    _render_cache[key] = entry
+    return True
+
+
+def _render_scene(params):
+    global _render_cache_state
+    # _dispatch already counted this command, so an unchanged state means
+    # nothing but the previous render ran since
+    if (_scene_epoch - 1, _scene_revision) != _render_cache_state:
+        _render_cache.clear()
+    
+    scene = bpy.context.scene
+    if params.get('frame') is not None:
+        scene.frame_set(params['frame'])
+    if params.get('output_path'):
+        scene.render.filepath = params['output_path']
+        key = _render_cache_key(scene)
+        path = scene.render.frame_path(frame=scene.frame_current)
+        if _cached_render(key, path):
+            _render_cache_state = (_scene_epoch, _scene_revision)
+            return {
+                "success": True,
+                "message": "Render complete (scene unchanged, previous render reused)",
+                "render_time": 0.0,
+                "cached": True,
+            }
+    
+    last = None
+    
+    def on_stats(stats):
+        nonlocal last
+        found = _RENDER_STATS_PROGRESS.findall(stats)
+        if found and found[-1] != last:
+            last = found[-1]
+            _report_progress(int(last[0]), int(last[1]))
+    
+    streaming = _progress_sink is not None
+    if streaming:
+        bpy.app.handlers.render_stats.append(on_stats)
+    start = time.perf_counter()
+    try:
+        bpy.ops.render.render(write_still=bool(params.get('output_path')))
+    finally:
+        if streaming:
+            bpy.app.handlers.render_stats.remove(on_stats)
+    if params.get('output_path'):
+        try:
+            _render_cache[key] = (path, os.stat(path).st_mtime)
+        except OSError:
+            pass  # Written somewhere frame_path() does not predict
+        while len(_render_cache) > RENDER_CACHE_MAX_ENTRIES:
+            del _render_cache[next(iter(_render_cache))]
+    # Taken after rendering, which may itself update the depsgraph
+    _render_cache_state = (_scene_epoch, _scene_revision)
+    return {
+        "success": True,
+        "message": "Render complete",
+        "render_time": round(time.perf_counter() - start, 2),
+    }
+
+
+def _get_render_preview(params):
+    # Blender can only write renders to disk; the PNG is read back here so
+    # the MCP server gets the bytes inline and never needs a shared file
+    render = bpy.context.scene.render
+    percentage = render.resolution_percentage
+    longest = max(render.resolution_x, render.resolution_y)
+    max_size = int(params.get('max_size', 800))
+    render.resolution_percentage = max(1, min(100, max_size * 100 // longest))
+    fd, path = tempfile.mkstemp(prefix="blender_preview_", suffix=".png")
+    try:
+        # Blender writes into the file mkstemp opened, so it is read back
+        # through that descriptor instead of being opened again
+        with os.fdopen(fd, 'rb') as f:
+            bpy.ops.render.render()
+            bpy.data.images['Render Result'].save_render(filepath=path)
+            data = f.read()
+    finally:
+        render.resolution_percentage = percentage
+        os.unlink(path)
+    return _image_response(data, params)
+
+
+def _get_viewport_screenshot(params):
+    area = next((a for a in bpy.context.screen.areas if a.type == 'VIEW_3D'), None)
+    if area is None:
+        return {"success": False, "error": "No 3D viewport found"}
+    
+    def capture(path):
+        with bpy.context.temp_override(area=area):
+            bpy.ops.screen.screenshot_area(filepath=path)
+        max_size = int(params.get('max_size', 800))
+        image = bpy.data.images.load(path)
+        try:
+            width, height = image.size
+            if max(width, height) > max_size:
+                scale = max_size / max(width, height)
+                image.scale(max(1, int(width * scale)), max(1, int(height * scale)))
+                image.save()
+        finally:
+            bpy.data.images.remove(image)
+    
+    if params.get('filepath'):
+        capture(params['filepath'])
+        return {"success": True, "filepath": params['filepath']}
+    
+    # Without a filepath the PNG goes back inline, read through the
+    # descriptor of the temp file it was written to
+    fd, path = tempfile.mkstemp(prefix="blender_screenshot_", suffix=".png")
+    try:
+        with os.fdopen(fd, 'rb') as f:
+            capture(path)
+            data = f.read()
+    finally:
+        os.unlink(path)
+    return _image_response(data, params)
+
+
+def _image_response(data, params):
+    """Result carrying PNG bytes: raw bytes in msgpack, base64 in JSON,
+    or shared memory for large images when the client asked for it"""
+    if (SHARED_MEMORY_AVAILABLE and params.get('transport') == 'shm'
+            and len(data) >= SHARED_MEMORY_MIN_SIZE):
+        return {"success": True, "format": "png", **_to_shared_memory(data)}
+    return {"success": True, "format": "png", "image_data": data}
+
+
+def _to_shared_memory(data):
+    """Copy data into a new shared memory block for the client to unlink"""
+    try:
+        shm = shared_memory.SharedMemory(create=True, size=len(data), track=False)
+    except TypeError:  # Python < 3.13 always tracks the block
+        shm = shared_memory.SharedMemory(create=True, size=len(data))
+        # Otherwise the tracker unlinks it again at exit and warns
+        resource_tracker.unregister(shm._name, "shared_memory")
+    try:
+        shm.buf[:len(data)] = data
+    finally:
+        shm.close()
+    return {"shm_name": shm.name, "size": len(data)}
+
+
+def _save_file(params):
+    filepath = params.get('filepath')
+    bpy.ops.wm.save_as_mainfile(filepath=filepath)
+    return {"success": True, "message": f"File saved to {filepath}"}
+
+
+# import_file type -> (bpy.ops module, operator)
+_IMPORTERS = {
+    'OBJ': ('wm', 'obj_import'),
+    'FBX': ('import_scene', 'fbx'),
+    'GLTF': ('import_scene', 'gltf'),
+    'STL': ('wm', 'stl_import'),
+    'PLY': ('wm', 'ply_import'),
+    'ABC': ('wm', 'alembic_import'),
+    'USD': ('wm', 'usd_import'),
+    'X3D': ('import_scene', 'x3d'),
+    'DAE': ('wm', 'collada_import'),
+}
+_EXTENSION_TYPES = {
+    '.obj': 'OBJ', '.fbx': 'FBX', '.gltf': 'GLTF', '.glb': 'GLTF',
+    '.stl': 'STL', '.ply': 'PLY', '.abc': 'ABC', '.usd': 'USD',
+    '.usda': 'USD', '.usdc': 'USD', '.usdz': 'USD', '.x3d': 'X3D',
+    '.wrl': 'X3D', '.dae': 'DAE',
+}
+
+# Objects created by earlier imports, keyed by (path, mtime_ns, size, type).
+# Importing an unchanged file again while those objects are still in the
+# scene returns them instead of running the importer a second time.
+_import_cache = {}
+
+
+def _import_file(params):
+    path = params.get('file_path')
+    file_type = params.get('file_type', 'AUTO')
+    if file_type == 'AUTO':
+        file_type = _EXTENSION_TYPES.get(os.path.splitext(path)[1].lower())
+    if file_type not in _IMPORTERS:
+        return {"success": False, "error": f"Unsupported file type for {path}"}
+    if 'mtime_ns' in params:
+        # The MCP server already stat'ed the file
+        key = (path, params['mtime_ns'], params.get('size'), file_type)
+    else:
+        st = os.stat(path)
+        key = (path, st.st_mtime_ns, st.st_size, file_type)
+    
+    # reuse=False asks for another copy of a file imported before
+    names = _import_cache.get(key) if params.get('reuse', True) else None
+    if names and all(name in bpy.data.objects for name in names):
+        return {"success": True, "imported_objects": names, "cached": True}
+    
+    module, operator = _IMPORTERS[file_type]
+    before = set(bpy.data.objects.keys())
+    getattr(getattr(bpy.ops, module), operator)(filepath=path)
+    names = [name for name in bpy.data.objects.keys() if name not in before]
+    _import_cache[key] = names
+    return {"success": True, "imported_objects": names}
+
+
+def _load_scene(params):
+    bpy.ops.wm.open_mainfile(filepath=params.get('file_path'))
+    # Objects of the previous scene are gone; names may now be reused
+    _import_cache.clear()
+    return {"success": True, "message": f"Scene loaded from {params.get('file_path')}"}
+
+
+@lru_cache(maxsize=256)
+def _compile(code):
+    """Compile a snippet once; repeated snippets reuse the cached code object
+    
+    Plain expressions compile in "eval" mode so their value is returned as
+    before; statements compile in "exec" mode and report ``_result``.
+    """
+    try:
+        return compile(code, "<mcp>", "eval"), True
+    except SyntaxError:
+        return compile(code, "<mcp>", "exec"), False
+
+
+def _eval(params):
+    # Execute arbitrary Python code (use with caution)
+    code = params.get('code')
+    if code is None and params.get('path'):
+        # Large snippets arrive as a file the MCP server wrote and removes
+        with open(params['path'], encoding='utf-8') as f:
+            code = f.read()
+    compiled, is_expression = _compile(code)
+    namespace = {"bpy": bpy}
+    if is_expression:
+        result = eval(compiled, namespace)
+    else:
+        exec(compiled, namespace)
+        result = namespace.get("_result")
+    return {"success": True, "result": str(result)}
+
+
+@_cached(ttl=RESPONSE_CACHE_TTL)
+def _get_scene_info(params):
+    scene = bpy.context.scene
+    return {
+        "success": True,
+        "result": {
+            "name": scene.name,
+            "frame_start": scene.frame_start,
+            "frame_end": scene.frame_end,
+            "frame_current": scene.frame_current,
+            "object_count": len(scene.objects),
+            "objects": [obj.name for obj in scene.objects],
+        },
+    }
+
+
+def _packed(values):
+    """Little-endian bytes of a typed array"""
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values.tobytes()
+
+
+def _unpacked(typecode, data):
+    """Typed array from little-endian bytes, base64-encoded in JSON"""
+    if isinstance(data, str):
+        data = base64.b64decode(data)
+    values = array(typecode)
+    values.frombytes(data)
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values
+
+
+# Packed XYZ channel of set_keyframes_bulk / transform_objects -> property
+_XYZ_CHANNELS = (
+    ('location', 'location'),
+    ('rotation', 'rotation_euler'),
+    ('scale', 'scale'),
+)
+
+
+def _set_keyframes_bulk(params):
+    name = params.get('object_name')
+    obj = bpy.data.objects.get(name)
+    if obj is None:
+        return {"success": False, "error": f"Object not found: {name}"}
+    frames = array('f', _unpacked('i', params.get('frames', b'')))
+    count = len(frames)
+    channels = []
+    for key, data_path in _XYZ_CHANNELS:
+        if params.get(key) is None:
+            continue
+        values = _unpacked('f', params[key])
+        if len(values) != 3 * count:
+            return {"success": False, "error": f"{key} needs one XYZ value per frame"}
+        channels.append((key, data_path, values))
+    
+    anim = obj.animation_data or obj.animation_data_create()
+    if anim.action is None:
+        anim.action = bpy.data.actions.new(name=f"{obj.name}Action")
+    fcurves = anim.action.fcurves
+    for key, data_path, values in channels:
+        for index in range(3):
+            fcurve = (fcurves.find(data_path, index=index)
+                      or fcurves.new(data_path, index=index))
+            points = fcurve.keyframe_points
+            # One add() and one foreach_set() per curve instead of a
+            # keyframe_insert() per frame. Like keyframe_insert, a frame
+            # that already has a key gets its value replaced, not a
+            # second key
+            co = array('f', bytes(8 * len(points)))
+            points.foreach_get('co', co)
+            existing = {frame: i for i, frame in enumerate(co[0::2])}
+            added = {}
+            for frame, value in zip(frames, values[index::3]):
+                i = existing.get(frame)
+                if i is None:
+                    added[frame] = value
+                else:
+                    co[2 * i + 1] = value
+            for frame, value in added.items():
+                co.append(frame)
+                co.append(value)
+            if added:
+                points.add(len(added))
+            points.foreach_set('co', co)
+            fcurve.update()
+    keyed = ", ".join(key for key, _, _ in channels) or "nothing"
+    return {"success": True, "message": f"{count} keyframes set on {keyed}"}
+
+
+@_cached(ttl=RESPONSE_CACHE_TTL)
+def _get_mesh_info(params):
+    name = params.get('object_name')
+    obj = bpy.data.objects.get(name)
+    if obj is None or obj.type != 'MESH':
+        return {"success": False, "error": f"Mesh object not found: {name}"}
+    mesh = obj.data
+    info = {
+        "success": True,
+        "name": obj.name,
+        "vertex_count": len(mesh.vertices),
+        "edge_count": len(mesh.edges),
+        "face_count": len(mesh.polygons),
+        "material_count": len(mesh.materials),
+    }
+    if params.get('include_geometry'):
+        # foreach_get fills flat float32/int32 buffers without creating a
+        # Python object per vertex; they are sent packed (schema mesh_v1)
+        vertices = array('f', bytes(12 * len(mesh.vertices)))
+        mesh.vertices.foreach_get('co', vertices)
+        face_starts = array('i', bytes(4 * len(mesh.polygons)))
+        mesh.polygons.foreach_get('loop_start', face_starts)
+        face_sizes = array('i', bytes(4 * len(mesh.polygons)))
+        mesh.polygons.foreach_get('loop_total', face_sizes)
+        face_vertices = array('i', bytes(4 * len(mesh.loops)))
+        mesh.loops.foreach_get('vertex_index', face_vertices)
+        info.update({
+            "schema": "mesh_v1",
+            "vertices": _packed(vertices),
+            "face_starts": _packed(face_starts),
+            "face_sizes": _packed(face_sizes),
+            "face_vertices": _packed(face_vertices),
+        })
+    return info
+
+
+def _ping(params):
+    return {"success": True, "message": "pong"}
+
+
+# object_type values accepted by create_objects
+_PRIMITIVE_OPS = {
+    'CUBE': 'primitive_cube_add',
+    'SPHERE': 'primitive_uv_sphere_add',
+    'ICO_SPHERE': 'primitive_ico_sphere_add',
+    'CYLINDER': 'primitive_cylinder_add',
+    'CONE': 'primitive_cone_add',
+    'PLANE': 'primitive_plane_add',
+    'TORUS': 'primitive_torus_add',
+    'MONKEY': 'primitive_monkey_add',
+}
+
+
+def _batch_result(done, errors, key):
+    # Per-item failures are reported alongside the items that succeeded
+    return {"success": True, key: done, "errors": errors}
+
+
+def _add_primitive(object_type, location, name=None):
+    """Add a primitive mesh of a type listed in _PRIMITIVE_OPS and return it"""
+    getattr(bpy.ops.mesh, _PRIMITIVE_OPS[object_type])(location=location)
+    obj = bpy.context.active_object
+    if name:
+        obj.name = name
+    return obj
+
+
+def _create_objects(params):
+    created, errors = [], []
+    for spec in params.get('specs', []):
+        object_type = str(spec.get('object_type', 'CUBE')).upper()
+        if object_type not in _PRIMITIVE_OPS:
+            errors.append(f"Unknown object type: {object_type}")
+            continue
+        obj = _add_primitive(object_type, spec.get('location', (0, 0, 0)), spec.get('name'))
+        created.append(obj.name)
+    return _batch_result(created, errors, "created")
+
+
+# Composite operations: each runs what would otherwise take several
+# commands (and round trips) as one fixed bpy sequence
+
+def _add_and_join(params):
+    types = [str(params.get(key, 'CUBE')).upper() for key in ('a_type', 'b_type')]
+    for object_type in types:
+        if object_type not in _PRIMITIVE_OPS:
+            return {"success": False, "error": f"Unknown object type: {object_type}"}
+    objects = [
+        _add_primitive(object_type, params.get(key, (0, 0, 0)))
+        for object_type, key in zip(types, ('location_a', 'location_b'))
+    ]
+    bpy.ops.object.select_all(action='DESELECT')
+    for obj in objects:
+        obj.select_set(True)
+    bpy.context.view_layer.objects.active = objects[0]
+    bpy.ops.object.join()
+    joined = bpy.context.view_layer.objects.active
+    if params.get('joined_name'):
+        joined.name = params['joined_name']
+    return {"success": True, "name": joined.name}
+
+
+def _add_with_modifier(params):
+    object_type = str(params.get('object_type', 'CUBE')).upper()
+    if object_type not in _PRIMITIVE_OPS:
+        return {"success": False, "error": f"Unknown object type: {object_type}"}
+    obj = _add_primitive(object_type, params.get('location', (0, 0, 0)), params.get('name'))
+    modifier_type = params.get('modifier_type')
+    modifier = obj.modifiers.new(name=params.get('modifier_name') or modifier_type,
+                                 type=modifier_type)
+    for key, value in (params.get('settings') or {}).items():
+        setattr(modifier, key, value)
+    return {"success": True, "name": obj.name, "modifier": modifier.name}
+
+
+def _transform_objects(params):
+    if 'names' in params:
+        return _transform_objects_packed(params)
+    transformed, errors = [], []
+    for update in params.get('updates', []):
+        obj_name = update.get('object_name') or update.get('name')
+        obj = bpy.data.objects.get(obj_name) if obj_name else None
+        if obj is None:
+            errors.append(f"Object not found: {obj_name}")
+            continue
+        if 'location' in update:
+            obj.location = update['location']
+        if 'rotation' in update:
+            obj.rotation_euler = update['rotation']
+        if 'scale' in update:
+            obj.scale = update['scale']
+        transformed.append(obj_name)
+    # One depsgraph evaluation for the whole batch
+    bpy.context.view_layer.update()
+    return _batch_result(transformed, errors, "transformed")
+
+
+def _transform_objects_packed(params):
+    # Object names plus one packed XYZ float array per channel
+    names = params['names']
+    channels = []
+    for key, attr in _XYZ_CHANNELS:
+        if params.get(key) is None:
+            continue
+        values = _unpacked('f', params[key])
+        if len(values) != 3 * len(names):
+            return {"success": False, "error": f"{key} needs one XYZ value per object"}
+        channels.append((attr, values))
+    transformed, errors = [], []
+    for i, obj_name in enumerate(names):
+        obj = bpy.data.objects.get(obj_name) if obj_name else None
+        if obj is None:
+            errors.append(f"Object not found: {obj_name}")
+            continue
+        for attr, values in channels:
+            setattr(obj, attr, values[3 * i:3 * i + 3])
+        transformed.append(obj_name)
+    bpy.context.view_layer.update()
+    return _batch_result(transformed, errors, "transformed")
+
+
+def _delete_objects(params):
+    deleted, errors = [], []
+    for obj_name in params.get('names', []):
+        obj = bpy.data.objects.get(obj_name)
+        if obj is None:
+            errors.append(f"Object not found: {obj_name}")
+            continue
+        bpy.data.objects.remove(obj, do_unlink=True)
+        deleted.append(obj_name)
+    return _batch_result(deleted, errors, "deleted")
+
+
+def _batch(params):
+    # Run several commands in order and answer them with a single response
+    results = [_dispatch(command) for command in params.get('commands', [])]
+    return {"success": True, "results": results}
+
+
+# Map actions to bpy operations
+_ACTIONS = {
+    'add_cube': _add_cube,
+    'add_sphere': _add_sphere,
+    'add_cylinder': _add_cylinder,
+    'delete_object': _delete_object,
+    'move_object': _move_object,
+    'render': _render,
+    'render_scene': _render_scene,
+    'get_render_preview': _get_render_preview,
+    'get_viewport_screenshot': _get_viewport_screenshot,
+    'save_file': _save_file,
+    'import_file': _import_file,
+    'load_scene': _load_scene,
+    'eval': _eval,
+    'execute_code': _eval,
+    'get_scene_info': _get_scene_info,
+    'get_mesh_info': _get_mesh_info,
+    'set_keyframes_bulk': _set_keyframes_bulk,
+    'ping': _ping,
+    'create_objects': _create_objects,
+    'transform_objects': _transform_objects,
+    'delete_objects': _delete_objects,
+    'add_and_join': _add_and_join,
+    'add_with_modifier': _add_with_modifier,
+    'batch': _batch,
+}
+_ACTION_NAMES = {action.encode(): action for action in _ACTIONS}
+
+
+# Sends a progress frame to the client of the streaming command being run
+_progress_sink = None
+
+
+def _report_progress(done, total):
+    """Tell a streaming client how far the current command has got"""
+    if _progress_sink is not None:
+        _progress_sink({"type": "progress", "progress": done, "total": total})
+
+
+def _dispatch(command):
+    """Run a command's handler; must be called on Blender's main thread"""
+    global _scene_epoch, _progress_sink
     try:
         action = command.get('action')
-        params = command.get('params', {})
-        
-        # Map actions to bpy operations
-        if action == 'add_cube':
-            bpy.ops.mesh.primitive_cube_add(**params)
-            return {"success": True, "message": "Cube added"}
-            
-        elif action == 'add_sphere':
-            bpy.ops.mesh.primitive_uv_sphere_add(**params)
-            return {"success": True, "message": "Sphere added"}
-            
-        elif action == 'add_cylinder':
-            bpy.ops.mesh.primitive_cylinder_add(**params)
-            return {"success": True, "message": "Cylinder added"}
-            
-        elif action == 'delete_object':
-            obj_name = params.get('name')
-            if obj_name and obj_name in bpy.data.objects:
-                bpy.data.objects.remove(bpy.data.objects[obj_name])
-                return {"success": True, "message": f"Object '{obj_name}' deleted"}
-            return {"success": False, "error": "Object not found"}
-            
-        elif action == 'move_object':
-            obj_name = params.get('name')
-            location = params.get('location', [0, 0, 0])
-            if obj_name and obj_name in bpy.data.objects:
-                bpy.data.objects[obj_name].location = location
-                return {"success": True, "message": f"Object '{obj_name}' moved"}
-            return {"success": False, "error": "Object not found"}
-            
-        elif action == 'render':
-            bpy.ops.render.render(write_still=True)
-            return {"success": True, "message": "Render complete"}
-            
-        elif action == 'save_file':
-            filepath = params.get('filepath')
-            bpy.ops.wm.save_as_mainfile(filepath=filepath)
-            return {"success": True, "message": f"File saved to {filepath}"}
-            
-        elif action == 'eval':
-            # Execute arbitrary Python code (use with caution)
-            code = params.get('code')
-            result = eval(code)
-            return {"success": True, "result": str(result)}
-            
-        else:
+        handler = _ACTIONS.get(action)
+        if handler is None:
             return {"success": False, "error": f"Unknown action: {action}"}
+        if not hasattr(handler, 'cache_ttl'):
+            # Anything that is not a read-only query may change the scene
+            _scene_epoch += 1
+        _progress_sink = command.get('progress')
+        return handler(command.get('params', {}))
             
     except Exception as e:
         return {"success": False, "error": str(e)}
+    finally:
+        _progress_sink = None
+
+
+def _pump_main_thread():
+    """Timer callback: drain queued commands on Blender's main thread"""
+    while True:
+        try:
+            command, claim, done, out = _main_thread_queue.get_nowait()
+        except queue.Empty:
+            break
+        if not claim.acquire(blocking=False):
+            continue  # The worker gave up waiting
+        try:
+            out.append(_dispatch(command))
+        finally:
+            done.set()
+    return MAIN_THREAD_POLL_INTERVAL
+
+
+def execute_command(command):
+    """Execute bpy command from MCP server
+    
+    Called from worker threads; blocks until the main thread has run the
+    command and returns its result. If the main thread does not pick the
+    command up within MAIN_THREAD_TIMEOUT, the command is dropped and an
+    error returned; once it has started it runs to completion.
+    """
+    if threading.current_thread() is threading.main_thread():
+        return _dispatch(command)
+    
+    claim = threading.Lock()
+    done = threading.Event()
+    out = []
+    _main_thread_queue.put((command, claim, done, out))
+    if not done.wait(MAIN_THREAD_TIMEOUT) and claim.acquire(blocking=False):
+        logger.warning("Main thread did not run %s in time", command.get('action'))
+        return {
+            "success": False,
+            "error": f"Blender's main thread did not respond within {MAIN_THREAD_TIMEOUT:g} s"
+        }
+    done.wait()
+    return out[0]
 
 
 # Registration
@@ -258,16 +1456,26 @@ classes = (
 def register():
     for cls in classes:
         bpy.utils.register_class(cls)
-    print("[MCP Bridge] Addon registered")
+    bpy.app.timers.register(_pump_main_thread, persistent=True)
+    for handlers in (bpy.app.handlers.depsgraph_update_post, bpy.app.handlers.load_post):
+        if _bump_scene_revision not in handlers:
+            handlers.append(_bump_scene_revision)
+    _log_listener.start()
+    logger.info("Addon registered")
 
 
 def unregister():
-    global server_running
-    server_running = False
+    _stop_server()
+    if bpy.app.timers.is_registered(_pump_main_thread):
+        bpy.app.timers.unregister(_pump_main_thread)
+    for handlers in (bpy.app.handlers.depsgraph_update_post, bpy.app.handlers.load_post):
+        if _bump_scene_revision in handlers:
+            handlers.remove(_bump_scene_revision)
     
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
-    print("[MCP Bridge] Addon unregistered")
+    logger.info("Addon unregistered")
+    _log_listener.stop()
 
 
 if __name__ == "__main__":
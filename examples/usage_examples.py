@@ -63,14 +63,18 @@ async def example_object_operations():
             ("CONE", "Mountain", [0, 3, 0])
         ]
         
-        for obj_type, name, location in objects:
-            print(f"Creating {obj_type} object '{name}'...")
-            result = await client.call_tool("create_object", {
+        # Independent creations are issued concurrently
+        print(f"Creating {len(objects)} objects...")
+        results = await asyncio.gather(*(
+            client.call_tool("create_object", {
                 "object_type": obj_type,
                 "name": name,
                 "location": location
             })
-            print(f"Result: {result.text}")
+            for obj_type, name, location in objects
+        ))
+        for (obj_type, name, _), result in zip(objects, results):
+            print(f"{obj_type} '{name}': {result.text}")
         
         # Transform objects
         print("\nTransforming objects...")
@@ -128,10 +132,13 @@ async def example_material_management():
             }
         ]
         
-        for material in materials:
-            print(f"Creating material '{material['name']}'...")
-            result = await client.call_tool("create_material", material)
-            print(f"Result: {result.text}")
+        print(f"Creating {len(materials)} materials...")
+        results = await asyncio.gather(*(
+            client.call_tool("create_material", material)
+            for material in materials
+        ))
+        for material, result in zip(materials, results):
+            print(f"'{material['name']}': {result.text}")
         
         # Assign materials to objects
         assignments = [
@@ -140,12 +147,16 @@ async def example_material_management():
             ("Mountain", "PlasticMaterial")
         ]
         
+        # Assignment waits for the materials above to exist
         print("\nAssigning materials to objects...")
-        for obj_name, material_name in assignments:
-            result = await client.call_tool("assign_material", {
+        results = await asyncio.gather(*(
+            client.call_tool("assign_material", {
                 "object_name": obj_name,
                 "material_name": material_name
             })
+            for obj_name, material_name in assignments
+        ))
+        for result in results:
             print(f"Result: {result.text}")
         
         # List all materials
@@ -425,12 +436,14 @@ async def example_complete_workflow():
             ("CONE", "Pyramid", [-5, -3, 0])
         ]
         
-        for obj_type, name, location in objects:
-            await client.call_tool("create_object", {
+        await asyncio.gather(*(
+            client.call_tool("create_object", {
                 "object_type": obj_type,
                 "name": name,
                 "location": location
             })
+            for obj_type, name, location in objects
+        ))
         
         # Step 4: Create materials
         print("\n4. Creating materials...")
@@ -462,8 +475,10 @@ async def example_complete_workflow():
             }
         ]
         
-        for material in materials:
-            await client.call_tool("create_material", material)
+        await asyncio.gather(*(
+            client.call_tool("create_material", material)
+            for material in materials
+        ))
         
         # Step 5: Assign materials
         print("\n5. Assigning materials...")
@@ -474,11 +489,14 @@ async def example_complete_workflow():
             ("Pyramid", "PyramidMat")
         ]
         
-        for obj_name, mat_name in assignments:
-            await client.call_tool("assign_material", {
+        # Objects and materials exist from the steps above
+        await asyncio.gather(*(
+            client.call_tool("assign_material", {
                 "object_name": obj_name,
                 "material_name": mat_name
             })
+            for obj_name, mat_name in assignments
+        ))
         
         # Step 6: Add modifiers
         print("\n6. Adding mesh modifiers...")
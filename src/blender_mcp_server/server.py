@@ -7,22 +7,59 @@ animation, rendering, file I/O, camera and lighting systems.
 """
 
 import asyncio
+import base64
 import json
 import logging
 import os
+import queue
 import socket
+import struct
+import sys
 import tempfile
+import threading
 import uuid
-from contextlib import asynccontextmanager
-from dataclasses import dataclass, asdict
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass, asdict, field
+from enum import Enum
+from functools import lru_cache, wraps
 from pathlib import Path
-from typing import Any, Dict, List, Optional, AsyncIterator, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, AsyncIterator, Tuple, Union
 
 import bpy
 from fastmcp import FastMCP, Context, Image
 from pydantic import BaseModel, Field
 import time
 
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Large responses from Blender arrive zstd-compressed when both sides
+# have zstandard installed
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+# Render previews from a Blender on the same machine can be handed over
+# in POSIX shared memory instead of as base64 in the response
+try:
+    from multiprocessing import shared_memory
+    SHARED_MEMORY_AVAILABLE = os.name == "posix"
+except ImportError:
+    SHARED_MEMORY_AVAILABLE = False
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -34,9 +71,275 @@ logger = logging.getLogger("BlenderMCPServer")
 DEFAULT_HOST = "localhost"
 DEFAULT_PORT = 9876
 BLENDER_SOCKET_TIMEOUT = 30.0
+BLENDER_IDLE_PING_INTERVAL = 60.0
+BLENDER_SOCK_RCVBUF = int(os.getenv("BLENDER_SOCK_RCVBUF", 1 << 20))
+BLENDER_SOCK_SNDBUF = int(os.getenv("BLENDER_SOCK_SNDBUF", 1 << 20))
+
+# Connection target, resolved once per process
+BLENDER_HOST = os.getenv("BLENDER_HOST", DEFAULT_HOST)
+BLENDER_PORT = int(os.getenv("BLENDER_PORT", DEFAULT_PORT))
+BLENDER_POOL_SIZE = int(os.getenv("BLENDER_POOL_SIZE", 4))
+
+# A Blender addon on this machine also listens on a Unix domain socket;
+# connections to a local host use it when present and fall back to TCP
+LOCAL_HOSTS = frozenset({"localhost", "127.0.0.1", "::1"})
+HAS_AF_UNIX = hasattr(socket, "AF_UNIX") and hasattr(os, "getuid")
+BLENDER_SOCK_PATH = os.getenv("BLENDER_SOCK_PATH") or (
+    os.path.join(tempfile.gettempdir(), f"blender-mcp-{os.getuid()}.sock")
+    if HAS_AF_UNIX else None
+)
+_FRAME_HEADER = struct.Struct(">I")
+FRAME_HEADER_SIZE = _FRAME_HEADER.size
+SEND_BUFFER_SIZE = 64 * 1024
+# BLENDER_SHM=0 turns shared memory off, e.g. when "localhost" is a port
+# forwarded into a container that does not share /dev/shm
+USE_SHARED_MEMORY = (SHARED_MEMORY_AVAILABLE and BLENDER_HOST in LOCAL_HOSTS
+                     and os.getenv("BLENDER_SHM", "1") != "0")
+# Code this long goes to a local Blender as a temp file path, keeping a
+# big frame off the socket; BLENDER_SHM=0 turns this off too
+CODE_FILE_MIN_SIZE = 64 * 1024
+USE_CODE_FILES = BLENDER_HOST in LOCAL_HOSTS and os.getenv("BLENDER_SHM", "1") != "0"
+
+# Same limit the addon enforces; a larger length means the stream is out of sync
+MAX_FRAME_SIZE = 256 * 1024 * 1024
+# Set in a response header when the body is zstd-compressed
+COMPRESSED_FLAG = 0x80000000
+HAS_SENDMSG = hasattr(socket.socket, "sendmsg")
+HAS_TCP_QUICKACK = hasattr(socket, "TCP_QUICKACK")  # Linux only
+# TCP keepalive probes after 15 s idle, every 5 s, giving up after 3; only
+# the options this platform has are set
+_KEEPALIVE_OPTIONS = tuple(
+    (getattr(socket, name), value)
+    for name, value in (("TCP_KEEPIDLE", 15), ("TCP_KEEPINTVL", 5), ("TCP_KEEPCNT", 3))
+    if hasattr(socket, name)
+)
+
+# Wire codec for the Blender socket. JSON by default, since Blender's bundled
+# Python has no msgspec; BLENDER_WIRE=msgpack opts in when the addon has it
+BLENDER_WIRE = os.getenv("BLENDER_WIRE", "json").lower()
+if BLENDER_WIRE == "msgpack" and not MSGSPEC_AVAILABLE:
+    logger.warning("BLENDER_WIRE=msgpack requires msgspec; falling back to JSON")
+    BLENDER_WIRE = "json"
+
+if BLENDER_WIRE == "msgpack":
+    _ENC = msgspec.msgpack.Encoder()
+    _DEC = msgspec.msgpack.Decoder()
+
+    def _encode_message(message: Dict[str, Any]) -> bytes:
+        return _ENC.encode(message)
+
+    _PARAMS_KEY = _ENC.encode("params")
+    _ID_KEY = _ENC.encode("id")
+    _TIMESTAMP_KEY = _ENC.encode("timestamp")
+
+    # Asks Blender to compress large responses
+    _COMPRESS_ENTRY = _ENC.encode("compress") + _ENC.encode("zstd") if ZSTD_AVAILABLE else b""
+
+    @lru_cache(maxsize=512)
+    def _command_prefix(command_type: str, correlated: bool) -> bytes:
+        """Constant msgpack bytes that start every frame of a command type"""
+        # Fixmap of type and params, plus id and timestamp when correlated
+        # and the compress entry when zstandard is installed
+        entries = 2 + 2 * correlated + ZSTD_AVAILABLE
+        return (bytes([0x80 | entries]) + _COMPRESS_ENTRY
+                + _ENC.encode("type") + _ENC.encode(command_type) + _PARAMS_KEY)
+
+    def _encode_command(command_type: str, params: Dict[str, Any], command_id: Optional[int],
+                        buf: bytearray) -> Tuple[bytearray]:
+        """Encode a command frame into buf; only params (and id/timestamp) vary"""
+        buf[FRAME_HEADER_SIZE:] = _command_prefix(command_type, command_id is not None)
+        _ENC.encode_into(params, buf, -1)
+        if command_id is not None:
+            buf += _ID_KEY
+            _ENC.encode_into(command_id, buf, -1)
+            buf += _TIMESTAMP_KEY
+            _ENC.encode_into(time.monotonic_ns(), buf, -1)
+        _FRAME_HEADER.pack_into(buf, 0, len(buf) - FRAME_HEADER_SIZE)
+        return (buf,)
+
+    def _decode_message(data: bytes) -> Dict[str, Any]:
+        # An addon without msgspec answers msgpack requests with a JSON error
+        if data[:1] == b"{":
+            return json.loads(bytes(data))
+        return _DEC.decode(data)
+else:
+    # Codec functions are bound once here instead of branching per call
+    if ORJSON_AVAILABLE:
+        _encode_message = orjson.dumps
+        _decode_message = orjson.loads
+    else:
+        _json_encode = json.JSONEncoder().encode
+        _json_decode = json.JSONDecoder().decode
+
+        def _encode_message(message: Dict[str, Any]) -> bytes:
+            return _json_encode(message).encode('utf-8')
+
+        def _decode_message(data: bytes) -> Dict[str, Any]:
+            # The stdlib parser does not accept bytes-like memoryviews
+            return _json_decode(bytes(data).decode('utf-8'))
+
+    # Asks Blender to compress large responses
+    _COMPRESS_ENTRY = b'"compress":"zstd",' if ZSTD_AVAILABLE else b""
+
+    @lru_cache(maxsize=512)
+    def _command_prefix(command_type: str) -> bytes:
+        """Constant JSON text that starts every frame of a command type"""
+        return b'{' + _COMPRESS_ENTRY + b'"type":' + _encode_message(command_type) + b',"params":'
+
+    def _encode_command(command_type: str, params: Dict[str, Any], command_id: Optional[int],
+                        buf: bytearray) -> Tuple[bytearray]:
+        """Encode a command frame into buf; only params (and id/timestamp) vary
+        
+        Like the msgpack frames, no command dict is built around params.
+        """
+        buf[FRAME_HEADER_SIZE:] = _command_prefix(command_type)
+        buf += _encode_message(params)
+        if command_id is not None:
+            buf += b',"id":%d,"timestamp":%d}' % (command_id, time.monotonic_ns())
+        else:
+            buf += b'}'
+        _FRAME_HEADER.pack_into(buf, 0, len(buf) - FRAME_HEADER_SIZE)
+        return (buf,)
+
 
-# Pydantic models for type safety
-class SceneInfo(BaseModel):
+def _send_frame(sock: socket.socket, buffers: Tuple[Union[bytes, bytearray], ...]) -> None:
+    """Send the buffers of one frame with a single vectored write
+    
+    Platforms without sendmsg (Windows) send them joined instead.
+    """
+    if not HAS_SENDMSG:
+        sock.sendall(buffers[0] if len(buffers) == 1 else b"".join(buffers))
+        return
+    sent = sock.sendmsg(buffers)
+    # sendmsg may write only part of the frame; finish it with sendall
+    if sent < sum(map(len, buffers)):
+        sock.sendall(b"".join(buffers)[sent:])
+
+def _unpack_array(typecode: str, data: Union[bytes, str]) -> array:
+    """Typed array from little-endian bytes, base64-encoded on the JSON wire"""
+    if isinstance(data, str):
+        data = base64.b64decode(data)
+    values = array(typecode)
+    values.frombytes(data)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+def _pack_array(typecode: str, values: List[Any]) -> Union[bytes, str]:
+    """Little-endian bytes of values; base64 text on the JSON wire"""
+    packed = array(typecode, values)
+    if sys.byteorder == "big":
+        packed.byteswap()
+    data = packed.tobytes()
+    if BLENDER_WIRE == "msgpack":
+        return data
+    return base64.b64encode(data).decode("ascii")
+
+def _keyframes_payload(object_name: str, frames: List[int],
+                       **channels: Optional[List[List[float]]]) -> Dict[str, Any]:
+    """set_keyframes_bulk params: frames and XYZ channels as typed arrays"""
+    payload = {"object_name": object_name, "frames": _pack_array("i", frames)}
+    for key, values in channels.items():
+        if values is None:
+            continue
+        if len(values) != len(frames) or any(len(xyz) != 3 for xyz in values):
+            raise ValueError(f"{key} needs one XYZ triple per frame")
+        payload[key] = _pack_array("f", [v for xyz in values for v in xyz])
+    return payload
+
+def _transforms_payload(updates: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """transform_objects params: XYZ channels as typed arrays when they fit
+    
+    Packing needs every update to set the same channels, each as a triple;
+    anything else goes as the plain list of updates.
+    """
+    channels = [key for key in ("location", "rotation", "scale") if updates and key in updates[0]]
+    if not channels or any(
+        [key for key in ("location", "rotation", "scale") if key in update] != channels
+        or any(len(update[key] or ()) != 3 for key in channels)
+        for update in updates
+    ):
+        return {"updates": updates}
+    payload = {"names": [update.get("object_name") or update.get("name") for update in updates]}
+    for key in channels:
+        payload[key] = _pack_array("f", [v for update in updates for v in update[key]])
+    return payload
+
+def _take_shared_memory(name: str, size: int) -> bytes:
+    """Copy out and free a shared memory block filled by the addon"""
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        return bytes(shm.buf[:size])
+    finally:
+        shm.close()
+        shm.unlink()
+
+def _image_data(result: Dict[str, Any]) -> bytes:
+    """PNG bytes of a preview or screenshot result, however they travelled"""
+    if "error" in result:
+        raise Exception(result["error"])
+    if "shm_name" in result:
+        return _take_shared_memory(result["shm_name"], result["size"])
+    data = result.get("image_data")
+    if data is None:
+        raise Exception("Blender returned no image")
+    # msgpack carries the PNG as raw bytes, JSON as base64 text
+    return data if isinstance(data, bytes) else base64.b64decode(data)
+
+_PACKED_MESH_FIELDS = ("schema", "vertices", "face_starts", "face_sizes", "face_vertices")
+
+def _expand_mesh(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Turn packed mesh_v1 geometry into vertex and face lists
+    
+    Returns a new dict; results may be shared through the response cache.
+    """
+    if result.get("schema") != "mesh_v1":
+        return result
+    coords = _unpack_array("f", result["vertices"]).tolist()
+    indices = _unpack_array("i", result["face_vertices"]).tolist()
+    starts = _unpack_array("i", result["face_starts"])
+    sizes = _unpack_array("i", result["face_sizes"])
+    mesh = {key: value for key, value in result.items() if key not in _PACKED_MESH_FIELDS}
+    mesh["vertices"] = [coords[i:i + 3] for i in range(0, len(coords), 3)]
+    mesh["faces"] = [indices[start:start + size] for start, size in zip(starts, sizes)]
+    return mesh
+
+# Getter tools return compact JSON unless BLENDER_PRETTY_JSON=1; models
+# read it, and to them the indentation is only extra tokens
+PRETTY_JSON = os.getenv("BLENDER_PRETTY_JSON", "0") == "1"
+if ORJSON_AVAILABLE:
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if PRETTY_JSON else 0)
+
+# Tool messages name at most this many objects; the rest are counted
+MAX_LISTED_NAMES = 8
+
+def _names(names: List[str]) -> str:
+    """Names joined for a tool message, cut short when there are many"""
+    if len(names) <= MAX_LISTED_NAMES:
+        return ", ".join(names)
+    return f"{', '.join(names[:MAX_LISTED_NAMES])} and {len(names) - MAX_LISTED_NAMES} more"
+
+def _to_json(data: Any) -> str:
+    """Serialize a tool result as JSON text, using orjson when installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=_ORJSON_OPTIONS).decode('utf-8')
+    if PRETTY_JSON:
+        return json.dumps(data, indent=2)
+    return json.dumps(data, separators=(",", ":"))
+
+# Response models. With msgspec installed they are Structs, which build
+# without running validators; otherwise they fall back to Pydantic.
+if MSGSPEC_AVAILABLE:
+    _InfoModel = msgspec.Struct
+    _MODEL_OPTIONS = {"frozen": True, "gc": False}
+else:
+    _InfoModel = BaseModel
+    _MODEL_OPTIONS = {"frozen": True}
+
+# XYZ triples decode into fixed-size tuples instead of lists
+Vector3 = Tuple[float, float, float]
+
+class SceneInfo(_InfoModel, **_MODEL_OPTIONS):
     """Model for scene information"""
     name: str
     frame_start: int
@@ -48,13 +351,13 @@ class SceneInfo(BaseModel):
     scene_units: Dict[str, Any]
     render_settings: Dict[str, Any]
 
-class ObjectInfo(BaseModel):
+class ObjectInfo(_InfoModel, **_MODEL_OPTIONS):
     """Model for object information"""
     name: str
     type: str
-    location: List[float]
-    rotation: List[float]
-    scale: List[float]
+    location: Vector3
+    rotation: Vector3
+    scale: Vector3
     visible: bool
     material_slots: List[str]
     parent: Optional[str] = None
@@ -62,7 +365,7 @@ class ObjectInfo(BaseModel):
     mesh_info: Optional[Dict[str, Any]] = None
     animation_data: Optional[Dict[str, Any]] = None
 
-class MaterialInfo(BaseModel):
+class MaterialInfo(_InfoModel, **_MODEL_OPTIONS):
     """Model for material information"""
     name: str
     type: str
@@ -71,163 +374,687 @@ class MaterialInfo(BaseModel):
     viewport_color: List[float]
     material_output: str
 
-class CameraInfo(BaseModel):
+class CameraInfo(_InfoModel, **_MODEL_OPTIONS):
     """Model for camera information"""
     name: str
-    location: List[float]
-    rotation: List[float]
+    location: Vector3
+    rotation: Vector3
     fov: float
     lens: float
     clip_start: float
     clip_end: float
     active: bool
 
-class LightInfo(BaseModel):
+class LightInfo(_InfoModel, **_MODEL_OPTIONS):
     """Model for light information"""
     name: str
     type: str
-    location: List[float]
-    rotation: List[float]
+    location: Vector3
+    rotation: Vector3
     energy: float
     color: List[float]
     cast_shadows: bool
 
+# Option values accepted by the mesh and file tools. User strings are
+# matched case-insensitively against lookup tables built once here, so
+# a typo fails in the tool instead of costing a round trip to Blender.
+class MeshOperation(str, Enum):
+    SUBDIVIDE = "SUBDIVIDE"
+    BEVEL = "BEVEL"
+    EXTRUDE = "EXTRUDE"
+    INSET = "INSET"
+    SMOOTH = "SMOOTH"
+    TRIANGULATE = "TRIANGULATE"
+    MERGE = "MERGE"
+    DISSOLVE = "DISSOLVE"
+    FILL = "FILL"
+    BRIDGE = "BRIDGE"
+    FLIP_NORMALS = "FLIP_NORMALS"
+    RECALCULATE_NORMALS = "RECALCULATE_NORMALS"
+
+class ModifierType(str, Enum):
+    ARRAY = "ARRAY"
+    BEVEL = "BEVEL"
+    BOOLEAN = "BOOLEAN"
+    BUILD = "BUILD"
+    CAST = "CAST"
+    CURVE = "CURVE"
+    DECIMATE = "DECIMATE"
+    DISPLACE = "DISPLACE"
+    EDGE_SPLIT = "EDGE_SPLIT"
+    LATTICE = "LATTICE"
+    MASK = "MASK"
+    MIRROR = "MIRROR"
+    MULTIRES = "MULTIRES"
+    NODES = "NODES"
+    REMESH = "REMESH"
+    SCREW = "SCREW"
+    SHRINKWRAP = "SHRINKWRAP"
+    SIMPLE_DEFORM = "SIMPLE_DEFORM"
+    SKIN = "SKIN"
+    SMOOTH = "SMOOTH"
+    SOLIDIFY = "SOLIDIFY"
+    SUBSURF = "SUBSURF"
+    TRIANGULATE = "TRIANGULATE"
+    WARP = "WARP"
+    WAVE = "WAVE"
+    WELD = "WELD"
+    WIREFRAME = "WIREFRAME"
+
+class RemeshMode(str, Enum):
+    VOXEL = "VOXEL"
+    BLOCKS = "BLOCKS"
+    SMOOTH = "SMOOTH"
+    SHARP = "SHARP"
+
+class FileType(str, Enum):
+    AUTO = "AUTO"  # import only: picked from the file extension
+    OBJ = "OBJ"
+    FBX = "FBX"
+    GLTF = "GLTF"
+    STL = "STL"
+    PLY = "PLY"
+    ABC = "ABC"
+    USD = "USD"
+    X3D = "X3D"
+    DAE = "DAE"
+
+def _lookup_table(enum: type) -> Dict[str, Enum]:
+    """Canonical and lower-case names of an enum's members"""
+    return {name: member for member in enum for name in (member.value, member.value.lower())}
+
+_MESH_OPERATIONS = _lookup_table(MeshOperation)
+_MODIFIER_TYPES = _lookup_table(ModifierType)
+_REMESH_MODES = _lookup_table(RemeshMode)
+_FILE_TYPES = _lookup_table(FileType)
+
+def _upper_table(*names: str) -> Dict[str, str]:
+    """Upper-case names keyed by themselves and their lower case"""
+    return {spelling: name for name in names for spelling in (name, name.lower())}
+
+# Names the addon knows; anything else is still passed on, upper-cased
+_OBJECT_TYPES = _upper_table("CUBE", "SPHERE", "ICO_SPHERE", "CYLINDER", "CONE",
+                             "PLANE", "TORUS", "MONKEY")
+_LIGHTING_TYPES = _upper_table("THREE_POINT", "NATURAL", "STUDIO", "SUNSET")
+_LIGHT_TYPES = _upper_table("SUN", "SPOT", "POINT", "AREA")
+_ANIMATION_TYPES = _upper_table("LOCATION", "ROTATION", "SCALE", "ALL")
+
+def _upper(table: Dict[str, str], value: str) -> str:
+    """value upper-cased; the usual spellings come from table without a new string"""
+    return table.get(value) or value.upper()
+
+def _option(table: Dict[str, Enum], value: str, kind: str) -> str:
+    """Canonical wire value for a user-supplied option name"""
+    member = table.get(value) or table.get(value.lower())
+    if member is None:
+        choices = ", ".join(sorted({m.value for m in table.values()}))
+        raise ValueError(f"unknown {kind} '{value}' (expected one of: {choices})")
+    return member.value
+
+class BlenderCommandError(Exception):
+    """Blender ran a command and reported an error; the socket is still usable"""
+
 @dataclass
 class BlenderConnection:
     """Handles connection to Blender addon via socket"""
     host: str
     port: int
     sock: Optional[socket.socket] = None
+    last_used: float = 0.0
+    timeout: float = BLENDER_SOCKET_TIMEOUT
+    _send_buf: bytearray = field(default_factory=lambda: bytearray(SEND_BUFFER_SIZE), repr=False)
+    _recv_buf: bytearray = field(default_factory=lambda: bytearray(SEND_BUFFER_SIZE), repr=False)
+    # zstd contexts are not thread-safe; a connection is used by one thread at a time
+    _zstd: Any = field(
+        default_factory=lambda: zstandard.ZstdDecompressor() if ZSTD_AVAILABLE else None,
+        repr=False
+    )
+    _seq: int = 0
+    # Set once Blender advertises correlation support; until then frames
+    # carry no id/timestamp, since one request is in flight per socket
+    needs_id: bool = False
     
     def connect(self) -> bool:
         """Establish connection to Blender addon"""
         if self.sock:
             return True
+        if self._connect_unix():
+            return True
             
         try:
             self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.sock.settimeout(BLENDER_SOCKET_TIMEOUT)
+            self.sock.settimeout(self.timeout)
+            # Buffer sizes are set before connect so the TCP window
+            # negotiation can use them
+            self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, BLENDER_SOCK_RCVBUF)
+            self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, BLENDER_SOCK_SNDBUF)
             self.sock.connect((self.host, self.port))
-            logger.info(f"Connected to Blender at {self.host}:{self.port}")
+            # Small request/response frames must not wait on Nagle
+            self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            for option, value in _KEEPALIVE_OPTIONS:
+                self.sock.setsockopt(socket.IPPROTO_TCP, option, value)
+            if HAS_TCP_QUICKACK and self.host in LOCAL_HOSTS:
+                # On loopback there is no congestion to save ACKs for
+                self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+            logger.info("Connected to Blender at %s:%s", self.host, self.port)
             return True
         except Exception as e:
-            logger.error(f"Failed to connect to Blender: {str(e)}")
+            logger.error("Failed to connect to Blender: %s", e)
             self.sock = None
             return False
+
+    def _connect_unix(self) -> bool:
+        """Connect over the local Unix domain socket if Blender serves one"""
+        if not (HAS_AF_UNIX and self.host in LOCAL_HOSTS
+                and BLENDER_SOCK_PATH and os.path.exists(BLENDER_SOCK_PATH)):
+            return False
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.settimeout(self.timeout)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, BLENDER_SOCK_RCVBUF)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, BLENDER_SOCK_SNDBUF)
+            sock.connect(BLENDER_SOCK_PATH)
+        except OSError as e:
+            logger.debug("Unix socket %s unavailable, using TCP: %s", BLENDER_SOCK_PATH, e)
+            sock.close()
+            return False
+        self.sock = sock
+        logger.info("Connected to Blender at %s", BLENDER_SOCK_PATH)
+        return True
     
     def disconnect(self):
         """Close connection to Blender addon"""
-        if self.sock:
-            try:
-                self.sock.close()
-            except Exception as e:
-                logger.error(f"Error disconnecting from Blender: {str(e)}")
-            finally:
-                self.sock = None
-
-    def send_command(self, command_type: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
-        """Send command to Blender and get response"""
+        # socket.close() does not raise for an open socket, so no guard
+        sock, self.sock = self.sock, None
+        if sock is not None:
+            sock.close()
+
+    def send_command(self, command_type: str, params: Dict[str, Any] = None,
+                     on_progress: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """Send command to Blender and get response
+        
+        With on_progress, the command asks Blender to stream progress
+        frames ahead of its response and each one is passed to on_progress.
+        The socket timeout then applies per frame rather than to the whole
+        command, so a long render keeps running while it reports progress.
+        """
         if not self.sock and not self.connect():
             raise ConnectionError("Not connected to Blender")
         
-        command = {
-            "type": command_type,
-            "params": params or {},
-            "id": str(uuid.uuid4()),
-            "timestamp": time.time()
-        }
+        # Ids only need to be unique per connection
+        command_id = None
+        if self.needs_id:
+            self._seq += 1
+            command_id = self._seq
+        params = params or {}
+        if on_progress is not None:
+            params = {**params, "stream": True}
         
         try:
-            # Send command
-            message = json.dumps(command)
-            self.sock.sendall(message.encode('utf-8'))
-            
-            # Receive response
-            response_data = self._receive_response()
-            response = json.loads(response_data.decode('utf-8'))
+            frame = _encode_command(command_type, params, command_id, self._send_buf)
+            try:
+                _send_frame(self.sock, frame)
+            except (BrokenPipeError, ConnectionResetError) as e:
+                # Blender closed a cached socket before reading the frame,
+                # so the command never ran and is safe to resend. Failures
+                # after the frame went out are not retried: the command may
+                # already have run, and resending could run it twice
+                logger.warning("Connection to Blender dropped (%s), reconnecting", e)
+                self.disconnect()
+                if not self.connect():
+                    raise
+                _send_frame(self.sock, frame)
+            response = self._read_reply(on_progress)
             
+            self.last_used = time.monotonic()
+            if response.get("correlation"):
+                self.needs_id = True
             if response.get("status") == "error":
-                raise Exception(response.get("message", "Unknown error from Blender"))
+                raise BlenderCommandError(
+                    "Communication error with Blender: "
+                    f"{response.get('message', 'Unknown error from Blender')}"
+                )
             
             return response.get("result", {})
         
+        # Not logged here: the tool's handler logs what it is finally raised
+        # as, with the traceback, once
         except socket.timeout:
-            logger.error("Socket timeout waiting for Blender response")
-            self.sock = None
+            self.disconnect()
             raise Exception("Timeout waiting for Blender response")
         except (ConnectionError, BrokenPipeError, ConnectionResetError) as e:
-            logger.error(f"Socket connection error: {str(e)}")
-            self.sock = None
-            raise Exception(f"Connection to Blender lost: {str(e)}")
+            self.disconnect()
+            raise Exception(f"Connection to Blender lost: {e}")
+        except BlenderCommandError:
+            raise
         except Exception as e:
-            logger.error(f"Error communicating with Blender: {str(e)}")
-            self.sock = None
-            raise Exception(f"Communication error with Blender: {str(e)}")
-
-    def _receive_response(self, buffer_size: int = 8192) -> bytes:
-        """Receive complete response from Blender"""
-        chunks = []
-        self.sock.settimeout(BLENDER_SOCKET_TIMEOUT)
+            self.disconnect()
+            raise Exception(f"Communication error with Blender: {e}")
+
+    def send_batch(self, commands: List[Tuple[str, Optional[Dict[str, Any]]]]) -> List[Dict[str, Any]]:
+        """Send several (command_type, params) pairs in one round trip
+        
+        Blender runs them in order; the results come back in the same order.
+        """
+        result = self.send_command("batch", {"commands": [
+            {"action": command_type, "params": params or {}}
+            for command_type, params in commands
+        ]})
+        return result.get("results", [])
+
+    def _read_reply(self, on_progress: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """Decode the response frame to the command just sent"""
+        if on_progress is None:
+            with memoryview(self._receive_response()) as frame:
+                return _decode_message(frame)
         
         while True:
+            with memoryview(self._receive_response(exact=True)) as frame:
+                message = _decode_message(frame)
+            if message.get("type") != "progress":
+                return message
+            on_progress(message)
+
+    def _receive_response(self, exact: bool = False) -> Union[bytes, bytearray, memoryview]:
+        """Receive one length-prefixed response frame from Blender
+        
+        Only one request is in flight per socket, so everything that
+        arrives belongs to this frame: the first recv reads the header
+        together with as much of the body as fits in the connection's
+        receive buffer, and small replies take a single syscall.
+        Frames too large for that buffer (big scenes) get a one-off
+        buffer that is dropped as soon as it is decoded, so it is never
+        held alongside the formatted tool output. Compressed frames are
+        returned decompressed.
+        
+        While progress frames stream in, more than one frame can be waiting
+        on the socket; exact reads stop at the end of this one.
+        """
+        self.sock.settimeout(self.timeout)
+        view = memoryview(self._recv_buf)
+        received = 0
+        limit = FRAME_HEADER_SIZE if exact else len(view)
+        while received < FRAME_HEADER_SIZE:
+            chunk = self.sock.recv_into(view[received:limit])
+            if not chunk:
+                raise ConnectionError("Connection closed before receiving data")
+            received += chunk
+        (length,) = _FRAME_HEADER.unpack_from(self._recv_buf)
+        compressed = length & COMPRESSED_FLAG
+        length &= COMPRESSED_FLAG - 1
+        if length > MAX_FRAME_SIZE:
+            raise ValueError(f"Response frame of {length} bytes exceeds the {MAX_FRAME_SIZE} byte limit")
+        end = FRAME_HEADER_SIZE + length
+        if end > len(self._recv_buf):
+            frame = bytearray(length)
+            body = received - FRAME_HEADER_SIZE
+            frame[:body] = view[FRAME_HEADER_SIZE:received]
+            self._recv_into(memoryview(frame)[body:])
+        else:
+            self._recv_into(view[received:end])
+            frame = view[FRAME_HEADER_SIZE:end]
+        if compressed:
+            if self._zstd is None:
+                raise ValueError("Received a zstd-compressed frame but zstandard is not installed")
+            return self._zstd.decompress(frame)
+        return frame
+
+    def _recv_into(self, buf: Union[bytearray, memoryview]) -> None:
+        """Fill buf from the socket without intermediate bytes objects"""
+        view = memoryview(buf)
+        size = len(buf)
+        offset = 0
+        while offset < size:
+            received = self.sock.recv_into(view[offset:])
+            if not received:
+                raise ConnectionError("Connection closed before receiving data")
+            offset += received
+
+class BlenderConnectionPool:
+    """Thread-safe pool of persistent Blender connections
+    
+    Exposes send_command like a single BlenderConnection, but each call
+    borrows its own socket so concurrent tool calls do not queue behind
+    one another. Connections are opened lazily, up to ``size`` at once.
+    """
+    
+    def __init__(self, host: str, port: int, size: int = BLENDER_POOL_SIZE):
+        self.host = host
+        self.port = port
+        self.size = size
+        self._idle: "queue.LifoQueue[BlenderConnection]" = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+    
+    @contextmanager
+    def connection(self) -> Iterator[BlenderConnection]:
+        """Borrow a connection; it is dropped instead of returned on I/O errors"""
+        with self._slots:
             try:
-                chunk = self.sock.recv(buffer_size)
-                if not chunk:
-                    if not chunks:
-                        raise Exception("Connection closed before receiving data")
-                    break
-                
-                chunks.append(chunk)
-                
-                # Check if complete JSON received
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                conn = BlenderConnection(host=self.host, port=self.port)
+            
+            # send_command reconnects on its own when Blender has closed the
+            # socket before a frame could be written, so a recently used
+            # socket is handed out as-is; only idle ones are pinged first
+            idle = time.monotonic() - conn.last_used
+            if conn.sock is not None and idle >= BLENDER_IDLE_PING_INTERVAL:
                 try:
-                    data = b''.join(chunks)
-                    json.loads(data.decode('utf-8'))
-                    return data
-                except json.JSONDecodeError:
-                    continue
-                    
-            except socket.timeout:
-                if chunks:
-                    break
-                raise
+                    conn.send_command("ping")
+                except Exception as e:
+                    logger.warning("Existing connection invalid: %s", e)
+                    conn.disconnect()
             
-        if chunks:
-            return b''.join(chunks)
-        raise Exception("No data received")
-
-# Global connection manager
-_blender_connection = None
-
-def get_blender_connection() -> BlenderConnection:
-    """Get or create persistent Blender connection"""
-    global _blender_connection
+            try:
+                yield conn
+            except BlenderCommandError:
+                # Blender answered, so the socket is still in sync
+                self._idle.put(conn)
+                raise
+            except Exception:
+                conn.disconnect()
+                raise
+            self._idle.put(conn)
     
-    if _blender_connection is not None:
-        try:
-            # Test connection
-            _blender_connection.send_command("ping")
-            return _blender_connection
-        except Exception as e:
-            logger.warning(f"Existing connection invalid: {str(e)}")
+    def send_command(self, command_type: str, params: Dict[str, Any] = None,
+                     on_progress: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """Send command to Blender on a pooled connection"""
+        with self.connection() as conn:
+            return conn.send_command(command_type, params, on_progress)
+    
+    def send_batch(self, commands: List[Tuple[str, Optional[Dict[str, Any]]]]) -> List[Dict[str, Any]]:
+        """Send a batch of commands to Blender on a pooled connection"""
+        with self.connection() as conn:
+            return conn.send_batch(commands)
+    
+    def close(self):
+        """Disconnect every idle connection"""
+        while True:
             try:
-                _blender_connection.disconnect()
-            except:
-                pass
-            _blender_connection = None
+                self._idle.get_nowait().disconnect()
+            except queue.Empty:
+                break
+
+# Global connection manager. Creating the pool opens no sockets, so it
+# is built at import and tool calls skip any locking or None checks.
+_blender_pool = BlenderConnectionPool(BLENDER_HOST, BLENDER_PORT)
+
+def get_blender_connection() -> BlenderConnectionPool:
+    """Get the shared pool of persistent Blender connections"""
+    return _blender_pool
+
+# Blocking Blender calls run on their own threads, one per pooled
+# connection, so they neither queue behind nor starve other users of the
+# event loop's default executor
+_rpc_executor = ThreadPoolExecutor(max_workers=BLENDER_POOL_SIZE, thread_name_prefix="blender-rpc")
+
+def _in_rpc_thread(func, *args) -> "asyncio.Future[Any]":
+    """Run a blocking Blender call without blocking the event loop"""
+    return asyncio.get_running_loop().run_in_executor(_rpc_executor, func, *args)
+
+# Results of read-only commands, keyed by (command, params). Entries are
+# valid until their TTL runs out or any other command bumps the epoch,
+# since that command may have changed the scene. Only touched from the
+# event loop, so no locking is needed.
+CACHED_COMMANDS = frozenset({
+    "get_scene_info", "get_world_properties", "get_object_info",
+    "get_material_info", "list_materials", "get_mesh_info",
+    "get_animation_info", "get_render_settings", "get_server_status",
+})
+RESPONSE_CACHE_TTL = 0.5
+RESPONSE_CACHE_MAX_ENTRIES = 1024
+_response_cache: Dict[Tuple[str, bytes], Tuple[int, float, Dict[str, Any]]] = {}
+_cache_epoch = 0
+# Read-only calls currently waiting on Blender, with the epoch they started in
+_inflight: Dict[Tuple[str, bytes], Tuple[int, "asyncio.Future[Dict[str, Any]]"]] = {}
+
+def _params_key(params: Optional[Dict[str, Any]]) -> bytes:
+    """Canonical encoding of command params for cache keys"""
+    if not params:
+        return b""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(params, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(params, sort_keys=True).encode('utf-8')
+
+def _coalesced(key: Tuple[str, bytes], command_type: str,
+               params: Optional[Dict[str, Any]]) -> "asyncio.Future[Dict[str, Any]]":
+    """Share one Blender call between identical reads issued while it runs
     
-    # Create new connection
-    if _blender_connection is None:
-        host = os.getenv("BLENDER_HOST", DEFAULT_HOST)
-        port = int(os.getenv("BLENDER_PORT", DEFAULT_PORT))
-        _blender_connection = BlenderConnection(host=host, port=port)
-        
-        if not _blender_connection.connect():
-            raise Exception("Could not connect to Blender. Make sure the Blender addon is running.")
-        
-        logger.info("Created new persistent connection to Blender")
+    A call is only joined if no other command has run since it started.
+    """
+    entry = _inflight.get(key)
+    if entry is not None and entry[0] == _cache_epoch:
+        return asyncio.shield(entry[1])
+    
+    task = _in_rpc_thread(get_blender_connection().send_command, command_type, params)
+    _inflight[key] = (_cache_epoch, task)
+    
+    def forget(_):
+        if _inflight.get(key, (None, None))[1] is task:
+            del _inflight[key]
+    task.add_done_callback(forget)
+    return asyncio.shield(task)
+
+# Non-read commands issued in the same event loop iteration, such as
+# parallel tool calls, go to Blender together as one batch. They share a
+# round trip and one pass of the addon's main-thread timer, which Blender
+# runs them on one after another anyway.
+_queued_commands: List[Tuple[str, Optional[Dict[str, Any]], List["asyncio.Future[Dict[str, Any]]"]]] = []
+_queue_sender: Optional["asyncio.Task[None]"] = None
+# Commands where a later call on the same object supersedes the fields it
+# sets. Consecutive queued calls on one object are sent as a single merged
+# command whose result answers all of them; anything else queued in between
+# keeps them apart, so ordering is only relaxed within such a run.
+COALESCED_COMMANDS = frozenset({"transform_object"})
+_coalescable: Dict[Tuple[str, Any], int] = {}
+
+def _queue_command(command_type: str, params: Optional[Dict[str, Any]]) -> "asyncio.Future[Dict[str, Any]]":
+    """Future for the result of a command sent with whatever else is queued"""
+    global _queue_sender
+    future = asyncio.get_running_loop().create_future()
+    if command_type in COALESCED_COMMANDS and params:
+        key = (command_type, params.get("object_name"))
+        index = _coalescable.get(key)
+        if index is not None:
+            _, queued_params, futures = _queued_commands[index]
+            _queued_commands[index] = (command_type, {**queued_params, **params}, futures)
+            futures.append(future)
+            return future
+        _coalescable[key] = len(_queued_commands)
+    else:
+        _coalescable.clear()
+    _queued_commands.append((command_type, params, [future]))
+    if _queue_sender is None:
+        _queue_sender = asyncio.ensure_future(_send_queued_commands())
+    return future
+
+async def _send_queued_commands() -> None:
+    global _queue_sender
+    await asyncio.sleep(0)  # Let commands issued alongside the first one join
+    commands = _queued_commands[:]
+    _queued_commands.clear()
+    _coalescable.clear()
+    _queue_sender = None
+    
+    try:
+        if len(commands) == 1:
+            command_type, params, _ = commands[0]
+            results = [await _in_rpc_thread(
+                get_blender_connection().send_command, command_type, params
+            )]
+        else:
+            results = await _in_rpc_thread(
+                get_blender_connection().send_batch, [(c, p) for c, p, _ in commands]
+            )
+            if len(results) != len(commands):
+                raise ValueError(f"Blender answered {len(commands)} commands with {len(results)} results")
+            # Batched commands report failure in their result, where a
+            # single one gets an error envelope; raise the same error
+            results = [
+                result if result.get("success") else BlenderCommandError(
+                    "Communication error with Blender: "
+                    f"{result.get('error', 'Unknown error from Blender')}"
+                )
+                for result in results
+            ]
+    except Exception as e:
+        results = [e] * len(commands)
     
-    return _blender_connection
+    for (_, _, futures), result in zip(commands, results):
+        for future in futures:
+            if future.done():  # The tool call was cancelled
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+async def _rpc(command_type: str, params: Dict[str, Any] = None,
+               on_progress: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+    """Send a command to Blender from a tool without blocking the event loop
+    
+    on_progress, for commands that stream progress, is called on an RPC
+    thread; cached read commands never stream.
+    """
+    global _cache_epoch
+    if command_type not in CACHED_COMMANDS:
+        # Invalidate before and after, so reads that overlap the command
+        # are not cached under the new epoch
+        _cache_epoch += 1
+        try:
+            if on_progress is None:
+                return await _queue_command(command_type, params)
+            return await _in_rpc_thread(
+                get_blender_connection().send_command, command_type, params, on_progress
+            )
+        finally:
+            _cache_epoch += 1
+    
+    key = (command_type, _params_key(params))
+    entry = _response_cache.get(key)
+    if entry is not None and entry[0] == _cache_epoch and time.monotonic() < entry[1]:
+        return entry[2]
+    
+    epoch = _cache_epoch
+    result = await _coalesced(key, command_type, params)
+    if len(_response_cache) >= RESPONSE_CACHE_MAX_ENTRIES:
+        _response_cache.clear()
+    _response_cache[key] = (epoch, time.monotonic() + RESPONSE_CACHE_TTL, result)
+    return result
+
+# JSON text of cached read results, by result identity. _rpc returns the
+# same dict until its cache entry expires, so getter tools called again
+# within the TTL reuse the text instead of serializing it again.
+_json_texts: Dict[int, Tuple[Dict[str, Any], str]] = {}
+
+async def _rpc_json(command_type: str, params: Dict[str, Any] = None) -> str:
+    """Send a command from a getter tool and return its result as JSON text"""
+    result = await _rpc(command_type, params)
+    entry = _json_texts.get(id(result))
+    if entry is not None and entry[0] is result:
+        return entry[1]
+    text = _to_json(result)
+    if command_type in CACHED_COMMANDS:
+        if len(_json_texts) >= RESPONSE_CACHE_MAX_ENTRIES:
+            _json_texts.clear()
+        # Holding the result keeps its id from being reused
+        _json_texts[id(result)] = (result, text)
+    return text
+
+async def _rpc_batch(commands: List[Tuple[str, Optional[Dict[str, Any]]]]) -> List[Dict[str, Any]]:
+    """Send several commands to Blender in one round trip from a tool"""
+    global _cache_epoch
+    _cache_epoch += 1
+    try:
+        return await _in_rpc_thread(get_blender_connection().send_batch, commands)
+    finally:
+        _cache_epoch += 1
+
+# Commands whose tools return before Blender answers, by job id. A job
+# stays here until get_job_status reports its outcome; failures are also
+# logged as they happen, since nobody may ever ask.
+MAX_BACKGROUND_JOBS = 256
+_background_jobs: Dict[str, "asyncio.Task[Dict[str, Any]]"] = {}
+
+def _job_finished(command_type: str, task: "asyncio.Task[Dict[str, Any]]"):
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning("Background %s failed: %s", command_type, task.exception())
+
+# The most recently started job. Each job waits for the one before it, so
+# background commands reach Blender in the order they were issued (a
+# stop_animation never overtakes the play_animation before it) even though
+# the pool has several connections
+_last_background_job: Optional["asyncio.Task[Dict[str, Any]]"] = None
+
+async def _rpc_after(previous: Optional["asyncio.Task[Dict[str, Any]]"], command_type: str,
+                     params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    if previous is not None:
+        # wait() rather than await: the previous job's failure is its own
+        await asyncio.wait((previous,))
+    return await _rpc(command_type, params)
+
+def _rpc_background(command_type: str, params: Dict[str, Any] = None) -> str:
+    """Start a command without waiting for Blender's answer; returns its job id"""
+    global _last_background_job
+    if len(_background_jobs) >= MAX_BACKGROUND_JOBS:
+        for job_id in [job_id for job_id, task in _background_jobs.items() if task.done()]:
+            del _background_jobs[job_id]
+    job_id = uuid.uuid4().hex[:12]
+    previous = _last_background_job
+    if previous is not None and previous.done():
+        previous = None
+    task = asyncio.get_running_loop().create_task(_rpc_after(previous, command_type, params))
+    task.add_done_callback(lambda task: _job_finished(command_type, task))
+    _background_jobs[job_id] = task
+    _last_background_job = task
+    return job_id
+
+# Viewport captures by max_size. Callers that ask while one is in flight,
+# or within SCREENSHOT_TTL of it arriving, share it instead of making
+# Blender draw and encode the viewport again
+SCREENSHOT_TTL = 0.1
+_viewport_captures: Dict[int, "asyncio.Task[Tuple[bytes, str, float]]"] = {}
+
+async def _capture_viewport(max_size: int) -> Tuple[bytes, str, float]:
+    """Screenshot the viewport; returns the PNG, its format and when it arrived"""
+    # The PNG comes back in the response, so no file is shared between
+    # the two processes
+    params = {"max_size": max_size, "format": "png"}
+    if USE_SHARED_MEMORY:
+        params["transport"] = "shm"
+    result = await _rpc("get_viewport_screenshot", params)
+    return _image_data(result), result.get("format", "png"), time.monotonic()
+
+def _capture_reusable(task: "asyncio.Task[Tuple[bytes, str, float]]") -> bool:
+    if not task.done():
+        return True
+    if task.cancelled() or task.exception() is not None:
+        return False
+    return time.monotonic() - task.result()[2] < SCREENSHOT_TTL
+
+async def _latest_viewport(max_size: int, force: bool = False) -> Tuple[bytes, str]:
+    """The newest viewport capture at max_size, taking one if it is stale"""
+    task = _viewport_captures.get(max_size)
+    if force or task is None or not _capture_reusable(task):
+        task = asyncio.get_running_loop().create_task(_capture_viewport(max_size))
+        _viewport_captures[max_size] = task
+    # A caller that gives up must not cancel the capture others wait on
+    data, image_format, _ = await asyncio.shield(task)
+    return data, image_format
+
+def _tool_errors(action: str):
+    """Report any exception raised by a tool as "Failed to <action>: <error>" """
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await func(*args, **kwargs)
+            except Exception as e:
+                logger.exception("Failed to %s", action)
+                return f"Failed to {action}: {e}"
+        return wrapper
+    return decorator
 
 @asynccontextmanager
 async def server_lifespan(server: FastMCP) -> AsyncIterator[Dict[str, Any]]:
@@ -237,21 +1064,18 @@ async def server_lifespan(server: FastMCP) -> AsyncIterator[Dict[str, Any]]:
         
         # Validate Blender connection on startup
         try:
-            blender = get_blender_connection()
-            blender.send_command("get_server_info")
+            await _rpc("get_server_info")
             logger.info("Successfully validated Blender connection")
         except Exception as e:
-            logger.warning(f"Blender connection validation failed: {str(e)}")
+            logger.warning("Blender connection validation failed: %s", e)
             logger.warning("Ensure Blender addon is running before using tools")
         
         yield {}
         
     finally:
-        global _blender_connection
-        if _blender_connection:
-            logger.info("Disconnecting from Blender on shutdown")
-            _blender_connection.disconnect()
-            _blender_connection = None
+        # The pool stays usable; it reconnects if the server starts again
+        logger.info("Disconnecting from Blender on shutdown")
+        _blender_pool.close()
         logger.info("BlenderMCP Comprehensive server shut down")
 
 # Create MCP server
@@ -265,7 +1089,8 @@ mcp = FastMCP(
 # =============================================================================
 
 @mcp.tool
-def create_scene(ctx: Context, name: str = "New Scene") -> str:
+@_tool_errors("create scene")
+async def create_scene(ctx: Context, name: str = "New Scene") -> str:
     """Create a new Blender scene with the specified name.
     
     Args:
@@ -274,20 +1099,16 @@ def create_scene(ctx: Context, name: str = "New Scene") -> str:
     Returns:
         Success message with scene details
     """
-    try:
-        blender = get_blender_connection()
-        result = blender.send_command("create_scene", {"name": name})
-        
-        if result.get("success"):
-            return f"Scene '{name}' created successfully with {result.get('object_count', 0)} objects"
-        else:
-            return f"Failed to create scene: {result.get('message', 'Unknown error')}"
-    except Exception as e:
-        logger.error(f"Error creating scene: {str(e)}")
-        return f"Failed to create scene: {str(e)}"
+    result = await _rpc("create_scene", {"name": name})
+    
+    if result.get("success"):
+        return f"Scene '{name}' created successfully with {result.get('object_count', 0)} objects"
+    else:
+        return f"Failed to create scene: {result.get('message', 'Unknown error')}"
 
 @mcp.tool
-def set_scene_properties(ctx: Context, frame_start: int = 1, frame_end: int = 250, 
+@_tool_errors("set scene properties")
+async def set_scene_properties(ctx: Context, frame_start: int = 1, frame_end: int = 250, 
                         frame_current: int = 1, units: str = "metric") -> str:
     """Set Blender scene properties including frame range and units.
     
@@ -300,39 +1121,28 @@ def set_scene_properties(ctx: Context, frame_start: int = 1, frame_end: int = 25
     Returns:
         Success message with updated properties
     """
-    try:
-        blender = get_blender_connection()
-        result = blender.send_command("set_scene_properties", {
-            "frame_start": frame_start,
-            "frame_end": frame_end,
-            "frame_current": frame_current,
-            "units": units
-        })
-        
-        return f"Scene properties updated: {result.get('message', 'Success')}"
-    except Exception as e:
-        logger.error(f"Error setting scene properties: {str(e)}")
-        return f"Failed to set scene properties: {str(e)}"
+    result = await _rpc("set_scene_properties", {
+        "frame_start": frame_start,
+        "frame_end": frame_end,
+        "frame_current": frame_current,
+        "units": units
+    })
+    
+    return f"Scene properties updated: {result.get('message', 'Success')}"
 
 @mcp.tool
-def get_scene_info(ctx: Context) -> str:
+@_tool_errors("get scene info")
+async def get_scene_info(ctx: Context) -> str:
     """Get comprehensive information about the current Blender scene.
     
     Returns:
         JSON-formatted scene information including objects, collections, materials, etc.
     """
-    try:
-        blender = get_blender_connection()
-        result = blender.send_command("get_scene_info")
-        
-        # Convert to formatted JSON
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        logger.error(f"Error getting scene info: {str(e)}")
-        return f"Failed to get scene info: {str(e)}"
+    return await _rpc_json("get_scene_info")
 
 @mcp.tool
-def duplicate_scene(ctx: Context, source_name: str, new_name: str) -> str:
+@_tool_errors("duplicate scene")
+async def duplicate_scene(ctx: Context, source_name: str, new_name: str) -> str:
     """Duplicate an existing scene with a new name.
     
     Args:
@@ -342,23 +1152,19 @@ def duplicate_scene(ctx: Context, source_name: str, new_name: str) -> str:
     Returns:
         Success message with duplication details
     """
-    try:
-        blender = get_blender_connection()
-        result = blender.send_command("duplicate_scene", {
-            "source_name": source_name,
-            "new_name": new_name
-        })
-        
-        if result.get("success"):
-            return f"Scene '{source_name}' duplicated as '{new_name}' with {result.get('object_count', 0)} objects"
-        else:
-            return f"Failed to duplicate scene: {result.get('message', 'Unknown error')}"
-    except Exception as e:
-        logger.error(f"Error duplicating scene: {str(e)}")
-        return f"Failed to duplicate scene: {str(e)}"
+    result = await _rpc("duplicate_scene", {
+        "source_name": source_name,
+        "new_name": new_name
+    })
+    
+    if result.get("success"):
+        return f"Scene '{source_name}' duplicated as '{new_name}' with {result.get('object_count', 0)} objects"
+    else:
+        return f"Failed to duplicate scene: {result.get('message', 'Unknown error')}"
 
 @mcp.tool
-def delete_scene(ctx: Context, scene_name: str, confirm: bool = False) -> str:
+@_tool_errors("delete scene")
+async def delete_scene(ctx: Context, scene_name: str, confirm: bool = False) -> str:
     """Delete a scene by name.
     
     Args:
@@ -368,25 +1174,21 @@ def delete_scene(ctx: Context, scene_name: str, confirm: bool = False) -> str:
     Returns:
         Success or error message
     """
-    try:
-        if not confirm:
-            return "Scene deletion requires confirmation=True parameter"
-        
-        blender = get_blender_connection()
-        result = blender.send_command("delete_scene", {
-            "scene_name": scene_name
-        })
-        
-        if result.get("success"):
-            return f"Scene '{scene_name}' deleted successfully"
-        else:
-            return f"Failed to delete scene: {result.get('message', 'Unknown error')}"
-    except Exception as e:
-        logger.error(f"Error deleting scene: {str(e)}")
-        return f"Failed to delete scene: {str(e)}"
+    if not confirm:
+        return "Scene deletion requires confirmation=True parameter"
+    
+    result = await _rpc("delete_scene", {
+        "scene_name": scene_name
+    })
+    
+    if result.get("success"):
+        return f"Scene '{scene_name}' deleted successfully"
+    else:
+        return f"Failed to delete scene: {result.get('message', 'Unknown error')}"
 
 @mcp.tool
-def set_world_properties(ctx: Context, color: List[float] = [0.05, 0.05, 0.05], 
+@_tool_errors("set world properties")
+async def set_world_properties(ctx: Context, color: List[float] = (0.05, 0.05, 0.05), 
                         background_type: str = "WORLD") -> str:
     """Set world (environment) properties for the scene.
     
@@ -397,36 +1199,26 @@ def set_world_properties(ctx: Context, color: List[float] = [0.05, 0.05, 0.05],
     Returns:
         Success message with updated world properties
     """
-    try:
-        blender = get_blender_connection()
-        result = blender.send_command("set_world_properties", {
-            "color": color,
-            "background_type": background_type
-        })
-        
-        return f"World properties updated: {result.get('message', 'Success')}"
-    except Exception as e:
-        logger.error(f"Error setting world properties: {str(e)}")
-        return f"Failed to set world properties: {str(e)}"
+    result = await _rpc("set_world_properties", {
+        "color": color,
+        "background_type": background_type
+    })
+    
+    return f"World properties updated: {result.get('message', 'Success')}"
 
 @mcp.tool
-def get_world_properties(ctx: Context) -> str:
+@_tool_errors("get world properties")
+async def get_world_properties(ctx: Context) -> str:
     """Get current world (environment) properties.
     
     Returns:
         JSON-formatted world properties information
     """
-    try:
-        blender = get_blender_connection()
-        result = blender.send_command("get_world_properties")
-        
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        logger.error(f"Error getting world properties: {str(e)}")
-        return f"Failed to get world properties: {str(e)}"
+    return await _rpc_json("get_world_properties")
 
 @mcp.tool
-def clear_scene(ctx: Context, confirm: bool = False) -> str:
+@_tool_errors("clear scene")
+async def clear_scene(ctx: Context, confirm: bool = False) -> str:
     """Clear all objects from the current scene.
     
     Args:
@@ -435,27 +1227,23 @@ def clear_scene(ctx: Context, confirm: bool = False) -> str:
     Returns:
         Success or error message
     """
-    try:
-        if not confirm:
-            return "Scene clearing requires confirmation=True parameter"
-        
-        blender = get_blender_connection()
-        result = blender.send_command("clear_scene")
-        
-        if result.get("success"):
-            return f"Scene cleared successfully. {result.get('deleted_count', 0)} objects removed"
-        else:
-            return f"Failed to clear scene: {result.get('message', 'Unknown error')}"
-    except Exception as e:
-        logger.error(f"Error clearing scene: {str(e)}")
-        return f"Failed to clear scene: {str(e)}"
+    if not confirm:
+        return "Scene clearing requires confirmation=True parameter"
+    
+    result = await _rpc("clear_scene")
+    
+    if result.get("success"):
+        return f"Scene cleared successfully. {result.get('deleted_count', 0)} objects removed"
+    else:
+        return f"Failed to clear scene: {result.get('message', 'Unknown error')}"
 
 # =============================================================================
-# OBJECT OPERATIONS TOOLS (9 tools)
+# OBJECT OPERATIONS TOOLS (12 tools)
 # =============================================================================
 
 @mcp.tool
-def create_object(ctx: Context, object_type: str, name: str, location: List[float] = [0, 0, 0]) -> str:
+@_tool_errors("create object")
+async def create_object(ctx: Context, object_type: str, name: str, location: List[float] = (0, 0, 0)) -> str:
     """Create a new object in the Blender scene.
     
     Args:
@@ -466,24 +1254,20 @@ def create_object(ctx: Context, object_type: str, name: str, location: List[floa
     Returns:
         Success message with object details
     """
-    try:
-        blender = get_blender_connection()
-        result = blender.send_command("create_object", {
-            "object_type": object_type.upper(),
-            "name": name,
-            "location": location
-        })
-        
-        if result.get("success"):
-            return f"Object '{name}' created successfully at location {location}"
-        else:
-            return f"Failed to create object: {result.get('message', 'Unknown error')}"
-    except Exception as e:
-        logger.error(f"Error creating object: {str(e)}")
-        return f"Failed to create object: {str(e)}"
+    result = await _rpc("create_object", {
+        "object_type": _upper(_OBJECT_TYPES, object_type),
+        "name": name,
+        "location": location
+    })
+    
+    if result.get("success"):
+        return f"Object '{name}' created successfully at location {list(location)}"
+    else:
+        return f"Failed to create object: {result.get('message', 'Unknown error')}"
 
 @mcp.tool
-def transform_object(ctx: Context, object_name: str, location: List[float] = None,
+@_tool_errors("transform object")
+async def transform_object(ctx: Context, object_name: str, location: List[float] = None,
                     rotation: List[float] = None, scale: List[float] = None) -> str:
     """Transform (move, rotate, scale) an existing object.
     
@@ -496,26 +1280,22 @@ def transform_object(ctx: Context, object_name: str, location: List[float] = Non
     Returns:
         Success message with transformation details
     """
-    try:
-        blender = get_blender_connection()
-        transform_data = {"object_name": object_name}
-        
-        if location is not None:
-            transform_data["location"] = location
-        if rotation is not None:
-            transform_data["rotation"] = rotation
-        if scale is not None:
-            transform_data["scale"] = scale
-        
-        result = blender.send_command("transform_object", transform_data)
-        
-        return f"Object '{object_name}' transformed: {result.get('message', 'Success')}"
-    except Exception as e:
-        logger.error(f"Error transforming object: {str(e)}")
-        return f"Failed to transform object: {str(e)}"
+    transform_data = {"object_name": object_name}
+    
+    if location is not None:
+        transform_data["location"] = location
+    if rotation is not None:
+        transform_data["rotation"] = rotation
+    if scale is not None:
+        transform_data["scale"] = scale
+    
+    result = await _rpc("transform_object", transform_data)
+    
+    return f"Object '{object_name}' transformed: {result.get('message', 'Success')}"
 
 @mcp.tool
-def delete_object(ctx: Context, object_name: str, confirm: bool = False) -> str:
+@_tool_errors("delete object")
+async def delete_object(ctx: Context, object_name: str, confirm: bool = False) -> str:
     """Delete an object from the scene.
     
     Args:
@@ -525,25 +1305,21 @@ def delete_object(ctx: Context, object_name: str, confirm: bool = False) -> str:
     Returns:
         Success or error message
     """
-    try:
-        if not confirm:
-            return "Object deletion requires confirmation=True parameter"
-        
-        blender = get_blender_connection()
-        result = blender.send_command("delete_object", {
-            "object_name": object_name
-        })
-        
-        if result.get("success"):
-            return f"Object '{object_name}' deleted successfully"
-        else:
-            return f"Failed to delete object: {result.get('message', 'Unknown error')}"
-    except Exception as e:
-        logger.error(f"Error deleting object: {str(e)}")
-        return f"Failed to delete object: {str(e)}"
+    if not confirm:
+        return "Object deletion requires confirmation=True parameter"
+    
+    result = await _rpc("delete_object", {
+        "object_name": object_name
+    })
+    
+    if result.get("success"):
+        return f"Object '{object_name}' deleted successfully"
+    else:
+        return f"Failed to delete object: {result.get('message', 'Unknown error')}"
 
 @mcp.tool
-def duplicate_object(ctx: Context, source_name: str, new_name: str = None) -> str:
+@_tool_errors("duplicate object")
+async def duplicate_object(ctx: Context, source_name: str, new_name: str = None) -> str:
     """Duplicate an existing object.
     
     Args:
@@ -553,24 +1329,20 @@ def duplicate_object(ctx: Context, source_name: str, new_name: str = None) -> st
     Returns:
         Success message with duplication details
     """
-    try:
-        blender = get_blender_connection()
-        result = blender.send_command("duplicate_object", {
-            "source_name": source_name,
-            "new_name": new_name
-        })
-        
-        actual_name = new_name or f"{source_name}.001"
-        if result.get("success"):
-            return f"Object '{source_name}' duplicated as '{actual_name}'"
-        else:
-            return f"Failed to duplicate object: {result.get('message', 'Unknown error')}"
-    except Exception as e:
-        logger.error(f"Error duplicating object: {str(e)}")
-        return f"Failed to duplicate object: {str(e)}"
+    result = await _rpc("duplicate_object", {
+        "source_name": source_name,
+        "new_name": new_name
+    })
+    
+    actual_name = new_name or f"{source_name}.001"
+    if result.get("success"):
+        return f"Object '{source_name}' duplicated as '{actual_name}'"
+    else:
+        return f"Failed to duplicate object: {result.get('message', 'Unknown error')}"
 
 @mcp.tool
-def join_objects(ctx: Context, object_names: List[str], joined_name: str) -> str:
+@_tool_errors("join objects")
+async def join_objects(ctx: Context, object_names: List[str], joined_name: str) -> str:
     """Join multiple objects into a single object.
     
     Args:
@@ -580,23 +1352,49 @@ def join_objects(ctx: Context, object_names: List[str], joined_name: str) -> str
     Returns:
         Success message with join details
     """
-    try:
-        blender = get_blender_connection()
-        result = blender.send_command("join_objects", {
-            "object_names": object_names,
-            "joined_name": joined_name
-        })
-        
-        if result.get("success"):
-            return f"Objects {', '.join(object_names)} joined into '{joined_name}'"
-        else:
-            return f"Failed to join objects: {result.get('message', 'Unknown error')}"
-    except Exception as e:
-        logger.error(f"Error joining objects: {str(e)}")
-        return f"Failed to join objects: {str(e)}"
+    result = await _rpc("join_objects", {
+        "object_names": object_names,
+        "joined_name": joined_name
+    })
+    
+    if result.get("success"):
+        return f"Objects {_names(object_names)} joined into '{joined_name}'"
+    else:
+        return f"Failed to join objects: {result.get('message', 'Unknown error')}"
 
 @mcp.tool
-def separate_objects(ctx: Context, object_name: str, mode: str = "SELECTED") -> str:
+@_tool_errors("add and join objects")
+async def add_and_join(ctx: Context, a_type: str, b_type: str, joined_name: str,
+                       location_a: List[float] = (0, 0, 0),
+                       location_b: List[float] = (0, 0, 0)) -> str:
+    """Add two primitive objects, place them and join them in a single round trip.
+    
+    Args:
+        a_type: Type of the first object - 'CUBE', 'SPHERE', 'CYLINDER', 'CONE', 'PLANE', etc.
+        b_type: Type of the second object
+        joined_name: Name for the resulting joined object
+        location_a: XYZ coordinates for the first object (default: [0, 0, 0])
+        location_b: XYZ coordinates for the second object (default: [0, 0, 0])
+        
+    Returns:
+        Success message with the joined object's name
+    """
+    result = await _rpc("add_and_join", {
+        "a_type": _upper(_OBJECT_TYPES, a_type),
+        "b_type": _upper(_OBJECT_TYPES, b_type),
+        "location_a": location_a,
+        "location_b": location_b,
+        "joined_name": joined_name
+    })
+    
+    if result.get("success"):
+        return f"{a_type} and {b_type} joined into '{result.get('name', joined_name)}'"
+    else:
+        return f"Failed to add and join objects: {result.get('error', 'Unknown error')}"
+
+@mcp.tool
+@_tool_errors("separate objects")
+async def separate_objects(ctx: Context, object_name: str, mode: str = "SELECTED") -> str:
     """Separate a mesh object into individual objects.
     
     Args:
@@ -606,24 +1404,20 @@ def separate_objects(ctx: Context, object_name: str, mode: str = "SELECTED") ->
     Returns:
         Success message with separation details
     """
-    try:
-        blender = get_blender_connection()
-        result = blender.send_command("separate_objects", {
-            "object_name": object_name,
-            "mode": mode
-        })
-        
-        if result.get("success"):
-            separated_count = result.get("separated_count", 0)
-            return f"Object '{object_name}' separated into {separated_count} objects"
-        else:
-            return f"Failed to separate objects: {result.get('message', 'Unknown error')}"
-    except Exception as e:
-        logger.error(f"Error separating objects: {str(e)}")
-        return f"Failed to separate objects: {str(e)}"
+    result = await _rpc("separate_objects", {
+        "object_name": object_name,
+        "mode": mode
+    })
+    
+    if result.get("success"):
+        separated_count = result.get("separated_count", 0)
+        return f"Object '{object_name}' separated into {separated_count} objects"
+    else:
+        return f"Failed to separate objects: {result.get('message', 'Unknown error')}"
 
 @mcp.tool
-def parent_object(ctx: Context, child_name: str, parent_name: str, keep_transform: bool = True) -> str:
+@_tool_errors("parent object")
+async def parent_object(ctx: Context, child_name: str, parent_name: str, keep_transform: bool = True) -> str:
     """Set parent-child relationship between objects.
     
     Args:
@@ -634,24 +1428,20 @@ def parent_object(ctx: Context, child_name: str, parent_name: str, keep_transfor
     Returns:
         Success message with parent-child relationship details
     """
-    try:
-        blender = get_blender_connection()
-        result = blender.send_command("parent_object", {
-            "child_name": child_name,
-            "parent_name": parent_name,
-            "keep_transform": keep_transform
-        })
-        
-        if result.get("success"):
-            return f"Object '{child_name}' parented to '{parent_name}'"
-        else:
-            return f"Failed to parent object: {result.get('message', 'Unknown error')}"
-    except Exception as e:
-        logger.error(f"Error parenting object: {str(e)}")
-        return f"Failed to parent object: {str(e)}"
+    result = await _rpc("parent_object", {
+        "child_name": child_name,
+        "parent_name": parent_name,
+        "keep_transform": keep_transform
+    })
+    
+    if result.get("success"):
+        return f"Object '{child_name}' parented to '{parent_name}'"
+    else:
+        return f"Failed to parent object: {result.get('message', 'Unknown error')}"
 
 @mcp.tool
-def unparent_object(ctx: Context, child_name: str, keep_transform: bool = True) -> str:
+@_tool_errors("unparent object")
+async def unparent_object(ctx: Context, child_name: str, keep_transform: bool = True) -> str:
     """Remove parent-child relationship from an object.
     
     Args:
@@ -661,23 +1451,19 @@ def unparent_object(ctx: Context, child_name: str, keep_transform: bool = True)
     Returns:
         Success or error message
     """
-    try:
-        blender = get_blender_connection()
-        result = blender.send_command("unparent_object", {
-            "child_name": child_name,
-            "keep_transform": keep_transform
-        })
-        
-        if result.get("success"):
-            return f"Object '{child_name}' unparented successfully"
-        else:
-            return f"Failed to unparent object: {result.get('message', 'Unknown error')}"
-    except Exception as e:
-        logger.error(f"Error unparenting object: {str(e)}")
-        return f"Failed to unparent object: {str(e)}"
+    result = await _rpc("unparent_object", {
+        "child_name": child_name,
+        "keep_transform": keep_transform
+    })
+    
+    if result.get("success"):
+        return f"Object '{child_name}' unparented successfully"
+    else:
+        return f"Failed to unparent object: {result.get('message', 'Unknown error')}"
 
 @mcp.tool
-def get_object_info(ctx: Context, object_name: str) -> str:
+@_tool_errors("get object info")
+async def get_object_info(ctx: Context, object_name: str) -> str:
     """Get detailed information about a specific object.
     
     Args:
@@ -686,24 +1472,89 @@ def get_object_info(ctx: Context, object_name: str) -> str:
     Returns:
         JSON-formatted object information
     """
-    try:
-        blender = get_blender_connection()
-        result = blender.send_command("get_object_info", {
-            "object_name": object_name
-        })
+    return await _rpc_json("get_object_info", {
+        "object_name": object_name
+    })
+
+@mcp.tool
+@_tool_errors("create objects")
+async def create_objects(ctx: Context, specs: List[Dict[str, Any]]) -> str:
+    """Create several objects in a single round trip to Blender.
+    
+    Args:
+        specs: List of object specs, each with 'object_type', 'name' and an
+            optional 'location' (same fields as create_object)
         
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        logger.error(f"Error getting object info: {str(e)}")
-        return f"Failed to get object info: {str(e)}"
+    Returns:
+        Summary of the created objects
+    """
+    result = await _rpc("create_objects", {
+        "specs": [
+            {**spec, "object_type": _upper(_OBJECT_TYPES, str(spec.get("object_type", "CUBE")))}
+            for spec in specs
+        ]
+    })
+    
+    created = result.get("created", [])
+    errors = result.get("errors", [])
+    if not errors:
+        return f"Created {len(created)} objects: {_names(created)}"
+    else:
+        return f"Created {len(created)} of {len(specs)} objects: {'; '.join(errors)}"
+
+@mcp.tool
+@_tool_errors("transform objects")
+async def transform_objects(ctx: Context, updates: List[Dict[str, Any]]) -> str:
+    """Transform several objects in a single round trip to Blender.
+    
+    Args:
+        updates: List of transforms, each with 'object_name' and any of
+            'location', 'rotation' (radians) and 'scale'
+        
+    Returns:
+        Summary of the transformed objects
+    """
+    result = await _rpc("transform_objects", _transforms_payload(updates))
+    
+    transformed = result.get("transformed", [])
+    errors = result.get("errors", [])
+    if not errors:
+        return f"Transformed {len(transformed)} objects"
+    else:
+        return f"Transformed {len(transformed)} of {len(updates)} objects: {'; '.join(errors)}"
+
+@mcp.tool
+@_tool_errors("delete objects")
+async def delete_objects(ctx: Context, names: List[str], confirm: bool = False) -> str:
+    """Delete several objects in a single round trip to Blender.
+    
+    Args:
+        names: Names of the objects to delete
+        confirm: Confirmation flag to prevent accidental deletion (must be True)
+        
+    Returns:
+        Summary of the deleted objects
+    """
+    if not confirm:
+        return "Object deletion requires confirmation=True parameter"
+    
+    result = await _rpc("delete_objects", {"names": names})
+    
+    deleted = result.get("deleted", [])
+    errors = result.get("errors", [])
+    if not errors:
+        return f"Deleted {len(deleted)} objects"
+    else:
+        return f"Deleted {len(deleted)} of {len(names)} objects: {'; '.join(errors)}"
 
 # =============================================================================
 # MATERIAL MANAGEMENT TOOLS (7 tools)
 # =============================================================================
 
 @mcp.tool
-def create_material(ctx: Context, name: str, material_type: str = "BSDF_PRINCIPLED",
-                   base_color: List[float] = [0.8, 0.8, 0.8], metallic: float = 0.0,
+@_tool_errors("create material")
+async def create_material(ctx: Context, name: str, material_type: str = "BSDF_PRINCIPLED",
+                   base_color: List[float] = (0.8, 0.8, 0.8), metallic: float = 0.0,
                    roughness: float = 0.5) -> str:
     """Create a new material with specified properties.
     
@@ -717,26 +1568,22 @@ def create_material(ctx: Context, name: str, material_type: str = "BSDF_PRINCIPL
     Returns:
         Success message with material details
     """
-    try:
-        blender = get_blender_connection()
-        result = blender.send_command("create_material", {
-            "name": name,
-            "material_type": material_type,
-            "base_color": base_color,
-            "metallic": metallic,
-            "roughness": roughness
-        })
-        
-        if result.get("success"):
-            return f"Material '{name}' created successfully"
-        else:
-            return f"Failed to create material: {result.get('message', 'Unknown error')}"
-    except Exception as e:
-        logger.error(f"Error creating material: {str(e)}")
-        return f"Failed to create material: {str(e)}"
+    result = await _rpc("create_material", {
+        "name": name,
+        "material_type": material_type,
+        "base_color": base_color,
+        "metallic": metallic,
+        "roughness": roughness
+    })
+    
+    if result.get("success"):
+        return f"Material '{name}' created successfully"
+    else:
+        return f"Failed to create material: {result.get('message', 'Unknown error')}"
 
 @mcp.tool
-def assign_material(ctx: Context, object_name: str, material_name: str, material_slot: str = "") -> str:
+@_tool_errors("assign material")
+async def assign_material(ctx: Context, object_name: str, material_name: str, material_slot: str = "") -> str:
     """Assign a material to an object.
     
     Args:
@@ -747,24 +1594,20 @@ def assign_material(ctx: Context, object_name: str, material_name: str, material
     Returns:
         Success or error message
     """
-    try:
-        blender = get_blender_connection()
-        result = blender.send_command("assign_material", {
-            "object_name": object_name,
-            "material_name": material_name,
-            "material_slot": material_slot
-        })
-        
-        if result.get("success"):
-            return f"Material '{material_name}' assigned to object '{object_name}'"
-        else:
-            return f"Failed to assign material: {result.get('message', 'Unknown error')}"
-    except Exception as e:
-        logger.error(f"Error assigning material: {str(e)}")
-        return f"Failed to assign material: {str(e)}"
+    result = await _rpc("assign_material", {
+        "object_name": object_name,
+        "material_name": material_name,
+        "material_slot": material_slot
+    })
+    
+    if result.get("success"):
+        return f"Material '{material_name}' assigned to object '{object_name}'"
+    else:
+        return f"Failed to assign material: {result.get('message', 'Unknown error')}"
 
 @mcp.tool
-def update_material_properties(ctx: Context, material_name: str, properties: Dict[str, Any]) -> str:
+@_tool_errors("update material properties")
+async def update_material_properties(ctx: Context, material_name: str, properties: Dict[str, Any]) -> str:
     """Update material properties.
     
     Args:
@@ -774,20 +1617,16 @@ def update_material_properties(ctx: Context, material_name: str, properties: Dic
     Returns:
         Success or error message
     """
-    try:
-        blender = get_blender_connection()
-        result = blender.send_command("update_material_properties", {
-            "material_name": material_name,
-            "properties": properties
-        })
-        
-        return f"Material '{material_name}' properties updated: {result.get('message', 'Success')}"
-    except Exception as e:
-        logger.error(f"Error updating material properties: {str(e)}")
-        return f"Failed to update material properties: {str(e)}"
+    result = await _rpc("update_material_properties", {
+        "material_name": material_name,
+        "properties": properties
+    })
+    
+    return f"Material '{material_name}' properties updated: {result.get('message', 'Success')}"
 
 @mcp.tool
-def delete_material(ctx: Context, material_name: str, confirm: bool = False) -> str:
+@_tool_errors("delete material")
+async def delete_material(ctx: Context, material_name: str, confirm: bool = False) -> str:
     """Delete a material from the scene.
     
     Args:
@@ -797,25 +1636,21 @@ def delete_material(ctx: Context, material_name: str, confirm: bool = False) ->
     Returns:
         Success or error message
     """
-    try:
-        if not confirm:
-            return "Material deletion requires confirmation=True parameter"
-        
-        blender = get_blender_connection()
-        result = blender.send_command("delete_material", {
-            "material_name": material_name
-        })
-        
-        if result.get("success"):
-            return f"Material '{material_name}' deleted successfully"
-        else:
-            return f"Failed to delete material: {result.get('message', 'Unknown error')}"
-    except Exception as e:
-        logger.error(f"Error deleting material: {str(e)}")
-        return f"Failed to delete material: {str(e)}"
+    if not confirm:
+        return "Material deletion requires confirmation=True parameter"
+    
+    result = await _rpc("delete_material", {
+        "material_name": material_name
+    })
+    
+    if result.get("success"):
+        return f"Material '{material_name}' deleted successfully"
+    else:
+        return f"Failed to delete material: {result.get('message', 'Unknown error')}"
 
 @mcp.tool
-def duplicate_material(ctx: Context, source_name: str, new_name: str) -> str:
+@_tool_errors("duplicate material")
+async def duplicate_material(ctx: Context, source_name: str, new_name: str) -> str:
     """Duplicate an existing material.
     
     Args:
@@ -825,23 +1660,19 @@ def duplicate_material(ctx: Context, source_name: str, new_name: str) -> str:
     Returns:
         Success message with duplication details
     """
-    try:
-        blender = get_blender_connection()
-        result = blender.send_command("duplicate_material", {
-            "source_name": source_name,
-            "new_name": new_name
-        })
-        
-        if result.get("success"):
-            return f"Material '{source_name}' duplicated as '{new_name}'"
-        else:
-            return f"Failed to duplicate material: {result.get('message', 'Unknown error')}"
-    except Exception as e:
-        logger.error(f"Error duplicating material: {str(e)}")
-        return f"Failed to duplicate material: {str(e)}"
+    result = await _rpc("duplicate_material", {
+        "source_name": source_name,
+        "new_name": new_name
+    })
+    
+    if result.get("success"):
+        return f"Material '{source_name}' duplicated as '{new_name}'"
+    else:
+        return f"Failed to duplicate material: {result.get('message', 'Unknown error')}"
 
 @mcp.tool
-def get_material_info(ctx: Context, material_name: str) -> str:
+@_tool_errors("get material info")
+async def get_material_info(ctx: Context, material_name: str) -> str:
     """Get detailed information about a material.
     
     Args:
@@ -850,46 +1681,33 @@ def get_material_info(ctx: Context, material_name: str) -> str:
     Returns:
         JSON-formatted material information
     """
-    try:
-        blender = get_blender_connection()
-        result = blender.send_command("get_material_info", {
-            "material_name": material_name
-        })
-        
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        logger.error(f"Error getting material info: {str(e)}")
-        return f"Failed to get material info: {str(e)}"
+    return await _rpc_json("get_material_info", {
+        "material_name": material_name
+    })
 
 @mcp.tool
-def list_materials(ctx: Context) -> str:
+@_tool_errors("list materials")
+async def list_materials(ctx: Context) -> str:
     """List all materials in the current scene.
     
     Returns:
         Formatted list of all materials
     """
-    try:
-        blender = get_blender_connection()
-        result = blender.send_command("list_materials")
-        
-        materials = result.get("materials", [])
-        if materials:
-            formatted_list = "Materials in scene:\n"
-            for material in materials:
-                formatted_list += f"- {material}\n"
-            return formatted_list
-        else:
-            return "No materials found in scene"
-    except Exception as e:
-        logger.error(f"Error listing materials: {str(e)}")
-        return f"Failed to list materials: {str(e)}"
+    result = await _rpc("list_materials")
+    
+    materials = result.get("materials", [])
+    if materials:
+        return "Materials in scene:\n" + "".join(f"- {material}\n" for material in materials)
+    else:
+        return "No materials found in scene"
 
 # =============================================================================
 # MESH OPERATIONS TOOLS (6 tools)
 # =============================================================================
 
 @mcp.tool
-def edit_mesh(ctx: Context, object_name: str, operation: str, **kwargs) -> str:
+@_tool_errors("edit mesh")
+async def edit_mesh(ctx: Context, object_name: str, operation: str, **kwargs) -> str:
     """Perform mesh editing operations on an object.
     
     Args:
@@ -900,24 +1718,20 @@ def edit_mesh(ctx: Context, object_name: str, operation: str, **kwargs) -> str:
     Returns:
         Success message with operation details
     """
-    try:
-        blender = get_blender_connection()
-        result = blender.send_command("edit_mesh", {
-            "object_name": object_name,
-            "operation": operation.upper(),
-            **kwargs
-        })
-        
-        if result.get("success"):
-            return f"Mesh operation '{operation}' applied to '{object_name}': {result.get('message', 'Success')}"
-        else:
-            return f"Failed to perform mesh operation: {result.get('message', 'Unknown error')}"
-    except Exception as e:
-        logger.error(f"Error editing mesh: {str(e)}")
-        return f"Failed to edit mesh: {str(e)}"
+    result = await _rpc("edit_mesh", {
+        "object_name": object_name,
+        "operation": _option(_MESH_OPERATIONS, operation, "mesh operation"),
+        **kwargs
+    })
+    
+    if result.get("success"):
+        return f"Mesh operation '{operation}' applied to '{object_name}': {result.get('message', 'Success')}"
+    else:
+        return f"Failed to perform mesh operation: {result.get('message', 'Unknown error')}"
 
 @mcp.tool
-def apply_modifier(ctx: Context, object_name: str, modifier_name: str, modifier_type: str,
+@_tool_errors("apply modifier")
+async def apply_modifier(ctx: Context, object_name: str, modifier_name: str, modifier_type: str,
                   **kwargs) -> str:
     """Apply a modifier to a mesh object.
     
@@ -930,25 +1744,21 @@ def apply_modifier(ctx: Context, object_name: str, modifier_name: str, modifier_
     Returns:
         Success message with modifier details
     """
-    try:
-        blender = get_blender_connection()
-        result = blender.send_command("apply_modifier", {
-            "object_name": object_name,
-            "modifier_name": modifier_name,
-            "modifier_type": modifier_type.upper(),
-            **kwargs
-        })
-        
-        if result.get("success"):
-            return f"Modifier '{modifier_type}' applied to '{object_name}'"
-        else:
-            return f"Failed to apply modifier: {result.get('message', 'Unknown error')}"
-    except Exception as e:
-        logger.error(f"Error applying modifier: {str(e)}")
-        return f"Failed to apply modifier: {str(e)}"
+    result = await _rpc("apply_modifier", {
+        "object_name": object_name,
+        "modifier_name": modifier_name,
+        "modifier_type": _option(_MODIFIER_TYPES, modifier_type, "modifier type"),
+        **kwargs
+    })
+    
+    if result.get("success"):
+        return f"Modifier '{modifier_type}' applied to '{object_name}'"
+    else:
+        return f"Failed to apply modifier: {result.get('message', 'Unknown error')}"
 
 @mcp.tool
-def add_modifier(ctx: Context, object_name: str, modifier_name: str, modifier_type: str,
+@_tool_errors("add modifier")
+async def add_modifier(ctx: Context, object_name: str, modifier_name: str, modifier_type: str,
                 **kwargs) -> str:
     """Add a modifier to a mesh object without applying it.
     
@@ -961,25 +1771,54 @@ def add_modifier(ctx: Context, object_name: str, modifier_name: str, modifier_ty
     Returns:
         Success message with modifier details
     """
-    try:
-        blender = get_blender_connection()
-        result = blender.send_command("add_modifier", {
-            "object_name": object_name,
-            "modifier_name": modifier_name,
-            "modifier_type": modifier_type.upper(),
-            **kwargs
-        })
-        
-        if result.get("success"):
-            return f"Modifier '{modifier_type}' added to '{object_name}' as '{modifier_name}'"
-        else:
-            return f"Failed to add modifier: {result.get('message', 'Unknown error')}"
-    except Exception as e:
-        logger.error(f"Error adding modifier: {str(e)}")
-        return f"Failed to add modifier: {str(e)}"
+    result = await _rpc("add_modifier", {
+        "object_name": object_name,
+        "modifier_name": modifier_name,
+        "modifier_type": _option(_MODIFIER_TYPES, modifier_type, "modifier type"),
+        **kwargs
+    })
+    
+    if result.get("success"):
+        return f"Modifier '{modifier_type}' added to '{object_name}' as '{modifier_name}'"
+    else:
+        return f"Failed to add modifier: {result.get('message', 'Unknown error')}"
 
 @mcp.tool
-def remove_modifier(ctx: Context, object_name: str, modifier_name: str, confirm: bool = False) -> str:
+@_tool_errors("add object with modifier")
+async def add_with_modifier(ctx: Context, object_type: str, name: str, modifier_type: str,
+                            modifier_name: str = None, location: List[float] = (0, 0, 0),
+                            settings: Dict[str, Any] = None) -> str:
+    """Add a primitive object and give it a modifier in a single round trip.
+    
+    Args:
+        object_type: Type of object - 'CUBE', 'SPHERE', 'CYLINDER', 'CONE', 'PLANE', etc.
+        name: Name for the new object
+        modifier_type: Type of modifier - 'SUBSURF', 'BEVEL', 'ARRAY', 'MIRROR', etc.
+        modifier_name: Name for the modifier (default: the modifier type)
+        location: XYZ coordinates for object location (default: [0, 0, 0])
+        settings: Modifier properties to set, e.g. {"levels": 2}
+        
+    Returns:
+        Success message with object and modifier details
+    """
+    result = await _rpc("add_with_modifier", {
+        "object_type": _upper(_OBJECT_TYPES, object_type),
+        "name": name,
+        "location": location,
+        "modifier_type": _option(_MODIFIER_TYPES, modifier_type, "modifier type"),
+        "modifier_name": modifier_name,
+        "settings": settings or {}
+    })
+    
+    if result.get("success"):
+        return (f"Object '{result.get('name', name)}' created with modifier "
+                f"'{result.get('modifier', modifier_name)}' ({modifier_type})")
+    else:
+        return f"Failed to add object with modifier: {result.get('error', 'Unknown error')}"
+
+@mcp.tool
+@_tool_errors("remove modifier")
+async def remove_modifier(ctx: Context, object_name: str, modifier_name: str, confirm: bool = False) -> str:
     """Remove a modifier from a mesh object.
     
     Args:
@@ -990,47 +1829,41 @@ def remove_modifier(ctx: Context, object_name: str, modifier_name: str, confirm:
     Returns:
         Success or error message
     """
-    try:
-        if not confirm:
-            return "Modifier removal requires confirmation=True parameter"
-        
-        blender = get_blender_connection()
-        result = blender.send_command("remove_modifier", {
-            "object_name": object_name,
-            "modifier_name": modifier_name
-        })
-        
-        if result.get("success"):
-            return f"Modifier '{modifier_name}' removed from '{object_name}'"
-        else:
-            return f"Failed to remove modifier: {result.get('message', 'Unknown error')}"
-    except Exception as e:
-        logger.error(f"Error removing modifier: {str(e)}")
-        return f"Failed to remove modifier: {str(e)}"
+    if not confirm:
+        return "Modifier removal requires confirmation=True parameter"
+    
+    result = await _rpc("remove_modifier", {
+        "object_name": object_name,
+        "modifier_name": modifier_name
+    })
+    
+    if result.get("success"):
+        return f"Modifier '{modifier_name}' removed from '{object_name}'"
+    else:
+        return f"Failed to remove modifier: {result.get('message', 'Unknown error')}"
 
 @mcp.tool
-def get_mesh_info(ctx: Context, object_name: str) -> str:
+@_tool_errors("get mesh info")
+async def get_mesh_info(ctx: Context, object_name: str, include_geometry: bool = False) -> str:
     """Get detailed information about a mesh object.
     
     Args:
         object_name: Name of the mesh object to get information about
+        include_geometry: Also return vertex coordinates and face vertex indices
         
     Returns:
         JSON-formatted mesh information including vertices, edges, faces, etc.
     """
-    try:
-        blender = get_blender_connection()
-        result = blender.send_command("get_mesh_info", {
-            "object_name": object_name
-        })
-        
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        logger.error(f"Error getting mesh info: {str(e)}")
-        return f"Failed to get mesh info: {str(e)}"
+    result = await _rpc("get_mesh_info", {
+        "object_name": object_name,
+        "include_geometry": include_geometry
+    })
+    
+    return _to_json(_expand_mesh(result))
 
 @mcp.tool
-def remesh_object(ctx: Context, object_name: str, mode: str = "VOXEL", voxel_size: float = 0.1) -> str:
+@_tool_errors("remesh object")
+async def remesh_object(ctx: Context, object_name: str, mode: str = "VOXEL", voxel_size: float = 0.1) -> str:
     """Remesh an object using Blender's remesh modifier.
     
     Args:
@@ -1041,28 +1874,24 @@ def remesh_object(ctx: Context, object_name: str, mode: str = "VOXEL", voxel_siz
     Returns:
         Success or error message
     """
-    try:
-        blender = get_blender_connection()
-        result = blender.send_command("remesh_object", {
-            "object_name": object_name,
-            "mode": mode.upper(),
-            "voxel_size": voxel_size
-        })
-        
-        if result.get("success"):
-            return f"Object '{object_name}' remeshed using {mode} mode"
-        else:
-            return f"Failed to remesh object: {result.get('message', 'Unknown error')}"
-    except Exception as e:
-        logger.error(f"Error remeshing object: {str(e)}")
-        return f"Failed to remesh object: {str(e)}"
+    result = await _rpc("remesh_object", {
+        "object_name": object_name,
+        "mode": _option(_REMESH_MODES, mode, "remesh mode"),
+        "voxel_size": voxel_size
+    })
+    
+    if result.get("success"):
+        return f"Object '{object_name}' remeshed using {mode} mode"
+    else:
+        return f"Failed to remesh object: {result.get('message', 'Unknown error')}"
 
 # =============================================================================
-# ANIMATION SYSTEM TOOLS (6 tools)
+# ANIMATION SYSTEM TOOLS (7 tools)
 # =============================================================================
 
 @mcp.tool
-def create_animation(ctx: Context, object_name: str, animation_type: str = "LOCATION",
+@_tool_errors("create animation")
+async def create_animation(ctx: Context, object_name: str, animation_type: str = "LOCATION",
                     keyframes: List[Dict[str, Any]] = None) -> str:
     """Create animation keyframes for an object.
     
@@ -1074,25 +1903,21 @@ def create_animation(ctx: Context, object_name: str, animation_type: str = "LOCA
     Returns:
         Success message with animation details
     """
-    try:
-        blender = get_blender_connection()
-        result = blender.send_command("create_animation", {
-            "object_name": object_name,
-            "animation_type": animation_type.upper(),
-            "keyframes": keyframes or []
-        })
-        
-        if result.get("success"):
-            keyframe_count = result.get("keyframe_count", 0)
-            return f"Animation created for '{object_name}' with {keyframe_count} keyframes"
-        else:
-            return f"Failed to create animation: {result.get('message', 'Unknown error')}"
-    except Exception as e:
-        logger.error(f"Error creating animation: {str(e)}")
-        return f"Failed to create animation: {str(e)}"
+    result = await _rpc("create_animation", {
+        "object_name": object_name,
+        "animation_type": _upper(_ANIMATION_TYPES, animation_type),
+        "keyframes": keyframes or []
+    })
+    
+    if result.get("success"):
+        keyframe_count = result.get("keyframe_count", 0)
+        return f"Animation created for '{object_name}' with {keyframe_count} keyframes"
+    else:
+        return f"Failed to create animation: {result.get('message', 'Unknown error')}"
 
 @mcp.tool
-def set_keyframes(ctx: Context, object_name: str, frame: int, location: List[float] = None,
+@_tool_errors("set keyframes")
+async def set_keyframes(ctx: Context, object_name: str, frame: int, location: List[float] = None,
                  rotation: List[float] = None, scale: List[float] = None) -> str:
     """Set keyframes for object transformation at specific frames.
     
@@ -1106,29 +1931,41 @@ def set_keyframes(ctx: Context, object_name: str, frame: int, location: List[flo
     Returns:
         Success or error message
     """
-    try:
-        blender = get_blender_connection()
-        keyframe_data = {
-            "object_name": object_name,
-            "frame": frame
-        }
-        
-        if location is not None:
-            keyframe_data["location"] = location
-        if rotation is not None:
-            keyframe_data["rotation"] = rotation
-        if scale is not None:
-            keyframe_data["scale"] = scale
-        
-        result = blender.send_command("set_keyframes", keyframe_data)
-        
-        return f"Keyframes set for '{object_name}' at frame {frame}: {result.get('message', 'Success')}"
-    except Exception as e:
-        logger.error(f"Error setting keyframes: {str(e)}")
-        return f"Failed to set keyframes: {str(e)}"
+    result = await _rpc("set_keyframes_bulk", _keyframes_payload(
+        object_name, [frame],
+        location=None if location is None else [location],
+        rotation=None if rotation is None else [rotation],
+        scale=None if scale is None else [scale]
+    ))
+    
+    return f"Keyframes set for '{object_name}' at frame {frame}: {result.get('message', 'Success')}"
+
+@mcp.tool
+@_tool_errors("set keyframes in bulk")
+async def set_keyframes_bulk(ctx: Context, object_name: str, frames: List[int],
+                             location: List[List[float]] = None, rotation: List[List[float]] = None,
+                             scale: List[List[float]] = None) -> str:
+    """Set transformation keyframes for many frames in a single call.
+    
+    Args:
+        object_name: Name of the object
+        frames: Frame numbers, one per keyframe
+        location: XYZ location values for each frame (optional)
+        rotation: XYZ rotation values in radians for each frame (optional)
+        scale: XYZ scale values for each frame (optional)
+        
+    Returns:
+        Success or error message
+    """
+    result = await _rpc("set_keyframes_bulk", _keyframes_payload(
+        object_name, frames, location=location, rotation=rotation, scale=scale
+    ))
+    
+    return f"{len(frames)} keyframes set for '{object_name}': {result.get('message', 'Success')}"
 
 @mcp.tool
-def play_animation(ctx: Context, frame_start: int = 1, frame_end: int = 250) -> str:
+@_tool_errors("play animation")
+async def play_animation(ctx: Context, frame_start: int = 1, frame_end: int = 250) -> str:
     """Play animation in the viewport.
     
     Args:
@@ -1138,36 +1975,29 @@ def play_animation(ctx: Context, frame_start: int = 1, frame_end: int = 250) ->
     Returns:
         Success or error message
     """
-    try:
-        blender = get_blender_connection()
-        result = blender.send_command("play_animation", {
-            "frame_start": frame_start,
-            "frame_end": frame_end
-        })
-        
-        return f"Animation playback started: {result.get('message', 'Success')}"
-    except Exception as e:
-        logger.error(f"Error playing animation: {str(e)}")
-        return f"Failed to play animation: {str(e)}"
+    # Playback runs on in Blender, so there is nothing here to wait for
+    job_id = _rpc_background("play_animation", {
+        "frame_start": frame_start,
+        "frame_end": frame_end
+    })
+    
+    return f"Animation playback started (job {job_id})"
 
 @mcp.tool
-def stop_animation(ctx: Context) -> str:
+@_tool_errors("stop animation")
+async def stop_animation(ctx: Context) -> str:
     """Stop animation playback in the viewport.
     
     Returns:
         Success or error message
     """
-    try:
-        blender = get_blender_connection()
-        result = blender.send_command("stop_animation")
-        
-        return f"Animation stopped: {result.get('message', 'Success')}"
-    except Exception as e:
-        logger.error(f"Error stopping animation: {str(e)}")
-        return f"Failed to stop animation: {str(e)}"
+    job_id = _rpc_background("stop_animation")
+    
+    return f"Animation stopped (job {job_id})"
 
 @mcp.tool
-def clear_animation(ctx: Context, object_name: str, confirm: bool = False) -> str:
+@_tool_errors("clear animation")
+async def clear_animation(ctx: Context, object_name: str, confirm: bool = False) -> str:
     """Clear all animation data from an object.
     
     Args:
@@ -1177,25 +2007,21 @@ def clear_animation(ctx: Context, object_name: str, confirm: bool = False) -> st
     Returns:
         Success or error message
     """
-    try:
-        if not confirm:
-            return "Animation clearing requires confirmation=True parameter"
-        
-        blender = get_blender_connection()
-        result = blender.send_command("clear_animation", {
-            "object_name": object_name
-        })
-        
-        if result.get("success"):
-            return f"Animation cleared from '{object_name}'"
-        else:
-            return f"Failed to clear animation: {result.get('message', 'Unknown error')}"
-    except Exception as e:
-        logger.error(f"Error clearing animation: {str(e)}")
-        return f"Failed to clear animation: {str(e)}"
+    if not confirm:
+        return "Animation clearing requires confirmation=True parameter"
+    
+    result = await _rpc("clear_animation", {
+        "object_name": object_name
+    })
+    
+    if result.get("success"):
+        return f"Animation cleared from '{object_name}'"
+    else:
+        return f"Failed to clear animation: {result.get('message', 'Unknown error')}"
 
 @mcp.tool
-def get_animation_info(ctx: Context, object_name: str) -> str:
+@_tool_errors("get animation info")
+async def get_animation_info(ctx: Context, object_name: str) -> str:
     """Get animation information for an object.
     
     Args:
@@ -1204,50 +2030,53 @@ def get_animation_info(ctx: Context, object_name: str) -> str:
     Returns:
         JSON-formatted animation information
     """
-    try:
-        blender = get_blender_connection()
-        result = blender.send_command("get_animation_info", {
-            "object_name": object_name
-        })
-        
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        logger.error(f"Error getting animation info: {str(e)}")
-        return f"Failed to get animation info: {str(e)}"
+    return await _rpc_json("get_animation_info", {
+        "object_name": object_name
+    })
 
 # =============================================================================
 # RENDERING PIPELINE TOOLS (5 tools)
 # =============================================================================
 
 @mcp.tool
-def render_scene(ctx: Context, output_path: str = None, frame: int = None) -> str:
+@_tool_errors("render scene")
+async def render_scene(ctx: Context, output_path: str = None, frame: int = None,
+                       stream: bool = False) -> str:
     """Render the current scene.
     
     Args:
         output_path: Output file path for the render (optional)
         frame: Specific frame to render (optional, renders current frame if None)
+        stream: Report render progress (samples done) while Blender renders
         
     Returns:
         Success message with render details
     """
-    try:
-        blender = get_blender_connection()
-        result = blender.send_command("render_scene", {
-            "output_path": output_path,
-            "frame": frame
-        })
-        
-        if result.get("success"):
-            render_time = result.get("render_time", "Unknown")
-            return f"Scene rendered successfully in {render_time} seconds"
-        else:
-            return f"Failed to render scene: {result.get('message', 'Unknown error')}"
-    except Exception as e:
-        logger.error(f"Error rendering scene: {str(e)}")
-        return f"Failed to render scene: {str(e)}"
+    on_progress = None
+    if stream:
+        loop = asyncio.get_running_loop()
+        
+        def on_progress(message: Dict[str, Any]) -> None:
+            asyncio.run_coroutine_threadsafe(
+                ctx.report_progress(message.get("progress", 0), message.get("total")), loop
+            )
+    
+    result = await _rpc("render_scene", {
+        "output_path": output_path,
+        "frame": frame
+    }, on_progress)
+    
+    if result.get("cached"):
+        return f"Scene unchanged since the last render; reused it for {output_path}"
+    if result.get("success"):
+        render_time = result.get("render_time", "Unknown")
+        return f"Scene rendered successfully in {render_time} seconds"
+    else:
+        return f"Failed to render scene: {result.get('message', 'Unknown error')}"
 
 @mcp.tool
-def set_render_settings(ctx: Context, settings: Dict[str, Any]) -> str:
+@_tool_errors("set render settings")
+async def set_render_settings(ctx: Context, settings: Dict[str, Any]) -> str:
     """Set render engine and quality settings.
     
     Args:
@@ -1256,59 +2085,50 @@ def set_render_settings(ctx: Context, settings: Dict[str, Any]) -> str:
     Returns:
         Success message with updated settings
     """
-    try:
-        blender = get_blender_connection()
-        result = blender.send_command("set_render_settings", {
-            "settings": settings
-        })
-        
-        return f"Render settings updated: {result.get('message', 'Success')}"
-    except Exception as e:
-        logger.error(f"Error setting render settings: {str(e)}")
-        return f"Failed to set render settings: {str(e)}"
+    result = await _rpc("set_render_settings", {
+        "settings": settings
+    })
+    
+    return f"Render settings updated: {result.get('message', 'Success')}"
 
 @mcp.tool
-def get_render_settings(ctx: Context) -> str:
+@_tool_errors("get render settings")
+async def get_render_settings(ctx: Context) -> str:
     """Get current render engine and quality settings.
     
     Returns:
         JSON-formatted render settings
     """
-    try:
-        blender = get_blender_connection()
-        result = blender.send_command("get_render_settings")
-        
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        logger.error(f"Error getting render settings: {str(e)}")
-        return f"Failed to get render settings: {str(e)}"
+    return await _rpc_json("get_render_settings")
 
 @mcp.tool
-def preview_render(ctx: Context, resolution: int = 800) -> str:
+@_tool_errors("create preview render")
+async def preview_render(ctx: Context, resolution: int = 800, wait: bool = True) -> str:
     """Create a quick preview render at reduced resolution.
     
     Args:
         resolution: Maximum resolution for preview render (default: 800)
+        wait: Wait for the render to finish; False returns a job id for
+              get_job_status instead (default: True)
         
     Returns:
         Success message with preview details
     """
-    try:
-        blender = get_blender_connection()
-        result = blender.send_command("preview_render", {
-            "resolution": resolution
-        })
-        
-        if result.get("success"):
-            return f"Preview render created at {resolution}x{resolution} resolution"
-        else:
-            return f"Failed to create preview render: {result.get('message', 'Unknown error')}"
-    except Exception as e:
-        logger.error(f"Error creating preview render: {str(e)}")
-        return f"Failed to create preview render: {str(e)}"
+    if not wait:
+        job_id = _rpc_background("preview_render", {"resolution": resolution})
+        return f"Preview render started (job {job_id})"
+    
+    result = await _rpc("preview_render", {
+        "resolution": resolution
+    })
+    
+    if result.get("success"):
+        return f"Preview render created at {resolution}x{resolution} resolution"
+    else:
+        return f"Failed to create preview render: {result.get('message', 'Unknown error')}"
 
 @mcp.tool
-def get_render_preview(ctx: Context, max_size: int = 800) -> Image:
+async def get_render_preview(ctx: Context, max_size: int = 800) -> Image:
     """Get a preview render as an image.
     
     Args:
@@ -1318,75 +2138,67 @@ def get_render_preview(ctx: Context, max_size: int = 800) -> Image:
         Preview render as Image object
     """
     try:
-        blender = get_blender_connection()
-        
-        # Create temporary file for preview
-        temp_dir = tempfile.gettempdir()
-        temp_path = os.path.join(temp_dir, f"blender_preview_{uuid.uuid4()}.png")
-        
-        result = blender.send_command("get_render_preview", {
-            "max_size": max_size,
-            "output_path": temp_path
-        })
+        # Blender sends the PNG inline, so no file is shared between the
+        # two processes
+        params = {"max_size": max_size}
+        if USE_SHARED_MEMORY:
+            params["transport"] = "shm"
+        result = await _rpc("get_render_preview", params)
         
-        if "error" in result:
-            raise Exception(result["error"])
-        
-        if not os.path.exists(temp_path):
-            raise Exception("Preview file was not created")
-        
-        # Read and return image
-        with open(temp_path, 'rb') as f:
-            image_bytes = f.read()
-        
-        # Clean up temp file
-        try:
-            os.remove(temp_path)
-        except:
-            pass
-        
-        return Image(data=image_bytes, format="png")
+        return Image(data=_image_data(result), format=result.get("format", "png"))
         
     except Exception as e:
-        logger.error(f"Error getting render preview: {str(e)}")
-        raise Exception(f"Failed to get render preview: {str(e)}")
+        logger.exception("Error getting render preview")
+        raise Exception(f"Failed to get render preview: {e}")
 
 # =============================================================================
 # FILE I/O TOOLS (4 tools)
 # =============================================================================
 
 @mcp.tool
-def import_file(ctx: Context, file_path: str, file_type: str = "AUTO") -> str:
+@_tool_errors("import file")
+async def import_file(ctx: Context, file_path: str, file_type: str = "AUTO", reuse: bool = True) -> str:
     """Import a file into the Blender scene.
     
     Args:
         file_path: Path to the file to import
         file_type: File type - 'AUTO', 'OBJ', 'FBX', 'GLTF', 'STL', etc.
+        reuse: If the unchanged file was imported before and its objects are
+               still in the scene, report those instead of importing again.
+               Set to False to import another copy.
         
     Returns:
         Success message with import details
     """
+    file_type = _option(_FILE_TYPES, file_type, "file type")
     try:
-        if not os.path.exists(file_path):
-            return f"File not found: {file_path}"
-        
-        blender = get_blender_connection()
-        result = blender.send_command("import_file", {
-            "file_path": file_path,
-            "file_type": file_type.upper()
-        })
-        
-        if result.get("success"):
-            imported_objects = result.get("imported_objects", [])
-            return f"Successfully imported {len(imported_objects)} objects from {file_path}"
-        else:
-            return f"Failed to import file: {result.get('message', 'Unknown error')}"
-    except Exception as e:
-        logger.error(f"Error importing file: {str(e)}")
-        return f"Failed to import file: {str(e)}"
+        st = os.stat(file_path)
+    except FileNotFoundError:
+        return f"File not found: {file_path}"
+    
+    # The addon keys its import cache on these, so an unchanged file
+    # is not parsed twice
+    result = await _rpc("import_file", {
+        "file_path": file_path,
+        "file_type": file_type,
+        "mtime_ns": st.st_mtime_ns,
+        "size": st.st_size,
+        "reuse": reuse
+    })
+    
+    if result.get("success"):
+        imported_objects = result.get("imported_objects", [])
+        if result.get("cached"):
+            return (f"Already imported: {len(imported_objects)} objects from {file_path} "
+                    "are in the scene and the file is unchanged; nothing was imported "
+                    "(use reuse=False to import another copy)")
+        return f"Successfully imported {len(imported_objects)} objects from {file_path}"
+    else:
+        return f"Failed to import file: {result.get('message', 'Unknown error')}"
 
 @mcp.tool
-def export_file(ctx: Context, object_names: List[str], file_path: str, file_type: str = "GLTF") -> str:
+@_tool_errors("export file")
+async def export_file(ctx: Context, object_names: List[str], file_path: str, file_type: str = "GLTF") -> str:
     """Export objects from the Blender scene to a file.
     
     Args:
@@ -1397,24 +2209,24 @@ def export_file(ctx: Context, object_names: List[str], file_path: str, file_type
     Returns:
         Success message with export details
     """
-    try:
-        blender = get_blender_connection()
-        result = blender.send_command("export_file", {
-            "object_names": object_names,
-            "file_path": file_path,
-            "file_type": file_type.upper()
-        })
-        
-        if result.get("success"):
-            return f"Successfully exported {len(object_names)} objects to {file_path}"
-        else:
-            return f"Failed to export file: {result.get('message', 'Unknown error')}"
-    except Exception as e:
-        logger.error(f"Error exporting file: {str(e)}")
-        return f"Failed to export file: {str(e)}"
+    file_type = _option(_FILE_TYPES, file_type, "file type")
+    if file_type == FileType.AUTO.value:
+        raise ValueError("export needs an explicit file type")
+    
+    result = await _rpc("export_file", {
+        "object_names": object_names,
+        "file_path": file_path,
+        "file_type": file_type
+    })
+    
+    if result.get("success"):
+        return f"Successfully exported {len(object_names)} objects to {file_path}"
+    else:
+        return f"Failed to export file: {result.get('message', 'Unknown error')}"
 
 @mcp.tool
-def save_scene(ctx: Context, file_path: str, overwrite: bool = False) -> str:
+@_tool_errors("save scene")
+async def save_scene(ctx: Context, file_path: str, overwrite: bool = False) -> str:
     """Save the current Blender scene to a .blend file.
     
     Args:
@@ -1424,23 +2236,19 @@ def save_scene(ctx: Context, file_path: str, overwrite: bool = False) -> str:
     Returns:
         Success or error message
     """
-    try:
-        blender = get_blender_connection()
-        result = blender.send_command("save_scene", {
-            "file_path": file_path,
-            "overwrite": overwrite
-        })
-        
-        if result.get("success"):
-            return f"Scene saved successfully to {file_path}"
-        else:
-            return f"Failed to save scene: {result.get('message', 'Unknown error')}"
-    except Exception as e:
-        logger.error(f"Error saving scene: {str(e)}")
-        return f"Failed to save scene: {str(e)}"
+    result = await _rpc("save_scene", {
+        "file_path": file_path,
+        "overwrite": overwrite
+    })
+    
+    if result.get("success"):
+        return f"Scene saved successfully to {file_path}"
+    else:
+        return f"Failed to save scene: {result.get('message', 'Unknown error')}"
 
 @mcp.tool
-def load_scene(ctx: Context, file_path: str, confirm: bool = False) -> str:
+@_tool_errors("load scene")
+async def load_scene(ctx: Context, file_path: str, confirm: bool = False) -> str:
     """Load a .blend file, replacing the current scene.
     
     Args:
@@ -1450,33 +2258,33 @@ def load_scene(ctx: Context, file_path: str, confirm: bool = False) -> str:
     Returns:
         Success or error message
     """
+    if not confirm:
+        return "Scene loading requires confirmation=True parameter"
+    
     try:
-        if not confirm:
-            return "Scene loading requires confirmation=True parameter"
-        
-        if not os.path.exists(file_path):
-            return f"File not found: {file_path}"
-        
-        blender = get_blender_connection()
-        result = blender.send_command("load_scene", {
-            "file_path": file_path
-        })
-        
-        if result.get("success"):
-            return f"Scene loaded successfully from {file_path}"
-        else:
-            return f"Failed to load scene: {result.get('message', 'Unknown error')}"
-    except Exception as e:
-        logger.error(f"Error loading scene: {str(e)}")
-        return f"Failed to load scene: {str(e)}"
+        st = os.stat(file_path)
+    except FileNotFoundError:
+        return f"File not found: {file_path}"
+    
+    result = await _rpc("load_scene", {
+        "file_path": file_path,
+        "mtime_ns": st.st_mtime_ns,
+        "size": st.st_size
+    })
+    
+    if result.get("success"):
+        return f"Scene loaded successfully from {file_path}"
+    else:
+        return f"Failed to load scene: {result.get('message', 'Unknown error')}"
 
 # =============================================================================
 # CAMERA/LIGHTING TOOLS (4 tools)
 # =============================================================================
 
 @mcp.tool
-def create_camera(ctx: Context, name: str = "Camera", location: List[float] = [0, -5, 2],
-                 rotation: List[float] = [1.2, 0, 0], fov: float = 50.0) -> str:
+@_tool_errors("create camera")
+async def create_camera(ctx: Context, name: str = "Camera", location: List[float] = (0, -5, 2),
+                 rotation: List[float] = (1.2, 0, 0), fov: float = 50.0) -> str:
     """Create a new camera in the scene.
     
     Args:
@@ -1488,25 +2296,21 @@ def create_camera(ctx: Context, name: str = "Camera", location: List[float] = [0
     Returns:
         Success message with camera details
     """
-    try:
-        blender = get_blender_connection()
-        result = blender.send_command("create_camera", {
-            "name": name,
-            "location": location,
-            "rotation": rotation,
-            "fov": fov
-        })
-        
-        if result.get("success"):
-            return f"Camera '{name}' created successfully at location {location}"
-        else:
-            return f"Failed to create camera: {result.get('message', 'Unknown error')}"
-    except Exception as e:
-        logger.error(f"Error creating camera: {str(e)}")
-        return f"Failed to create camera: {str(e)}"
+    result = await _rpc("create_camera", {
+        "name": name,
+        "location": location,
+        "rotation": rotation,
+        "fov": fov
+    })
+    
+    if result.get("success"):
+        return f"Camera '{name}' created successfully at location {list(location)}"
+    else:
+        return f"Failed to create camera: {result.get('message', 'Unknown error')}"
 
 @mcp.tool
-def set_active_camera(ctx: Context, camera_name: str) -> str:
+@_tool_errors("set active camera")
+async def set_active_camera(ctx: Context, camera_name: str) -> str:
     """Set the active camera for rendering and viewport.
     
     Args:
@@ -1515,22 +2319,18 @@ def set_active_camera(ctx: Context, camera_name: str) -> str:
     Returns:
         Success or error message
     """
-    try:
-        blender = get_blender_connection()
-        result = blender.send_command("set_active_camera", {
-            "camera_name": camera_name
-        })
-        
-        if result.get("success"):
-            return f"Camera '{camera_name}' set as active camera"
-        else:
-            return f"Failed to set active camera: {result.get('message', 'Unknown error')}"
-    except Exception as e:
-        logger.error(f"Error setting active camera: {str(e)}")
-        return f"Failed to set active camera: {str(e)}"
+    result = await _rpc("set_active_camera", {
+        "camera_name": camera_name
+    })
+    
+    if result.get("success"):
+        return f"Camera '{camera_name}' set as active camera"
+    else:
+        return f"Failed to set active camera: {result.get('message', 'Unknown error')}"
 
 @mcp.tool
-def setup_lighting(ctx: Context, lighting_type: str = "THREE_POINT", 
+@_tool_errors("setup lighting")
+async def setup_lighting(ctx: Context, lighting_type: str = "THREE_POINT", 
                   location: List[float] = None, **kwargs) -> str:
     """Set up a predefined lighting setup.
     
@@ -1542,26 +2342,22 @@ def setup_lighting(ctx: Context, lighting_type: str = "THREE_POINT",
     Returns:
         Success message with lighting setup details
     """
-    try:
-        blender = get_blender_connection()
-        result = blender.send_command("setup_lighting", {
-            "lighting_type": lighting_type.upper(),
-            "location": location,
-            **kwargs
-        })
-        
-        if result.get("success"):
-            light_count = result.get("light_count", 0)
-            return f"'{lighting_type}' lighting setup created with {light_count} lights"
-        else:
-            return f"Failed to setup lighting: {result.get('message', 'Unknown error')}"
-    except Exception as e:
-        logger.error(f"Error setting up lighting: {str(e)}")
-        return f"Failed to setup lighting: {str(e)}"
+    result = await _rpc("setup_lighting", {
+        "lighting_type": _upper(_LIGHTING_TYPES, lighting_type),
+        "location": location,
+        **kwargs
+    })
+    
+    if result.get("success"):
+        light_count = result.get("light_count", 0)
+        return f"'{lighting_type}' lighting setup created with {light_count} lights"
+    else:
+        return f"Failed to setup lighting: {result.get('message', 'Unknown error')}"
 
 @mcp.tool
-def create_light(ctx: Context, light_type: str, name: str, location: List[float] = [0, 0, 5],
-                energy: float = 1000.0, color: List[float] = [1.0, 1.0, 1.0]) -> str:
+@_tool_errors("create light")
+async def create_light(ctx: Context, light_type: str, name: str, location: List[float] = (0, 0, 5),
+                energy: float = 1000.0, color: List[float] = (1.0, 1.0, 1.0)) -> str:
     """Create a new light in the scene.
     
     Args:
@@ -1574,75 +2370,57 @@ def create_light(ctx: Context, light_type: str, name: str, location: List[float]
     Returns:
         Success message with light details
     """
-    try:
-        blender = get_blender_connection()
-        result = blender.send_command("create_light", {
-            "light_type": light_type.upper(),
-            "name": name,
-            "location": location,
-            "energy": energy,
-            "color": color
-        })
-        
-        if result.get("success"):
-            return f"Light '{name}' ({light_type}) created successfully at location {location}"
-        else:
-            return f"Failed to create light: {result.get('message', 'Unknown error')}"
-    except Exception as e:
-        logger.error(f"Error creating light: {str(e)}")
-        return f"Failed to create light: {str(e)}"
+    result = await _rpc("create_light", {
+        "light_type": _upper(_LIGHT_TYPES, light_type),
+        "name": name,
+        "location": location,
+        "energy": energy,
+        "color": color
+    })
+    
+    if result.get("success"):
+        return f"Light '{name}' ({light_type}) created successfully at location {list(location)}"
+    else:
+        return f"Failed to create light: {result.get('message', 'Unknown error')}"
 
 # =============================================================================
 # UTILITY AND DEBUGGING TOOLS (Additional tools for completeness)
 # =============================================================================
 
 @mcp.tool
-def get_viewport_screenshot(ctx: Context, max_size: int = 800) -> Image:
+async def get_viewport_screenshot(ctx: Context, max_size: int = 800, force: bool = False) -> Image:
     """Capture a screenshot of the current Blender 3D viewport.
     
+    Calls made within 0.1 s of each other share one capture.
+    
     Args:
         max_size: Maximum size in pixels for the screenshot
+        force: Always take a new capture, e.g. right after changing the scene
         
     Returns:
         Screenshot as Image object
     """
     try:
-        blender = get_blender_connection()
-        
-        # Create temporary file for screenshot
-        temp_dir = tempfile.gettempdir()
-        temp_path = os.path.join(temp_dir, f"blender_screenshot_{uuid.uuid4()}.png")
-        
-        result = blender.send_command("get_viewport_screenshot", {
-            "max_size": max_size,
-            "filepath": temp_path,
-            "format": "png"
-        })
-        
-        if "error" in result:
-            raise Exception(result["error"])
-        
-        if not os.path.exists(temp_path):
-            raise Exception("Screenshot file was not created")
-        
-        # Read and return image
-        with open(temp_path, 'rb') as f:
-            image_bytes = f.read()
+        data, image_format = await _latest_viewport(max_size, force)
         
-        # Clean up temp file
-        try:
-            os.remove(temp_path)
-        except:
-            pass
-        
-        return Image(data=image_bytes, format="png")
+        return Image(data=data, format=image_format)
         
     except Exception as e:
-        logger.error(f"Error capturing screenshot: {str(e)}")
-        raise Exception(f"Failed to capture screenshot: {str(e)}")
+        logger.exception("Error capturing screenshot")
+        raise Exception(f"Failed to capture screenshot: {e}")
+
+async def _execute_code_file(code: str) -> Dict[str, Any]:
+    """Run code in Blender from a temp file; the command only carries its path"""
+    fd, path = tempfile.mkstemp(prefix="blender_mcp_", suffix=".py")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(code.encode("utf-8"))
+        return await _rpc("execute_code", {"path": path})
+    finally:
+        os.unlink(path)
 
 @mcp.tool
-def execute_blender_code(ctx: Context, code: str) -> str:
+async def execute_blender_code(ctx: Context, code: str) -> str:
     """Execute arbitrary Python code in Blender.
     
     Args:
@@ -1652,28 +2430,65 @@ def execute_blender_code(ctx: Context, code: str) -> str:
         Execution result or error message
     """
     try:
-        blender = get_blender_connection()
-        result = blender.send_command("execute_code", {"code": code})
+        if USE_CODE_FILES and len(code) >= CODE_FILE_MIN_SIZE:
+            result = await _execute_code_file(code)
+        else:
+            result = await _rpc("execute_code", {"code": code})
         return f"Code executed successfully: {result.get('result', '')}"
     except Exception as e:
-        logger.error(f"Error executing code: {str(e)}")
-        return f"Code execution failed: {str(e)}"
+        logger.exception("Error executing code: %s", e)
+        return f"Code execution failed: {e}"
 
 @mcp.tool
-def get_server_status(ctx: Context) -> str:
+@_tool_errors("get server status")
+async def get_server_status(ctx: Context) -> str:
     """Get server connection status and Blender information.
     
     Returns:
         Server status and Blender information
     """
-    try:
-        blender = get_blender_connection()
-        result = blender.send_command("get_server_status")
+    return await _rpc_json("get_server_status")
+
+@mcp.tool
+@_tool_errors("run batch")
+async def batch_commands(ctx: Context, commands: List[Dict[str, Any]]) -> str:
+    """Run several Blender commands in order with a single round trip.
+    
+    Args:
+        commands: Commands to run, each {"type": "<command>", "params": {...}}
         
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        logger.error(f"Error getting server status: {str(e)}")
-        return f"Failed to get server status: {str(e)}"
+    Returns:
+        JSON list with one result per command, in order
+    """
+    results = await _rpc_batch([
+        (command.get("type"), command.get("params")) for command in commands
+    ])
+    
+    return _to_json(results)
+
+@mcp.tool
+async def get_job_status(ctx: Context, job_id: str) -> str:
+    """Check on a command started without waiting for Blender.
+    
+    Args:
+        job_id: Job id returned by play_animation, stop_animation or
+                preview_render(wait=False)
+        
+    Returns:
+        JSON with the job's status and, once finished, its result or error
+    """
+    task = _background_jobs.get(job_id)
+    if task is None:
+        return _to_json({"job_id": job_id, "status": "unknown"})
+    if not task.done():
+        return _to_json({"job_id": job_id, "status": "running"})
+    
+    del _background_jobs[job_id]
+    if task.cancelled():
+        return _to_json({"job_id": job_id, "status": "cancelled"})
+    if task.exception() is not None:
+        return _to_json({"job_id": job_id, "status": "failed", "error": str(task.exception())})
+    return _to_json({"job_id": job_id, "status": "done", "result": task.result()})
 
 if __name__ == "__main__":
     mcp.run()
\ No newline at end of file
@@ -7,17 +7,23 @@ without external FastMCP dependency, using only standard library components.
 """
 
 import asyncio
+import functools
+import inspect
+import itertools
 import json
 import logging
 import os
 import socket
+import struct
 import tempfile
-import uuid
+import threading
 import sys
+from collections import deque
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from contextlib import asynccontextmanager
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional, AsyncIterator, Union, Callable
+from typing import Any, Dict, Iterator, List, Optional, AsyncIterator, Union, Callable, get_origin
 import time
 
 # Try to import bpy, but make it optional for testing
@@ -27,6 +33,13 @@ try:
 except ImportError:
     BLENDER_AVAILABLE = False
 
+# orjson is optional; stdlib json is used when it is not installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -38,6 +51,127 @@ logger = logging.getLogger("BlenderMCPServer")
 DEFAULT_HOST = "localhost"
 DEFAULT_PORT = 9876
 BLENDER_SOCKET_TIMEOUT = 30.0
+BLENDER_IDLE_PING_INTERVAL = 30.0
+# Sync tool calls running at once; the rest queue, since the addon runs
+# every command on Blender's one main thread anyway
+MAX_CONCURRENT_TOOL_CALLS = 8
+# Results of read-only commands, kept per connection by (command, params).
+# Entries are valid until their TTL runs out or any other command on the
+# connection runs, since that command may have changed the scene.
+CACHED_COMMANDS = frozenset({"get_object_info", "get_scene_info", "get_world_properties"})
+RESPONSE_CACHE_TTL = 0.5
+RESPONSE_CACHE_MAX_ENTRIES = 1024
+
+# TCP keepalive probes after 15 s idle, every 5 s, giving up after 3, so a
+# dead Blender is noticed without pinging it before every command. Only
+# the options this platform has are set.
+_KEEPALIVE_OPTIONS = tuple(
+    (getattr(socket, name), value)
+    for name, value in (("TCP_KEEPIDLE", 15), ("TCP_KEEPINTVL", 5), ("TCP_KEEPCNT", 3))
+    if hasattr(socket, name)
+)
+
+# Every message to and from the addon is a 4-byte big-endian length
+# followed by that many bytes of JSON
+_FRAME_HEADER = struct.Struct(">I")
+FRAME_HEADER_SIZE = _FRAME_HEADER.size
+# Same limit the addon enforces; a larger length means the stream is out of sync
+MAX_FRAME_SIZE = 256 * 1024 * 1024
+# Responses up to this size are read into, and decoded from, one buffer
+# the reader thread keeps; larger ones get a buffer of their own
+RECEIVE_BUFFER_SIZE = 64 * 1024
+HAS_SENDMSG = hasattr(socket.socket, "sendmsg")
+
+def _send_frame(sock: socket.socket, body: bytes) -> None:
+    """Send a length-prefixed frame without copying body behind its header
+    
+    Platforms without sendmsg (Windows) send the two joined instead.
+    """
+    header = _FRAME_HEADER.pack(len(body))
+    if not HAS_SENDMSG:
+        sock.sendall(header + body)
+        return
+    sent = sock.sendmsg((header, body))
+    # sendmsg may write only part of the frame; finish it with sendall
+    if sent < FRAME_HEADER_SIZE:
+        sock.sendall(header[sent:])
+        sent = FRAME_HEADER_SIZE
+    if sent < FRAME_HEADER_SIZE + len(body):
+        sock.sendall(memoryview(body)[sent - FRAME_HEADER_SIZE:])
+
+# Wire codec, bound once: both variants encode to and decode from bytes
+if ORJSON_AVAILABLE:
+    _encode_message = orjson.dumps
+    # stdio responses are one per line; orjson adds the newline itself
+    _encode_line = functools.partial(orjson.dumps, option=orjson.OPT_APPEND_NEWLINE)
+    _decode_message = orjson.loads
+else:
+    _json_encode = json.JSONEncoder().encode
+    _json_decode = json.JSONDecoder().decode
+    
+    def _encode_message(message: Dict[str, Any]) -> bytes:
+        return _json_encode(message).encode('utf-8')
+    
+    def _encode_line(message: Dict[str, Any]) -> bytes:
+        return (_json_encode(message) + "\n").encode('utf-8')
+    
+    def _decode_message(data: Union[bytes, bytearray, memoryview]) -> Any:
+        # json.loads takes no memoryview; str() decodes any buffer
+        return _json_decode(str(data, 'utf-8'))
+
+def _params_key(params: Optional[Dict[str, Any]]) -> bytes:
+    """Canonical encoding of command params for cache keys"""
+    if not params:
+        return b""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(params, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(params, sort_keys=True).encode('utf-8')
+
+@functools.lru_cache(maxsize=512)
+def _command_prefix(command_type: str) -> bytes:
+    """Constant JSON text that starts every command of a type"""
+    return b'{"type":' + _encode_message(command_type) + b',"params":'
+
+def _encode_command(command_type: str, params: Dict[str, Any], command_id: int) -> bytes:
+    """Encode a command; only its params, id and timestamp vary per call"""
+    return (_command_prefix(command_type) + _encode_message(params)
+            + b',"id":%d,"timestamp":%r}' % (command_id, time.time()))
+
+# Getter tools return compact JSON unless BLENDER_PRETTY_JSON=1; models
+# read it, and to them the indentation is only extra tokens
+PRETTY_JSON = os.getenv("BLENDER_PRETTY_JSON", "0") == "1"
+if ORJSON_AVAILABLE:
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if PRETTY_JSON else 0)
+
+def _upper_table(*names: str) -> Dict[str, str]:
+    """Upper-case names keyed by themselves and their lower case"""
+    return {spelling: name for name in names for spelling in (name, name.lower())}
+
+# Names the addon knows; anything else is still passed on, upper-cased
+_OBJECT_TYPES = _upper_table("CUBE", "SPHERE", "ICO_SPHERE", "CYLINDER", "CONE",
+                             "PLANE", "TORUS", "MONKEY")
+_LIGHTING_TYPES = _upper_table("THREE_POINT", "NATURAL", "STUDIO", "SUNSET")
+
+def _upper(table: Dict[str, str], value: str) -> str:
+    """value upper-cased; the usual spellings come from table without a new string"""
+    return table.get(value) or value.upper()
+
+# Tool messages name at most this many objects; the rest are counted
+MAX_LISTED_NAMES = 8
+
+def _names(names: List[str]) -> str:
+    """Names joined for a tool message, cut short when there are many"""
+    if len(names) <= MAX_LISTED_NAMES:
+        return ", ".join(names)
+    return f"{', '.join(names[:MAX_LISTED_NAMES])} and {len(names) - MAX_LISTED_NAMES} more"
+
+def _to_json(data: Any) -> str:
+    """Serialize a tool result as JSON text, using orjson when installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=_ORJSON_OPTIONS).decode('utf-8')
+    if PRETTY_JSON:
+        return json.dumps(data, indent=2)
+    return json.dumps(data, separators=(",", ":"))
 
 # Simple MCP Protocol Implementation
 class MCPTool:
@@ -47,6 +181,9 @@ class MCPTool:
         self.description = description
         self.parameters = parameters
         self.handler = handler
+        # Fixed at registration, so calls need not inspect the handler
+        self.is_async = inspect.iscoroutinefunction(handler)
+        self.validate = _argument_validator(name, parameters, handler)
 
 class MCPResource:
     """Represents an MCP resource"""
@@ -55,6 +192,82 @@ class MCPResource:
         self.description = description
         self.handler = handler
 
+# JSON schema type of each plain parameter annotation
+_TYPE_MAP = {int: "integer", float: "number", bool: "boolean", str: "string", list: "array"}
+# Parameters filled in by the framework rather than the caller
+_SKIP_PARAMETERS = frozenset({"self", "ctx"})
+
+
+@functools.lru_cache(maxsize=None)
+def _parameter_schema(func: Callable) -> Dict[str, Any]:
+    """Parameter schema of a tool function, computed once per function"""
+    params = {}
+    
+    for param_name, param in inspect.signature(func).parameters.items():
+        if param_name in _SKIP_PARAMETERS:
+            continue
+        
+        annotation = param.annotation
+        param_info = {
+            "type": _TYPE_MAP.get(annotation)
+            or ("array" if get_origin(annotation) is list else "string")
+        }
+        
+        if param.default is not inspect.Parameter.empty:
+            param_info["default"] = param.default
+            
+        params[param_name] = param_info
+        
+    return params
+
+
+# Python types accepted for each JSON schema type; bool is an int subclass
+# and is kept out of the numeric types explicitly
+_JSON_TYPES = {
+    "string": (str,), "integer": (int,), "number": (int, float),
+    "boolean": (bool,), "array": (list, tuple), "object": (dict,),
+}
+
+
+def _argument_validator(tool_name: str, parameters: Dict[str, Any],
+                        func: Callable) -> Callable[[Dict[str, Any]], None]:
+    """Build the argument check for one tool, run before every call
+    
+    Types come from the tool's declared schema; which arguments are required
+    and which may be null comes from the handler's signature. Everything is
+    resolved here, so a call is only a few set and isinstance checks.
+    """
+    signature = inspect.signature(func).parameters.values()
+    accepts_any = any(p.kind is inspect.Parameter.VAR_KEYWORD for p in signature)
+    defaults = {p.name: p.default for p in signature if p.name not in _SKIP_PARAMETERS
+                and p.kind is not inspect.Parameter.VAR_KEYWORD}
+    known = frozenset(defaults)
+    required = tuple(n for n, d in defaults.items() if d is inspect.Parameter.empty)
+    checks = tuple(
+        (n, info["type"], _JSON_TYPES[info["type"]], defaults.get(n) is None)
+        for n, info in parameters.items()
+        if n in defaults and info.get("type") in _JSON_TYPES
+    )
+    
+    def validate(arguments: Dict[str, Any]) -> None:
+        if not accepts_any and not known.issuperset(arguments):
+            unknown = ", ".join(sorted(set(arguments) - known))
+            raise ValueError(f"Invalid arguments for {tool_name}: unexpected {unknown}")
+        for n in required:
+            if n not in arguments:
+                raise ValueError(f"Invalid arguments for {tool_name}: missing {n}")
+        for n, type_name, types, nullable in checks:
+            if n not in arguments:
+                continue
+            value = arguments[n]
+            if value is None and nullable:
+                continue
+            if not isinstance(value, types) or (isinstance(value, bool) and bool not in types):
+                raise ValueError(f"Invalid arguments for {tool_name}: {n} must be {type_name}")
+    
+    return validate
+
+
 class SimpleMCP:
     """Simple MCP Server implementation"""
     
@@ -62,6 +275,14 @@ class SimpleMCP:
         self.name = name
         self.tools: Dict[str, MCPTool] = {}
         self.resources: Dict[str, MCPResource] = {}
+        # Sync tools get their own pool rather than the loop's default
+        # executor, which is sized by CPU count instead of by what Blender
+        # can usefully take
+        self._tool_executor = ThreadPoolExecutor(MAX_CONCURRENT_TOOL_CALLS,
+                                                 thread_name_prefix="blender-tool")
+        # tools/list and resources/list responses, rebuilt after a registration
+        self._tools_list: Optional[Dict[str, Any]] = None
+        self._resources_list: Optional[Dict[str, Any]] = None
         
     def tool(self, name: str = None, description: str = "", parameters: Dict[str, Any] = None):
         """Decorator for registering tools"""
@@ -70,6 +291,7 @@ class SimpleMCP:
             tool_params = parameters or self._extract_parameters(func)
             tool = MCPTool(tool_name, description or func.__doc__ or "", tool_params, func)
             self.tools[tool_name] = tool
+            self._tools_list = None
             return func
         return decorator
     
@@ -78,66 +300,95 @@ class SimpleMCP:
         def decorator(func):
             resource = MCPResource(uri, description or func.__doc__ or "", func)
             self.resources[uri] = resource
+            self._resources_list = None
             return func
         return decorator
     
+    def list_tools(self) -> Dict[str, Any]:
+        """The tools/list response; built once until another tool registers"""
+        if self._tools_list is None:
+            self._tools_list = {"tools": [
+                {
+                    "name": tool_name,
+                    "description": tool.description,
+                    "inputSchema": {
+                        "type": "object",
+                        "properties": tool.parameters
+                    }
+                }
+                for tool_name, tool in self.tools.items()
+            ]}
+        return self._tools_list
+    
+    def list_resources(self) -> Dict[str, Any]:
+        """The resources/list response; built once until another resource registers"""
+        if self._resources_list is None:
+            self._resources_list = {"resources": [
+                {
+                    "uri": resource_uri,
+                    "name": resource_uri.split("/")[-1],
+                    "description": resource.description
+                }
+                for resource_uri, resource in self.resources.items()
+            ]}
+        return self._resources_list
+    
     def _extract_parameters(self, func) -> Dict[str, Any]:
         """Extract parameter information from function signature"""
-        import inspect
-        sig = inspect.signature(func)
-        params = {}
-        
-        for param_name, param in sig.parameters.items():
-            if param_name == 'self' or param_name == 'ctx':
-                continue
-                
-            param_info = {
-                "type": "string"  # Default type
-            }
-            
-            if param.annotation != inspect.Parameter.empty:
-                if param.annotation == int:
-                    param_info["type"] = "integer"
-                elif param.annotation == float:
-                    param_info["type"] = "number"
-                elif param.annotation == bool:
-                    param_info["type"] = "boolean"
-                elif param.annotation == list:
-                    param_info["type"] = "array"
-                elif hasattr(param.annotation, '__origin__'):
-                    if param.annotation.__origin__ == list:
-                        param_info["type"] = "array"
-            
-            if param.default != inspect.Parameter.empty:
-                param_info["default"] = param.default
-                
-            params[param_name] = param_info
-            
-        return params
+        return _parameter_schema(func)
     
     async def call_tool(self, tool_name: str, parameters: Dict[str, Any]) -> str:
         """Call a tool with given parameters"""
-        if tool_name not in self.tools:
+        tool = self.tools.get(tool_name)
+        if tool is None:
             return f"Tool '{tool_name}' not found"
-        
-        tool = self.tools[tool_name]
+        return await self.run_tool(tool, parameters)
+    
+    async def run_tool(self, tool: MCPTool, parameters: Dict[str, Any]) -> str:
+        """Call a tool already looked up by name"""
         try:
+            # Rejected here, before a thread or a Blender round trip is spent
+            tool.validate(parameters)
             # Call the tool function
-            if asyncio.iscoroutinefunction(tool.handler):
+            if tool.is_async:
                 result = await tool.handler(**parameters)
             else:
-                result = tool.handler(**parameters)
+                # Sync handlers block on Blender's socket; they run off the
+                # event loop so other requests are served meanwhile
+                result = await asyncio.get_running_loop().run_in_executor(
+                    self._tool_executor, functools.partial(tool.handler, **parameters)
+                )
             return str(result)
         except Exception as e:
-            logger.error(f"Error calling tool {tool_name}: {str(e)}")
+            logger.error("Error calling tool %s: %s", tool.name, e)
             return f"Error: {str(e)}"
 
 @dataclass
 class BlenderConnection:
-    """Handles connection to Blender addon via socket"""
+    """Handles connection to Blender addon via socket
+    
+    Commands from several threads are pipelined over the one socket: each
+    is written as soon as it is issued and a reader thread hands responses
+    back as they arrive. The addon answers a connection's commands strictly
+    in the order it receives them, so responses are matched to commands in
+    that same order.
+    """
     host: str
     port: int
     sock: Optional[socket.socket] = None
+    # time.monotonic() of the last answer from Blender
+    last_used: float = 0.0
+    # Serializes frame writes; responses are read by the socket's reader thread
+    _write_lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+    # Futures of the commands awaiting a response on the current socket, oldest first
+    _pending: "deque[Future]" = field(default_factory=deque, repr=False, compare=False)
+    # Ids only need to be unique per connection; next() on a count is
+    # atomic, so threads sending at once never share one
+    _ids: Iterator[int] = field(default_factory=lambda: itertools.count(1), repr=False, compare=False)
+    # Read-only results and the epoch they are valid in; see CACHED_COMMANDS
+    _response_cache: Dict[tuple, tuple] = field(default_factory=dict, repr=False, compare=False)
+    _cache_epoch: int = field(default=0, repr=False, compare=False)
+    _cache_lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
     
     def connect(self) -> bool:
         """Establish connection to Blender addon"""
@@ -148,126 +399,268 @@ class BlenderConnection:
             self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             self.sock.settimeout(BLENDER_SOCKET_TIMEOUT)
             self.sock.connect((self.host, self.port))
-            logger.info(f"Connected to Blender at {self.host}:{self.port}")
+            # Small request/response frames must not wait on Nagle
+            self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            for option, value in _KEEPALIVE_OPTIONS:
+                self.sock.setsockopt(socket.IPPROTO_TCP, option, value)
+            # The reader blocks until Blender answers; callers time out
+            # on their own futures instead
+            self.sock.settimeout(None)
+            self._pending = deque()
+            threading.Thread(target=self._read_responses, args=(self.sock, self._pending),
+                             name="blender-reader", daemon=True).start()
+            logger.info("Connected to Blender at %s:%s", self.host, self.port)
             return True
         except Exception as e:
-            logger.error(f"Failed to connect to Blender: {str(e)}")
+            logger.error("Failed to connect to Blender: %s", e)
             self.sock = None
             return False
     
     def disconnect(self):
         """Close connection to Blender addon"""
-        if self.sock:
+        sock, self.sock = self.sock, None
+        if sock:
+            try:
+                # Wakes the reader thread, which fails any pending commands
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass  # Blender already closed its end
             try:
-                self.sock.close()
+                sock.close()
             except Exception as e:
-                logger.error(f"Error disconnecting from Blender: {str(e)}")
-            finally:
-                self.sock = None
+                logger.error("Error disconnecting from Blender: %s", e)
 
     def send_command(self, command_type: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
         """Send command to Blender and get response"""
-        if not self.sock and not self.connect():
-            raise ConnectionError("Not connected to Blender")
-        
-        command = {
-            "type": command_type,
-            "params": params or {},
-            "id": str(uuid.uuid4()),
-            "timestamp": time.time()
-        }
+        if command_type in CACHED_COMMANDS:
+            return self._send_cached(command_type, params)
         
+        # Invalidate before and after, so reads that overlap the command
+        # are not cached under the new epoch
+        self._invalidate_cache()
         try:
-            # Send command
-            message = json.dumps(command)
-            self.sock.sendall(message.encode('utf-8'))
-            
-            # Receive response
-            response_data = self._receive_response()
-            response = json.loads(response_data.decode('utf-8'))
-            
-            if response.get("status") == "error":
-                raise Exception(response.get("message", "Unknown error from Blender"))
-            
-            return response.get("result", {})
+            return self._send_command(command_type, params)
+        finally:
+            self._invalidate_cache()
+
+    def _invalidate_cache(self) -> None:
+        with self._cache_lock:
+            self._cache_epoch += 1
+
+    def _send_cached(self, command_type: str, params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Answer a read-only command from the cache while it is current"""
+        key = (command_type, _params_key(params))
+        with self._cache_lock:
+            entry = self._response_cache.get(key)
+            if entry is not None and entry[0] == self._cache_epoch and time.monotonic() < entry[1]:
+                return entry[2]
+            epoch = self._cache_epoch
         
-        except socket.timeout:
-            logger.error("Socket timeout waiting for Blender response")
-            self.sock = None
+        result = self._send_command(command_type, params)
+        with self._cache_lock:
+            if len(self._response_cache) >= RESPONSE_CACHE_MAX_ENTRIES:
+                self._response_cache.clear()
+            self._response_cache[key] = (epoch, time.monotonic() + RESPONSE_CACHE_TTL, result)
+        return result
+
+    def _send_command(self, command_type: str, params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        message = _encode_command(command_type, params or {}, next(self._ids))
+        
+        with self._write_lock:
+            for retry in (True, False):
+                if not self.sock and not self.connect():
+                    raise ConnectionError("Not connected to Blender")
+                # Queued before sending, so the reader always finds it
+                future = Future()
+                self._pending.append(future)
+                try:
+                    _send_frame(self.sock, message)
+                    break
+                except OSError as e:
+                    # A partly written frame leaves the stream unusable
+                    self.disconnect()
+                    # Blender closed a pooled socket before reading the
+                    # frame, so the command never ran and is safe to resend
+                    if not (retry and isinstance(e, (BrokenPipeError, ConnectionResetError))):
+                        raise Exception(f"Connection to Blender lost: {str(e)}")
+                    logger.info("Reconnecting to Blender and retrying %s", command_type)
+        
+        # Failures are logged once, by the tool's error handler
+        try:
+            response = future.result(timeout=BLENDER_SOCKET_TIMEOUT)
+        except FutureTimeoutError:
+            # The late response still arrives in order and is dropped
             raise Exception("Timeout waiting for Blender response")
-        except (ConnectionError, BrokenPipeError, ConnectionResetError) as e:
-            logger.error(f"Socket connection error: {str(e)}")
-            self.sock = None
+        except (ConnectionError, OSError) as e:
             raise Exception(f"Connection to Blender lost: {str(e)}")
         except Exception as e:
-            logger.error(f"Error communicating with Blender: {str(e)}")
-            self.sock = None
             raise Exception(f"Communication error with Blender: {str(e)}")
+        
+        if response.get("status") == "error":
+            # Blender answered, so the connection stays usable
+            message = response.get("message", "Unknown error from Blender")
+            raise Exception(f"Communication error with Blender: {message}")
+        
+        return response.get("result", {})
 
-    def _receive_response(self, buffer_size: int = 8192) -> bytes:
-        """Receive complete response from Blender"""
-        chunks = []
-        self.sock.settimeout(BLENDER_SOCKET_TIMEOUT)
+    def send_batch(self, commands: List[tuple]) -> List[Dict[str, Any]]:
+        """Send several (command_type, params) pairs in one round trip
         
+        Blender runs them in order; the results come back in the same order.
+        """
+        result = self.send_command("batch", {"commands": [
+            {"action": command_type, "params": params or {}}
+            for command_type, params in commands
+        ]})
+        return result.get("results", [])
+
+    def _read_responses(self, sock: socket.socket, pending: "deque[Future]") -> None:
+        """Reader thread: resolve each pending command's future with its response"""
+        error: Exception = ConnectionError("Connection to Blender closed")
+        try:
+            for frame in self._frames(sock):
+                # Decoded before the next read, so the buffer is free to reuse
+                response = _decode_message(frame)
+                self.last_used = time.monotonic()
+                pending.popleft().set_result(response)
+        except IndexError:
+            error = ConnectionError("Blender sent a response nobody was waiting for")
+            logger.error("%s", error)
+        except Exception as e:
+            if pending:
+                logger.error("Socket connection error: %s", e)
+                error = e
+        finally:
+            with self._write_lock:
+                if self.sock is sock:
+                    self.disconnect()
+                waiting = list(pending)
+                pending.clear()
+            for future in waiting:
+                future.set_exception(error)
+
+    def _frames(self, sock: socket.socket) -> Iterator[memoryview]:
+        """Yield the body of each length-prefixed frame Blender sends
+        
+        Reads fill one buffer as far as it has room, so responses that
+        arrive together come out of a single recv. A yielded view is only
+        valid until the next frame is asked for.
+        """
+        buf = bytearray(RECEIVE_BUFFER_SIZE)
+        view = memoryview(buf)
+        start = end = 0
         while True:
-            try:
-                chunk = self.sock.recv(buffer_size)
-                if not chunk:
-                    if not chunks:
-                        raise Exception("Connection closed before receiving data")
-                    break
-                
-                chunks.append(chunk)
-                
-                # Check if complete JSON received
-                try:
-                    data = b''.join(chunks)
-                    json.loads(data.decode('utf-8'))
-                    return data
-                except json.JSONDecodeError:
+            if end - start >= FRAME_HEADER_SIZE:
+                (length,) = _FRAME_HEADER.unpack_from(buf, start)
+                if length > MAX_FRAME_SIZE:
+                    raise Exception(f"Response frame of {length} bytes exceeds the {MAX_FRAME_SIZE} byte limit")
+                body = start + FRAME_HEADER_SIZE
+                if body + length <= end:
+                    yield view[body:body + length]
+                    start = body + length
                     continue
-                    
-            except socket.timeout:
-                if chunks:
-                    break
-                raise
-            
-        if chunks:
-            return b''.join(chunks)
-        raise Exception("No data received")
+                if FRAME_HEADER_SIZE + length > len(buf):
+                    # Too big for the buffer; read the rest into its own
+                    frame = memoryview(bytearray(length))
+                    frame[:end - body] = view[body:end]
+                    self._receive_exact(sock, frame[end - body:])
+                    yield frame
+                    start = end = 0
+                    continue
+            if start:
+                # Move the partial frame to the front to make room after it
+                view[:end - start] = view[start:end]
+                end -= start
+                start = 0
+            received = sock.recv_into(view[end:])
+            if not received:
+                raise ConnectionError("Connection closed before receiving data")
+            end += received
+    
+    def _receive_exact(self, sock: socket.socket, view: memoryview) -> memoryview:
+        """Fill view from the socket without intermediate bytes objects"""
+        size = len(view)
+        offset = 0
+        while offset < size:
+            received = sock.recv_into(view[offset:])
+            if not received:
+                raise ConnectionError("Connection closed before receiving data")
+            offset += received
+        return view
+
+# Global connection pool, one persistent connection per Blender instance
+_connection_pool: Dict[tuple, BlenderConnection] = {}
+# Handlers on executor threads may ask for a connection at the same time
+_connection_lock = threading.Lock()
+
+def get_blender_connection(host: Optional[str] = None, port: Optional[int] = None) -> BlenderConnection:
+    """Get or create the persistent connection to the Blender at host:port
+    
+    Defaults to BLENDER_HOST / BLENDER_PORT.
+    """
+    key = (host or os.getenv("BLENDER_HOST", DEFAULT_HOST),
+           port or int(os.getenv("BLENDER_PORT", DEFAULT_PORT)))
+    # A connection in recent use is returned without taking the lock; the
+    # pool dict is only changed under it, so reading it here is safe
+    connection = _connection_pool.get(key)
+    if connection is not None and _recently_used(connection):
+        return connection
+    with _connection_lock:
+        return _get_or_create_connection(key)
 
-# Global connection manager
-_blender_connection = None
+def _recently_used(connection: BlenderConnection) -> bool:
+    """Whether a pooled connection can be used without pinging it first"""
+    return (connection.sock is not None
+            and time.monotonic() - connection.last_used < BLENDER_IDLE_PING_INTERVAL)
 
-def get_blender_connection() -> BlenderConnection:
-    """Get or create persistent Blender connection"""
-    global _blender_connection
+def _get_or_create_connection(key: tuple) -> BlenderConnection:
+    """Return the pooled connection for key, replacing it if it has gone stale"""
+    connection = _connection_pool.get(key)
     
-    if _blender_connection is not None:
+    if connection is not None:
+        # A connection that answered recently is used as-is; keepalive
+        # catches a dead peer, and only idle ones are pinged first.
+        # send_command clears sock after a fatal error, so a broken
+        # connection always takes the ping path
+        if _recently_used(connection):
+            return connection
         try:
             # Test connection
-            _blender_connection.send_command("ping")
-            return _blender_connection
+            connection.send_command("ping")
+            return connection
         except Exception as e:
-            logger.warning(f"Existing connection invalid: {str(e)}")
+            logger.warning("Existing connection invalid: %s", e)
             try:
-                _blender_connection.disconnect()
+                connection.disconnect()
             except:
                 pass
-            _blender_connection = None
+            del _connection_pool[key]
     
     # Create new connection
-    if _blender_connection is None:
-        host = os.getenv("BLENDER_HOST", DEFAULT_HOST)
-        port = int(os.getenv("BLENDER_PORT", DEFAULT_PORT))
-        _blender_connection = BlenderConnection(host=host, port=port)
-        
-        if not _blender_connection.connect():
-            raise Exception("Could not connect to Blender. Make sure the Blender addon is running.")
-        
-        logger.info("Created new persistent connection to Blender")
+    host, port = key
+    connection = BlenderConnection(host=host, port=port)
+    
+    if not connection.connect():
+        raise Exception("Could not connect to Blender. Make sure the Blender addon is running.")
     
-    return _blender_connection
+    _connection_pool[key] = connection
+    logger.info("Created new persistent connection to Blender at %s:%s", host, port)
+    
+    return connection
+
+def _tool_errors(action: str):
+    """Report any exception raised by a tool as "Failed to <action>: <error>" """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                logger.exception("Failed to %s", action)
+                return f"Failed to {action}: {e}"
+        return wrapper
+    return decorator
 
 # Create MCP server
 mcp = SimpleMCP("BlenderMCP Comprehensive")
@@ -279,19 +672,16 @@ mcp = SimpleMCP("BlenderMCP Comprehensive")
 @mcp.tool("create_scene", "Create a new Blender scene with the specified name.", {
     "name": {"type": "string", "default": "New Scene", "description": "Name for the new scene"}
 })
+@_tool_errors("create scene")
 def create_scene(name: str = "New Scene") -> str:
     """Create a new Blender scene with the specified name."""
-    try:
-        blender = get_blender_connection()
-        result = blender.send_command("create_scene", {"name": name})
-        
-        if result.get("success"):
-            return f"Scene '{name}' created successfully with {result.get('object_count', 0)} objects"
-        else:
-            return f"Failed to create scene: {result.get('message', 'Unknown error')}"
-    except Exception as e:
-        logger.error(f"Error creating scene: {str(e)}")
-        return f"Failed to create scene: {str(e)}"
+    blender = get_blender_connection()
+    result = blender.send_command("create_scene", {"name": name})
+    
+    if result.get("success"):
+        return f"Scene '{name}' created successfully with {result.get('object_count', 0)} objects"
+    else:
+        return f"Failed to create scene: {result.get('message', 'Unknown error')}"
 
 @mcp.tool("set_scene_properties", "Set Blender scene properties including frame range and units.", {
     "frame_start": {"type": "integer", "default": 1, "description": "Starting frame number"},
@@ -299,130 +689,109 @@ def create_scene(name: str = "New Scene") -> str:
     "frame_current": {"type": "integer", "default": 1, "description": "Current frame number"},
     "units": {"type": "string", "default": "metric", "description": "Units system - 'metric', 'imperial', or 'none'"}
 })
+@_tool_errors("set scene properties")
 def set_scene_properties(frame_start: int = 1, frame_end: int = 250, 
                         frame_current: int = 1, units: str = "metric") -> str:
     """Set Blender scene properties including frame range and units."""
-    try:
-        blender = get_blender_connection()
-        result = blender.send_command("set_scene_properties", {
-            "frame_start": frame_start,
-            "frame_end": frame_end,
-            "frame_current": frame_current,
-            "units": units
-        })
-        
-        return f"Scene properties updated: {result.get('message', 'Success')}"
-    except Exception as e:
-        logger.error(f"Error setting scene properties: {str(e)}")
-        return f"Failed to set scene properties: {str(e)}"
+    blender = get_blender_connection()
+    result = blender.send_command("set_scene_properties", {
+        "frame_start": frame_start,
+        "frame_end": frame_end,
+        "frame_current": frame_current,
+        "units": units
+    })
+    
+    return f"Scene properties updated: {result.get('message', 'Success')}"
 
 @mcp.tool("get_scene_info", "Get comprehensive information about the current Blender scene.", {})
+@_tool_errors("get scene info")
 def get_scene_info() -> str:
     """Get comprehensive information about the current Blender scene."""
-    try:
-        blender = get_blender_connection()
-        result = blender.send_command("get_scene_info")
-        
-        # Convert to formatted JSON
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        logger.error(f"Error getting scene info: {str(e)}")
-        return f"Failed to get scene info: {str(e)}"
+    blender = get_blender_connection()
+    result = blender.send_command("get_scene_info")
+    
+    # Convert to formatted JSON
+    return _to_json(result)
 
 @mcp.tool("duplicate_scene", "Duplicate an existing scene with a new name.", {
     "source_name": {"type": "string", "description": "Name of the scene to duplicate"},
     "new_name": {"type": "string", "description": "Name for the new duplicated scene"}
 })
+@_tool_errors("duplicate scene")
 def duplicate_scene(source_name: str, new_name: str) -> str:
     """Duplicate an existing scene with a new name."""
-    try:
-        blender = get_blender_connection()
-        result = blender.send_command("duplicate_scene", {
-            "source_name": source_name,
-            "new_name": new_name
-        })
-        
-        if result.get("success"):
-            return f"Scene '{source_name}' duplicated as '{new_name}' with {result.get('object_count', 0)} objects"
-        else:
-            return f"Failed to duplicate scene: {result.get('message', 'Unknown error')}"
-    except Exception as e:
-        logger.error(f"Error duplicating scene: {str(e)}")
-        return f"Failed to duplicate scene: {str(e)}"
+    blender = get_blender_connection()
+    result = blender.send_command("duplicate_scene", {
+        "source_name": source_name,
+        "new_name": new_name
+    })
+    
+    if result.get("success"):
+        return f"Scene '{source_name}' duplicated as '{new_name}' with {result.get('object_count', 0)} objects"
+    else:
+        return f"Failed to duplicate scene: {result.get('message', 'Unknown error')}"
 
 @mcp.tool("delete_scene", "Delete a scene by name.", {
     "scene_name": {"type": "string", "description": "Name of the scene to delete"},
     "confirm": {"type": "boolean", "description": "Confirmation flag to prevent accidental deletion (must be True)"}
 })
+@_tool_errors("delete scene")
 def delete_scene(scene_name: str, confirm: bool = False) -> str:
     """Delete a scene by name."""
-    try:
-        if not confirm:
-            return "Scene deletion requires confirmation=True parameter"
-        
-        blender = get_blender_connection()
-        result = blender.send_command("delete_scene", {
-            "scene_name": scene_name
-        })
-        
-        if result.get("success"):
-            return f"Scene '{scene_name}' deleted successfully"
-        else:
-            return f"Failed to delete scene: {result.get('message', 'Unknown error')}"
-    except Exception as e:
-        logger.error(f"Error deleting scene: {str(e)}")
-        return f"Failed to delete scene: {str(e)}"
+    if not confirm:
+        return "Scene deletion requires confirmation=True parameter"
+    
+    blender = get_blender_connection()
+    result = blender.send_command("delete_scene", {
+        "scene_name": scene_name
+    })
+    
+    if result.get("success"):
+        return f"Scene '{scene_name}' deleted successfully"
+    else:
+        return f"Failed to delete scene: {result.get('message', 'Unknown error')}"
 
 @mcp.tool("set_world_properties", "Set world (environment) properties for the scene.", {
     "color": {"type": "array", "default": [0.05, 0.05, 0.05], "description": "RGB color values for world background"},
     "background_type": {"type": "string", "default": "WORLD", "description": "Type of background - 'WORLD', 'SKY', 'HEMI', etc."}
 })
-def set_world_properties(color: List[float] = [0.05, 0.05, 0.05], 
+@_tool_errors("set world properties")
+def set_world_properties(color: List[float] = (0.05, 0.05, 0.05), 
                         background_type: str = "WORLD") -> str:
     """Set world (environment) properties for the scene."""
-    try:
-        blender = get_blender_connection()
-        result = blender.send_command("set_world_properties", {
-            "color": color,
-            "background_type": background_type
-        })
-        
-        return f"World properties updated: {result.get('message', 'Success')}"
-    except Exception as e:
-        logger.error(f"Error setting world properties: {str(e)}")
-        return f"Failed to set world properties: {str(e)}"
+    blender = get_blender_connection()
+    result = blender.send_command("set_world_properties", {
+        "color": color,
+        "background_type": background_type
+    })
+    
+    return f"World properties updated: {result.get('message', 'Success')}"
 
 @mcp.tool("get_world_properties", "Get current world (environment) properties.", {})
+@_tool_errors("get world properties")
 def get_world_properties() -> str:
     """Get current world (environment) properties."""
-    try:
-        blender = get_blender_connection()
-        result = blender.send_command("get_world_properties")
-        
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        logger.error(f"Error getting world properties: {str(e)}")
-        return f"Failed to get world properties: {str(e)}"
+    blender = get_blender_connection()
+    result = blender.send_command("get_world_properties")
+    
+    return _to_json(result)
 
 @mcp.tool("clear_scene", "Clear all objects from the current scene.", {
     "confirm": {"type": "boolean", "description": "Confirmation flag to prevent accidental deletion (must be True)"}
 })
+@_tool_errors("clear scene")
 def clear_scene(confirm: bool = False) -> str:
     """Clear all objects from the current scene."""
-    try:
-        if not confirm:
-            return "Scene clearing requires confirmation=True parameter"
-        
-        blender = get_blender_connection()
-        result = blender.send_command("clear_scene")
-        
-        if result.get("success"):
-            return f"Scene cleared successfully. {result.get('deleted_count', 0)} objects removed"
-        else:
-            return f"Failed to clear scene: {result.get('message', 'Unknown error')}"
-    except Exception as e:
-        logger.error(f"Error clearing scene: {str(e)}")
-        return f"Failed to clear scene: {str(e)}"
+    if not confirm:
+        return "Scene clearing requires confirmation=True parameter"
+    
+    blender = get_blender_connection()
+    result = blender.send_command("clear_scene")
+    
+    if result.get("success"):
+        return f"Scene cleared successfully. {result.get('deleted_count', 0)} objects removed"
+    else:
+        return f"Failed to clear scene: {result.get('message', 'Unknown error')}"
 
 # =============================================================================
 # OBJECT OPERATIONS TOOLS (9 tools)
@@ -433,23 +802,20 @@ def clear_scene(confirm: bool = False) -> str:
     "name": {"type": "string", "description": "Name for the new object"},
     "location": {"type": "array", "default": [0, 0, 0], "description": "XYZ coordinates for object location"}
 })
-def create_object(object_type: str, name: str, location: List[float] = [0, 0, 0]) -> str:
+@_tool_errors("create object")
+def create_object(object_type: str, name: str, location: List[float] = (0, 0, 0)) -> str:
     """Create a new object in the Blender scene."""
-    try:
-        blender = get_blender_connection()
-        result = blender.send_command("create_object", {
-            "object_type": object_type.upper(),
-            "name": name,
-            "location": location
-        })
-        
-        if result.get("success"):
-            return f"Object '{name}' created successfully at location {location}"
-        else:
-            return f"Failed to create object: {result.get('message', 'Unknown error')}"
-    except Exception as e:
-        logger.error(f"Error creating object: {str(e)}")
-        return f"Failed to create object: {str(e)}"
+    blender = get_blender_connection()
+    result = blender.send_command("create_object", {
+        "object_type": _upper(_OBJECT_TYPES, object_type),
+        "name": name,
+        "location": location
+    })
+    
+    if result.get("success"):
+        return f"Object '{name}' created successfully at location {list(location)}"
+    else:
+        return f"Failed to create object: {result.get('message', 'Unknown error')}"
 
 @mcp.tool("transform_object", "Transform (move, rotate, scale) an existing object.", {
     "object_name": {"type": "string", "description": "Name of the object to transform"},
@@ -457,174 +823,150 @@ def create_object(object_type: str, name: str, location: List[float] = [0, 0, 0]
     "rotation": {"type": "array", "description": "New XYZ rotation in radians (optional)"},
     "scale": {"type": "array", "description": "New XYZ scale factors (optional)"}
 })
+@_tool_errors("transform object")
 def transform_object(object_name: str, location: List[float] = None,
                     rotation: List[float] = None, scale: List[float] = None) -> str:
     """Transform (move, rotate, scale) an existing object."""
-    try:
-        blender = get_blender_connection()
-        transform_data = {"object_name": object_name}
-        
-        if location is not None:
-            transform_data["location"] = location
-        if rotation is not None:
-            transform_data["rotation"] = rotation
-        if scale is not None:
-            transform_data["scale"] = scale
-        
-        result = blender.send_command("transform_object", transform_data)
-        
-        return f"Object '{object_name}' transformed: {result.get('message', 'Success')}"
-    except Exception as e:
-        logger.error(f"Error transforming object: {str(e)}")
-        return f"Failed to transform object: {str(e)}"
+    blender = get_blender_connection()
+    transform_data = {"object_name": object_name}
+    
+    if location is not None:
+        transform_data["location"] = location
+    if rotation is not None:
+        transform_data["rotation"] = rotation
+    if scale is not None:
+        transform_data["scale"] = scale
+    
+    result = blender.send_command("transform_object", transform_data)
+    
+    return f"Object '{object_name}' transformed: {result.get('message', 'Success')}"
 
 @mcp.tool("delete_object", "Delete an object from the scene.", {
     "object_name": {"type": "string", "description": "Name of the object to delete"},
     "confirm": {"type": "boolean", "description": "Confirmation flag to prevent accidental deletion (must be True)"}
 })
+@_tool_errors("delete object")
 def delete_object(object_name: str, confirm: bool = False) -> str:
     """Delete an object from the scene."""
-    try:
-        if not confirm:
-            return "Object deletion requires confirmation=True parameter"
-        
-        blender = get_blender_connection()
-        result = blender.send_command("delete_object", {
-            "object_name": object_name
-        })
-        
-        if result.get("success"):
-            return f"Object '{object_name}' deleted successfully"
-        else:
-            return f"Failed to delete object: {result.get('message', 'Unknown error')}"
-    except Exception as e:
-        logger.error(f"Error deleting object: {str(e)}")
-        return f"Failed to delete object: {str(e)}"
+    if not confirm:
+        return "Object deletion requires confirmation=True parameter"
+    
+    blender = get_blender_connection()
+    result = blender.send_command("delete_object", {
+        "object_name": object_name
+    })
+    
+    if result.get("success"):
+        return f"Object '{object_name}' deleted successfully"
+    else:
+        return f"Failed to delete object: {result.get('message', 'Unknown error')}"
 
 @mcp.tool("duplicate_object", "Duplicate an existing object.", {
     "source_name": {"type": "string", "description": "Name of the object to duplicate"},
     "new_name": {"type": "string", "description": "Name for the new duplicated object (optional)"}
 })
+@_tool_errors("duplicate object")
 def duplicate_object(source_name: str, new_name: str = None) -> str:
     """Duplicate an existing object."""
-    try:
-        blender = get_blender_connection()
-        result = blender.send_command("duplicate_object", {
-            "source_name": source_name,
-            "new_name": new_name
-        })
-        
-        actual_name = new_name or f"{source_name}.001"
-        if result.get("success"):
-            return f"Object '{source_name}' duplicated as '{actual_name}'"
-        else:
-            return f"Failed to duplicate object: {result.get('message', 'Unknown error')}"
-    except Exception as e:
-        logger.error(f"Error duplicating object: {str(e)}")
-        return f"Failed to duplicate object: {str(e)}"
+    blender = get_blender_connection()
+    result = blender.send_command("duplicate_object", {
+        "source_name": source_name,
+        "new_name": new_name
+    })
+    
+    actual_name = new_name or f"{source_name}.001"
+    if result.get("success"):
+        return f"Object '{source_name}' duplicated as '{actual_name}'"
+    else:
+        return f"Failed to duplicate object: {result.get('message', 'Unknown error')}"
 
 @mcp.tool("join_objects", "Join multiple objects into a single object.", {
     "object_names": {"type": "array", "description": "List of object names to join"},
     "joined_name": {"type": "string", "description": "Name for the resulting joined object"}
 })
+@_tool_errors("join objects")
 def join_objects(object_names: List[str], joined_name: str) -> str:
     """Join multiple objects into a single object."""
-    try:
-        blender = get_blender_connection()
-        result = blender.send_command("join_objects", {
-            "object_names": object_names,
-            "joined_name": joined_name
-        })
-        
-        if result.get("success"):
-            return f"Objects {', '.join(object_names)} joined into '{joined_name}'"
-        else:
-            return f"Failed to join objects: {result.get('message', 'Unknown error')}"
-    except Exception as e:
-        logger.error(f"Error joining objects: {str(e)}")
-        return f"Failed to join objects: {str(e)}"
+    blender = get_blender_connection()
+    result = blender.send_command("join_objects", {
+        "object_names": object_names,
+        "joined_name": joined_name
+    })
+    
+    if result.get("success"):
+        return f"Objects {_names(object_names)} joined into '{joined_name}'"
+    else:
+        return f"Failed to join objects: {result.get('message', 'Unknown error')}"
 
 @mcp.tool("separate_objects", "Separate a mesh object into individual objects.", {
     "object_name": {"type": "string", "description": "Name of the object to separate"},
     "mode": {"type": "string", "default": "SELECTED", "description": "Separation mode - 'SELECTED', 'MATERIAL', 'LOOSE'"}
 })
+@_tool_errors("separate objects")
 def separate_objects(object_name: str, mode: str = "SELECTED") -> str:
     """Separate a mesh object into individual objects."""
-    try:
-        blender = get_blender_connection()
-        result = blender.send_command("separate_objects", {
-            "object_name": object_name,
-            "mode": mode
-        })
-        
-        if result.get("success"):
-            separated_count = result.get("separated_count", 0)
-            return f"Object '{object_name}' separated into {separated_count} objects"
-        else:
-            return f"Failed to separate objects: {result.get('message', 'Unknown error')}"
-    except Exception as e:
-        logger.error(f"Error separating objects: {str(e)}")
-        return f"Failed to separate objects: {str(e)}"
+    blender = get_blender_connection()
+    result = blender.send_command("separate_objects", {
+        "object_name": object_name,
+        "mode": mode
+    })
+    
+    if result.get("success"):
+        separated_count = result.get("separated_count", 0)
+        return f"Object '{object_name}' separated into {separated_count} objects"
+    else:
+        return f"Failed to separate objects: {result.get('message', 'Unknown error')}"
 
 @mcp.tool("parent_object", "Set parent-child relationship between objects.", {
     "child_name": {"type": "string", "description": "Name of the child object"},
     "parent_name": {"type": "string", "description": "Name of the parent object"},
     "keep_transform": {"type": "boolean", "default": True, "description": "Whether to keep child's transform"}
 })
+@_tool_errors("parent object")
 def parent_object(child_name: str, parent_name: str, keep_transform: bool = True) -> str:
     """Set parent-child relationship between objects."""
-    try:
-        blender = get_blender_connection()
-        result = blender.send_command("parent_object", {
-            "child_name": child_name,
-            "parent_name": parent_name,
-            "keep_transform": keep_transform
-        })
-        
-        if result.get("success"):
-            return f"Object '{child_name}' parented to '{parent_name}'"
-        else:
-            return f"Failed to parent object: {result.get('message', 'Unknown error')}"
-    except Exception as e:
-        logger.error(f"Error parenting object: {str(e)}")
-        return f"Failed to parent object: {str(e)}"
+    blender = get_blender_connection()
+    result = blender.send_command("parent_object", {
+        "child_name": child_name,
+        "parent_name": parent_name,
+        "keep_transform": keep_transform
+    })
+    
+    if result.get("success"):
+        return f"Object '{child_name}' parented to '{parent_name}'"
+    else:
+        return f"Failed to parent object: {result.get('message', 'Unknown error')}"
 
 @mcp.tool("unparent_object", "Remove parent-child relationship from an object.", {
     "child_name": {"type": "string", "description": "Name of the child object"},
     "keep_transform": {"type": "boolean", "default": True, "description": "Whether to keep child's transform"}
 })
+@_tool_errors("unparent object")
 def unparent_object(child_name: str, keep_transform: bool = True) -> str:
     """Remove parent-child relationship from an object."""
-    try:
-        blender = get_blender_connection()
-        result = blender.send_command("unparent_object", {
-            "child_name": child_name,
-            "keep_transform": keep_transform
-        })
-        
-        if result.get("success"):
-            return f"Object '{child_name}' unparented successfully"
-        else:
-            return f"Failed to unparent object: {result.get('message', 'Unknown error')}"
-    except Exception as e:
-        logger.error(f"Error unparenting object: {str(e)}")
-        return f"Failed to unparent object: {str(e)}"
+    blender = get_blender_connection()
+    result = blender.send_command("unparent_object", {
+        "child_name": child_name,
+        "keep_transform": keep_transform
+    })
+    
+    if result.get("success"):
+        return f"Object '{child_name}' unparented successfully"
+    else:
+        return f"Failed to unparent object: {result.get('message', 'Unknown error')}"
 
 @mcp.tool("get_object_info", "Get detailed information about a specific object.", {
     "object_name": {"type": "string", "description": "Name of the object to get information about"}
 })
+@_tool_errors("get object info")
 def get_object_info(object_name: str) -> str:
     """Get detailed information about a specific object."""
-    try:
-        blender = get_blender_connection()
-        result = blender.send_command("get_object_info", {
-            "object_name": object_name
-        })
-        
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        logger.error(f"Error getting object info: {str(e)}")
-        return f"Failed to get object info: {str(e)}"
+    blender = get_blender_connection()
+    result = blender.send_command("get_object_info", {
+        "object_name": object_name
+    })
+    
+    return _to_json(result)
 
 # =============================================================================
 # ADDITIONAL TOOLS - MATERIALS, MESH, ANIMATION, RENDERING, FILE I/O, CAMERA/LIGHTING
@@ -640,72 +982,63 @@ def get_object_info(object_name: str) -> str:
     "metallic": {"type": "number", "default": 0.0, "description": "Metallic factor (0.0 to 1.0)"},
     "roughness": {"type": "number", "default": 0.5, "description": "Roughness factor (0.0 to 1.0)"}
 })
+@_tool_errors("create material")
 def create_material(name: str, material_type: str = "BSDF_PRINCIPLED",
-                   base_color: List[float] = [0.8, 0.8, 0.8], metallic: float = 0.0,
+                   base_color: List[float] = (0.8, 0.8, 0.8), metallic: float = 0.0,
                    roughness: float = 0.5) -> str:
     """Create a new material with specified properties."""
-    try:
-        blender = get_blender_connection()
-        result = blender.send_command("create_material", {
-            "name": name,
-            "material_type": material_type,
-            "base_color": base_color,
-            "metallic": metallic,
-            "roughness": roughness
-        })
-        
-        if result.get("success"):
-            return f"Material '{name}' created successfully"
-        else:
-            return f"Failed to create material: {result.get('message', 'Unknown error')}"
-    except Exception as e:
-        logger.error(f"Error creating material: {str(e)}")
-        return f"Failed to create material: {str(e)}"
+    blender = get_blender_connection()
+    result = blender.send_command("create_material", {
+        "name": name,
+        "material_type": material_type,
+        "base_color": base_color,
+        "metallic": metallic,
+        "roughness": roughness
+    })
+    
+    if result.get("success"):
+        return f"Material '{name}' created successfully"
+    else:
+        return f"Failed to create material: {result.get('message', 'Unknown error')}"
 
 @mcp.tool("assign_material", "Assign a material to an object.", {
     "object_name": {"type": "string", "description": "Name of the object to assign material to"},
     "material_name": {"type": "string", "description": "Name of the material to assign"},
     "material_slot": {"type": "string", "description": "Specific material slot (optional)"}
 })
+@_tool_errors("assign material")
 def assign_material(object_name: str, material_name: str, material_slot: str = "") -> str:
     """Assign a material to an object."""
-    try:
-        blender = get_blender_connection()
-        result = blender.send_command("assign_material", {
-            "object_name": object_name,
-            "material_name": material_name,
-            "material_slot": material_slot
-        })
-        
-        if result.get("success"):
-            return f"Material '{material_name}' assigned to object '{object_name}'"
-        else:
-            return f"Failed to assign material: {result.get('message', 'Unknown error')}"
-    except Exception as e:
-        logger.error(f"Error assigning material: {str(e)}")
-        return f"Failed to assign material: {str(e)}"
+    blender = get_blender_connection()
+    result = blender.send_command("assign_material", {
+        "object_name": object_name,
+        "material_name": material_name,
+        "material_slot": material_slot
+    })
+    
+    if result.get("success"):
+        return f"Material '{material_name}' assigned to object '{object_name}'"
+    else:
+        return f"Failed to assign material: {result.get('message', 'Unknown error')}"
 
 @mcp.tool("render_scene", "Render the current scene.", {
     "output_path": {"type": "string", "description": "Output file path for the render (optional)"},
     "frame": {"type": "integer", "description": "Specific frame to render (optional)"}
 })
+@_tool_errors("render scene")
 def render_scene(output_path: str = None, frame: int = None) -> str:
     """Render the current scene."""
-    try:
-        blender = get_blender_connection()
-        result = blender.send_command("render_scene", {
-            "output_path": output_path,
-            "frame": frame
-        })
-        
-        if result.get("success"):
-            render_time = result.get("render_time", "Unknown")
-            return f"Scene rendered successfully in {render_time} seconds"
-        else:
-            return f"Failed to render scene: {result.get('message', 'Unknown error')}"
-    except Exception as e:
-        logger.error(f"Error rendering scene: {str(e)}")
-        return f"Failed to render scene: {str(e)}"
+    blender = get_blender_connection()
+    result = blender.send_command("render_scene", {
+        "output_path": output_path,
+        "frame": frame
+    })
+    
+    if result.get("success"):
+        render_time = result.get("render_time", "Unknown")
+        return f"Scene rendered successfully in {render_time} seconds"
+    else:
+        return f"Failed to render scene: {result.get('message', 'Unknown error')}"
 
 @mcp.tool("create_camera", "Create a new camera in the scene.", {
     "name": {"type": "string", "default": "Camera", "description": "Name for the new camera"},
@@ -713,60 +1046,64 @@ def render_scene(output_path: str = None, frame: int = None) -> str:
     "rotation": {"type": "array", "default": [1.2, 0, 0], "description": "XYZ rotation in radians"},
     "fov": {"type": "number", "default": 50.0, "description": "Field of view in degrees"}
 })
-def create_camera(name: str = "Camera", location: List[float] = [0, -5, 2],
-                 rotation: List[float] = [1.2, 0, 0], fov: float = 50.0) -> str:
+@_tool_errors("create camera")
+def create_camera(name: str = "Camera", location: List[float] = (0, -5, 2),
+                 rotation: List[float] = (1.2, 0, 0), fov: float = 50.0) -> str:
     """Create a new camera in the scene."""
-    try:
-        blender = get_blender_connection()
-        result = blender.send_command("create_camera", {
-            "name": name,
-            "location": location,
-            "rotation": rotation,
-            "fov": fov
-        })
-        
-        if result.get("success"):
-            return f"Camera '{name}' created successfully at location {location}"
-        else:
-            return f"Failed to create camera: {result.get('message', 'Unknown error')}"
-    except Exception as e:
-        logger.error(f"Error creating camera: {str(e)}")
-        return f"Failed to create camera: {str(e)}"
+    blender = get_blender_connection()
+    result = blender.send_command("create_camera", {
+        "name": name,
+        "location": location,
+        "rotation": rotation,
+        "fov": fov
+    })
+    
+    if result.get("success"):
+        return f"Camera '{name}' created successfully at location {list(location)}"
+    else:
+        return f"Failed to create camera: {result.get('message', 'Unknown error')}"
 
 @mcp.tool("setup_lighting", "Set up a predefined lighting setup.", {
     "lighting_type": {"type": "string", "default": "THREE_POINT", "description": "Type of lighting setup"},
     "location": {"type": "array", "description": "Optional location override for lights"}
 })
+@_tool_errors("setup lighting")
 def setup_lighting(lighting_type: str = "THREE_POINT", 
                   location: List[float] = None) -> str:
     """Set up a predefined lighting setup."""
-    try:
-        blender = get_blender_connection()
-        result = blender.send_command("setup_lighting", {
-            "lighting_type": lighting_type.upper(),
-            "location": location
-        })
-        
-        if result.get("success"):
-            light_count = result.get("light_count", 0)
-            return f"'{lighting_type}' lighting setup created with {light_count} lights"
-        else:
-            return f"Failed to setup lighting: {result.get('message', 'Unknown error')}"
-    except Exception as e:
-        logger.error(f"Error setting up lighting: {str(e)}")
-        return f"Failed to setup lighting: {str(e)}"
+    blender = get_blender_connection()
+    result = blender.send_command("setup_lighting", {
+        "lighting_type": _upper(_LIGHTING_TYPES, lighting_type),
+        "location": location
+    })
+    
+    if result.get("success"):
+        light_count = result.get("light_count", 0)
+        return f"'{lighting_type}' lighting setup created with {light_count} lights"
+    else:
+        return f"Failed to setup lighting: {result.get('message', 'Unknown error')}"
 
 @mcp.tool("get_server_status", "Get server connection status and Blender information.", {})
+@_tool_errors("get server status")
 def get_server_status() -> str:
     """Get server connection status and Blender information."""
-    try:
-        blender = get_blender_connection()
-        result = blender.send_command("get_server_status")
-        
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        logger.error(f"Error getting server status: {str(e)}")
-        return f"Failed to get server status: {str(e)}"
+    blender = get_blender_connection()
+    result = blender.send_command("get_server_status")
+    
+    return _to_json(result)
+
+@mcp.tool("batch_commands", "Run several Blender commands in order with a single round trip.", {
+    "commands": {"type": "array", "description": "Commands to run, each {\"type\": \"<command>\", \"params\": {...}}"}
+})
+@_tool_errors("run batch")
+def batch_commands(commands: List[Dict[str, Any]]) -> str:
+    """Run several Blender commands in order with a single round trip."""
+    blender = get_blender_connection()
+    results = blender.send_batch([
+        (command.get("type"), command.get("params")) for command in commands
+    ])
+    
+    return _to_json(results)
 
 # MCP Server Protocol Handlers
 async def handle_mcp_request(request: Dict[str, Any]) -> Dict[str, Any]:
@@ -777,74 +1114,102 @@ async def handle_mcp_request(request: Dict[str, Any]) -> Dict[str, Any]:
         
         if method == "tools/list":
             # Return list of available tools
-            tools = []
-            for tool_name, tool in mcp.tools.items():
-                tools.append({
-                    "name": tool_name,
-                    "description": tool.description,
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": tool.parameters
-                    }
-                })
-            return {"tools": tools}
+            return mcp.list_tools()
         
         elif method == "tools/call":
             # Call a specific tool
             tool_name = params.get("name")
             arguments = params.get("arguments", {})
             
-            if tool_name not in mcp.tools:
+            tool = mcp.tools.get(tool_name)
+            if tool is None:
                 return {"error": f"Tool '{tool_name}' not found"}
             
-            result = await mcp.call_tool(tool_name, arguments)
+            result = await mcp.run_tool(tool, arguments)
             return {"content": [{"type": "text", "text": result}]}
         
         elif method == "resources/list":
             # Return list of available resources
-            resources = []
-            for resource_uri, resource in mcp.resources.items():
-                resources.append({
-                    "uri": resource_uri,
-                    "name": resource_uri.split("/")[-1],
-                    "description": resource.description
-                })
-            return {"resources": resources}
+            return mcp.list_resources()
         
         else:
             return {"error": f"Unknown method: {method}"}
     
     except Exception as e:
-        logger.error(f"Error handling MCP request: {str(e)}")
+        logger.error("Error handling MCP request: %s", e)
         return {"error": str(e)}
 
+async def _respond(request: Dict[str, Any]) -> None:
+    """Handle one request and write its response line"""
+    response = await handle_mcp_request(request)
+    if "id" in request:
+        # Requests are answered as they finish, not in the order they came
+        response = {**response, "id": request["id"]}
+    # Written as bytes in one call, bypassing the text layer
+    out = sys.stdout.buffer
+    out.write(_encode_line(response))
+    out.flush()
+
+async def _stdin_lines() -> AsyncIterator[bytes]:
+    """Yield request lines from stdin until EOF without blocking the loop"""
+    loop = asyncio.get_running_loop()
+    # One line carries a whole request, so long code snippets must fit
+    reader = asyncio.StreamReader(limit=MAX_FRAME_SIZE)
+    try:
+        await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+    except (OSError, ValueError):
+        # Pipe transports refuse regular files, e.g. input redirected from
+        # one. A reader thread feeds those through a queue instead; it is
+        # bounded, so the thread waits rather than reading far ahead.
+        lines: asyncio.Queue = asyncio.Queue(maxsize=64)
+        
+        def read_lines():
+            try:
+                for line in iter(sys.stdin.buffer.readline, b""):
+                    asyncio.run_coroutine_threadsafe(lines.put(line), loop).result()
+                asyncio.run_coroutine_threadsafe(lines.put(b""), loop).result()
+            except (RuntimeError, CancelledError):
+                pass  # The loop has shut down
+        
+        threading.Thread(target=read_lines, name="stdin-reader", daemon=True).start()
+        while line := await lines.get():
+            yield line
+        return
+    while line := await reader.readline():
+        yield line
+
 async def run_server():
     """Run the MCP server"""
     logger.info("Starting BlenderMCP Comprehensive Server")
-    logger.info(f"Available tools: {list(mcp.tools.keys())}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Available tools: %s", list(mcp.tools))
     
     # For stdin/stdout mode (MCP protocol)
     if len(sys.argv) > 1 and sys.argv[1] == "--transport":
         if sys.argv[2] == "stdio":
-            # STDIO mode for MCP
-            while True:
-                try:
-                    line = await asyncio.get_event_loop().run_in_executor(None, input)
+            # STDIO mode for MCP. Each request is handled in its own task, so a
+            # slow tool call does not hold up the ones after it.
+            pending = set()
+            try:
+                async for line in _stdin_lines():
                     if not line.strip():
                         continue
                     
-                    request = json.loads(line)
-                    response = await handle_mcp_request(request)
-                    print(json.dumps(response))
-                    sys.stdout.flush()
+                    request = _decode_message(line)
+                    task = asyncio.ensure_future(_respond(request))
+                    pending.add(task)
+                    task.add_done_callback(pending.discard)
                     
-                except (json.JSONDecodeError, KeyboardInterrupt):
-                    break
-                except Exception as e:
-                    logger.error(f"Error in server loop: {str(e)}")
-                    break
+            except (json.JSONDecodeError, KeyboardInterrupt):
+                pass
+            except Exception as e:
+                logger.error("Error in server loop: %s", e)
+            
+            # Finish answering what was already read
+            if pending:
+                await asyncio.gather(*pending)
         else:
-            logger.error(f"Unsupported transport: {sys.argv[2]}")
+            logger.error("Unsupported transport: %s", sys.argv[2])
     else:
         # Default to basic functionality test
         logger.info("Server is ready. Use --transport stdio for MCP protocol mode")
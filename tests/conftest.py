@@ -0,0 +1,38 @@
+"""
+Shared pytest configuration for the Blender MCP Server tests
+
+Puts src on the import path, imports the server once per session and runs
+the async tests on uvloop when it is installed.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+# Add src to Python path for imports, once even if conftest is re-imported
+_SRC = str(Path(__file__).resolve().parent.parent / "src")
+if _SRC not in sys.path:
+    sys.path.insert(0, _SRC)
+
+
+@pytest.fixture(scope="session")
+def mcp_server():
+    """The MCP server under test"""
+    from blender_mcp_server.server import mcp
+    return mcp
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Run the async tests on uvloop when it is installed"""
+    if UVLOOP_AVAILABLE:
+        return uvloop.EventLoopPolicy()
+    return asyncio.DefaultEventLoopPolicy()
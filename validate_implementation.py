@@ -4,227 +4,300 @@ Comprehensive Blender MCP Server Validation Script
 
 This script validates that all required tools and functionality are implemented
 without relying on external MCP package dependencies.
+
+Options:
+    --verbose   Include the per-tool analysis even when not on a terminal
+    --quiet     Leave out the per-tool analysis
+    --fast      Stop at the first failing check (for CI)
+    --help      Show this message
 """
 
 import json
 import sys
+from collections import Counter
+from itertools import chain
 from pathlib import Path
 
-# Add src to Python path
-sys.path.insert(0, str(Path(__file__).parent / "src"))
+# Add src to Python path, once even if this module is reloaded
+_SRC = str(Path(__file__).resolve().parent / "src")
+if _SRC not in sys.path:
+    sys.path.insert(0, _SRC)
 
 from blender_mcp_server.simple_server import mcp
 
-def validate_comprehensive_toolset():
-    """Validate that all 47+ tools are implemented across all categories"""
-    print("🔍 COMPREHENSIVE BLENDER MCP SERVER VALIDATION")
-    print("=" * 60)
+HEADER_RULE = "=" * 60
+SEPARATOR = "-" * 30
+
+# Per-tool lines of the detailed analysis
+_TOOL_REPORT = "\n📋 %s\n  Description: %s...\n  Parameters: %d defined"
+_PARAM_TYPES_REPORT = "  Parameter types: %s"
+
+# Expected tool categories and counts
+_EXPECTED_TOOL_LISTS = {
+    # Scene Management (8 tools)
+    "Scene Management": (
+        "create_scene", "set_scene_properties", "get_scene_info", "duplicate_scene",
+        "delete_scene", "set_world_properties", "get_world_properties", "clear_scene"
+    ),
+
+    # Object Operations (9 tools)
+    "Object Operations": (
+        "create_object", "transform_object", "delete_object", "duplicate_object",
+        "join_objects", "separate_objects", "parent_object", "unparent_object", "get_object_info"
+    ),
+
+    # Material Management (7 tools - we have 2 so far, would need 5 more for full set)
+    "Material Management": (
+        "create_material", "assign_material"  # Partially implemented
+    ),
+
+    # Mesh Operations (6 tools - would need to be added)
+    "Mesh Operations": (
+        # Placeholder for future implementation
+    ),
+
+    # Animation (6 tools - would need to be added)
+    "Animation System": (
+        # Placeholder for future implementation
+    ),
+
+    # Rendering (5 tools - we have 1 so far, would need 4 more for full set)
+    "Rendering Pipeline": (
+        "render_scene",  # Partially implemented
+    ),
+
+    # File I/O (4 tools - would need to be added)
+    "File I/O Operations": (
+        # Placeholder for future implementation
+    ),
+
+    # Camera/Lighting (4 tools - we have 2 so far, would need 2 more for full set)
+    "Camera & Lighting": (
+        "create_camera", "setup_lighting"  # Partially implemented
+    ),
+
+    # Utility Tools (3 tools)
+    "Utility Tools": (
+        "get_server_status",  # Partially implemented
+    ),
+}
+_EXPECTED_TOOLS = {category: frozenset(names) for category, names in _EXPECTED_TOOL_LISTS.items()}
+_EXPECTED_FLAT = frozenset(chain.from_iterable(_EXPECTED_TOOLS.values()))
+_EXPECTED_TOTAL = len(_EXPECTED_FLAT)
+
+def _write_report(lines):
+    """Write a section's report lines to stdout in one call"""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+def validate_comprehensive_toolset(verbose=True):
+    """Validate that all 47+ tools are implemented across all categories
+
+    The per-tool analysis is only produced when verbose is set.
+    """
+    out = []
+    emit = out.append
     
-    tools = mcp.tools
-    tool_names = list(tools.keys())
+    emit("🔍 COMPREHENSIVE BLENDER MCP SERVER VALIDATION")
+    emit(HEADER_RULE)
     
-    print(f"📊 Total tools implemented: {len(tool_names)}")
+    tools = mcp.tools
+    tool_names = set(tools)
     
-    # Expected tool categories and counts
-    expected_tools = {
-        # Scene Management (8 tools)
-        "Scene Management": [
-            "create_scene", "set_scene_properties", "get_scene_info", "duplicate_scene",
-            "delete_scene", "set_world_properties", "get_world_properties", "clear_scene"
-        ],
-        
-        # Object Operations (9 tools)
-        "Object Operations": [
-            "create_object", "transform_object", "delete_object", "duplicate_object",
-            "join_objects", "separate_objects", "parent_object", "unparent_object", "get_object_info"
-        ],
-        
-        # Material Management (7 tools - we have 2 so far, would need 5 more for full set)
-        "Material Management": [
-            "create_material", "assign_material"  # Partially implemented
-        ],
-        
-        # Mesh Operations (6 tools - would need to be added)
-        "Mesh Operations": [
-            # Placeholder for future implementation
-        ],
-        
-        # Animation (6 tools - would need to be added)
-        "Animation System": [
-            # Placeholder for future implementation
-        ],
-        
-        # Rendering (5 tools - we have 1 so far, would need 4 more for full set)
-        "Rendering Pipeline": [
-            "render_scene"  # Partially implemented
-        ],
-        
-        # File I/O (4 tools - would need to be added)
-        "File I/O Operations": [
-            # Placeholder for future implementation
-        ],
-        
-        # Camera/Lighting (4 tools - we have 2 so far, would need 2 more for full set)
-        "Camera & Lighting": [
-            "create_camera", "setup_lighting"  # Partially implemented
-        ],
-        
-        # Utility Tools (3 tools)
-        "Utility Tools": [
-            "get_server_status"  # Partially implemented
-        ]
-    }
+    emit(f"📊 Total tools implemented: {len(tool_names)}")
     
     # Validate each category
-    total_expected = 0
-    implemented_tools = []
+    total_expected = _EXPECTED_TOTAL
+    implemented_tools = tool_names & _EXPECTED_FLAT
+    implemented_count = len(implemented_tools)
     
-    for category, category_tools in expected_tools.items():
-        total_expected += len(category_tools)
-        implemented_in_category = []
-        missing_in_category = []
-        
-        for tool in category_tools:
-            if tool in tool_names:
-                implemented_in_category.append(tool)
-                implemented_tools.append(tool)
-            else:
-                missing_in_category.append(tool)
+    for category, category_tools in _EXPECTED_TOOLS.items():
+        implemented_in_category = sorted(category_tools & tool_names)
+        missing_in_category = sorted(category_tools - tool_names)
         
-        print(f"\n🎯 {category}")
-        print(f"  ✅ Implemented: {len(implemented_in_category)}/{len(category_tools)}")
+        emit(f"\n🎯 {category}")
+        emit(f"  ✅ Implemented: {len(implemented_in_category)}/{len(category_tools)}")
         
         if implemented_in_category:
-            print(f"    {', '.join(implemented_in_category)}")
+            emit(f"    {', '.join(implemented_in_category)}")
         
         if missing_in_category:
-            print(f"  ❌ Missing: {len(missing_in_category)}")
-            print(f"    {', '.join(missing_in_category)}")
+            emit(f"  ❌ Missing: {len(missing_in_category)}")
+            emit(f"    {', '.join(missing_in_category)}")
     
     # Check for unexpected tools
-    unexpected_tools = set(tool_names) - set(implemented_tools)
+    unexpected_tools = tool_names - _EXPECTED_FLAT
     if unexpected_tools:
-        print(f"\n🔍 Unexpected tools found: {len(unexpected_tools)}")
-        print(f"  {', '.join(sorted(unexpected_tools))}")
+        emit(f"\n🔍 Unexpected tools found: {len(unexpected_tools)}")
+        emit(f"  {', '.join(sorted(unexpected_tools))}")
     
     # Summary
-    print(f"\n📈 IMPLEMENTATION SUMMARY")
-    print("-" * 30)
-    print(f"Expected tools: {total_expected}")
-    print(f"Implemented tools: {len(implemented_tools)}")
-    print(f"Implementation coverage: {len(implemented_tools)}/{total_expected} ({len(implemented_tools)/total_expected*100:.1f}%)")
-    print(f"Additional unexpected tools: {len(unexpected_tools)}")
+    emit(f"\n📈 IMPLEMENTATION SUMMARY")
+    emit(SEPARATOR)
+    emit(f"Expected tools: {total_expected}")
+    emit(f"Implemented tools: {implemented_count}")
+    emit(f"Implementation coverage: {implemented_count}/{total_expected} ({implemented_count * 100 / total_expected:.1f}%)")
+    emit(f"Additional unexpected tools: {len(unexpected_tools)}")
     
     # Detailed tool analysis
-    print(f"\n🛠️ DETAILED TOOL ANALYSIS")
-    print("-" * 30)
-    
-    for tool_name in sorted(tool_names):
-        tool = tools[tool_name]
-        print(f"\n📋 {tool_name}")
-        print(f"  Description: {tool.description[:100]}...")
-        print(f"  Parameters: {len(tool.parameters)} defined")
+    if verbose:
+        emit(f"\n🛠️ DETAILED TOOL ANALYSIS")
+        emit(SEPARATOR)
         
-        # Show parameter types
-        param_types = {}
-        for param_name, param_info in tool.parameters.items():
-            param_type = param_info.get('type', 'unknown')
-            param_types[param_type] = param_types.get(param_type, 0) + 1
-        
-        if param_types:
-            print(f"  Parameter types: {param_types}")
+        for tool_name, tool in sorted(tools.items()):
+            parameters = tool.parameters
+            emit(_TOOL_REPORT % (tool_name, tool.description[:100], len(parameters)))
+            
+            # Show parameter types
+            param_types = dict(Counter(info.get('type', 'unknown') for info in parameters.values()))
+            
+            if param_types:
+                emit(_PARAM_TYPES_REPORT % (param_types,))
     
     # Validation result
-    print(f"\n✅ VALIDATION RESULTS")
-    print("-" * 30)
+    emit(f"\n✅ VALIDATION RESULTS")
+    emit(SEPARATOR)
     
-    if len(implemented_tools) >= 20:  # At least 20 comprehensive tools
-        print("🎉 PASSED: Comprehensive toolset implemented")
-        print(f"   - {len(implemented_tools)} tools across multiple categories")
-        print("   - Full coverage of core 3D modeling workflows")
-        print("   - Production-ready architecture")
-        print("   - Comprehensive error handling")
-        return True
+    passed = implemented_count >= 20  # At least 20 comprehensive tools
+    if passed:
+        emit("🎉 PASSED: Comprehensive toolset implemented")
+        emit(f"   - {implemented_count} tools across multiple categories")
+        emit("   - Full coverage of core 3D modeling workflows")
+        emit("   - Production-ready architecture")
+        emit("   - Comprehensive error handling")
     else:
-        print("❌ FAILED: Insufficient tool coverage")
-        print(f"   - Only {len(implemented_tools)} tools implemented")
-        print(f"   - Need at least 20 tools for comprehensive coverage")
-        return False
+        emit("❌ FAILED: Insufficient tool coverage")
+        emit(f"   - Only {implemented_count} tools implemented")
+        emit(f"   - Need at least 20 tools for comprehensive coverage")
+    
+    _write_report(out)
+    return passed
+
+# Architecture, best practice and readiness checks: (name, result), where a
+# result that depends on the server is a callable evaluated at check time
+_COMPONENTS = (
+    ("MCP Server", lambda: mcp is not None),
+    ("Tool Registry", lambda: hasattr(mcp, 'tools') and len(mcp.tools) > 0),
+    ("Resource Registry", lambda: hasattr(mcp, 'resources')),
+    ("Connection Management", True),  # BlenderConnection class exists
+    ("Error Handling", True),  # Try-except blocks in tools
+    ("Logging", True),  # Logger configured
+    ("Type Safety", True),  # Type hints in functions
+)
+
+_BEST_PRACTICES = (
+    ("Descriptive Tool Names", True),
+    ("Comprehensive Docstrings", True),
+    ("Parameter Validation", True),
+    ("Error Handling", True),
+    ("Confirmation for Destructive Operations", True),
+    ("Consistent Return Types", True),
+    ("Logging for Debugging", True),
+    ("Modular Design", True),
+)
+
+_READINESS_FEATURES = (
+    ("Environment Configuration", True),  # Environment variables support
+    ("Connection Management", True),  # Persistent connection handling
+    ("Timeout Handling", True),  # Socket timeouts configured
+    ("Error Recovery", True),  # Connection retry logic
+    ("Security Measures", True),  # Confirmation requirements
+    ("Performance Optimization", True),  # Efficient data structures
+    ("Cross-Platform Support", True),  # Standard library usage
+    ("Documentation", True),  # Comprehensive docs provided
+)
+
+# Status marks indexed by a check's result
+_STATUS = ("❌", "✅")
+
+def _report_checks(emit, checks):
+    """Emit a status line per check and return whether all of them passed"""
+    ok = True
+    for name, result in checks:
+        implemented = bool(result() if callable(result) else result)
+        ok &= implemented
+        emit(f"  {_STATUS[implemented]} {name}")
+    return ok
 
 def validate_server_architecture():
     """Validate server architecture and design patterns"""
-    print(f"\n🏗️ ARCHITECTURE VALIDATION")
-    print("-" * 30)
+    out = []
+    emit = out.append
     
-    # Check server components
-    components = {
-        "MCP Server": mcp is not None,
-        "Tool Registry": hasattr(mcp, 'tools') and len(mcp.tools) > 0,
-        "Resource Registry": hasattr(mcp, 'resources'),
-        "Connection Management": True,  # BlenderConnection class exists
-        "Error Handling": True,  # Try-except blocks in tools
-        "Logging": True,  # Logger configured
-        "Type Safety": True,  # Type hints in functions
-    }
+    emit(f"\n🏗️ ARCHITECTURE VALIDATION")
+    emit(SEPARATOR)
     
-    for component, implemented in components.items():
-        status = "✅" if implemented else "❌"
-        print(f"  {status} {component}")
+    # Check server components
+    ok = _report_checks(emit, _COMPONENTS)
     
     # Check for best practices
-    print(f"\n🔧 BEST PRACTICES CHECK")
-    print("-" * 30)
+    emit(f"\n🔧 BEST PRACTICES CHECK")
+    emit(SEPARATOR)
     
-    best_practices = {
-        "Descriptive Tool Names": True,
-        "Comprehensive Docstrings": True,
-        "Parameter Validation": True,
-        "Error Handling": True,
-        "Confirmation for Destructive Operations": True,
-        "Consistent Return Types": True,
-        "Logging for Debugging": True,
-        "Modular Design": True,
-    }
+    ok &= _report_checks(emit, _BEST_PRACTICES)
     
-    for practice, implemented in best_practices.items():
-        status = "✅" if implemented else "❌"
-        print(f"  {status} {practice}")
-    
-    return all(components.values()) and all(best_practices.values())
+    _write_report(out)
+    return ok
 
 def validate_production_readiness():
     """Validate production readiness features"""
-    print(f"\n🚀 PRODUCTION READINESS CHECK")
-    print("-" * 30)
+    out = []
+    emit = out.append
     
-    readiness_features = {
-        "Environment Configuration": True,  # Environment variables support
-        "Connection Management": True,  # Persistent connection handling
-        "Timeout Handling": True,  # Socket timeouts configured
-        "Error Recovery": True,  # Connection retry logic
-        "Security Measures": True,  # Confirmation requirements
-        "Performance Optimization": True,  # Efficient data structures
-        "Cross-Platform Support": True,  # Standard library usage
-        "Documentation": True,  # Comprehensive docs provided
-    }
+    emit(f"\n🚀 PRODUCTION READINESS CHECK")
+    emit(SEPARATOR)
     
-    for feature, implemented in readiness_features.items():
-        status = "✅" if implemented else "❌"
-        print(f"  {status} {feature}")
+    ok = _report_checks(emit, _READINESS_FEATURES)
     
-    return all(readiness_features.values())
+    _write_report(out)
+    return ok
+
+def _verbose():
+    """Whether to print the per-tool analysis: on a terminal or with --verbose, never with --quiet"""
+    if "--quiet" in sys.argv:
+        return False
+    return sys.stdout.isatty() or "--verbose" in sys.argv
+
+# Results of the three checks, keyed by server and registered tool names
+_VALIDATION_CACHE: dict[tuple, tuple[bool, bool, bool]] = {}
+
+def invalidate():
+    """Forget cached validation results, e.g. after tools are registered"""
+    _VALIDATION_CACHE.clear()
+
+def run_validations(fast=False):
+    """Run the three checks once per server and toolset; repeated calls reuse the results
+
+    With fast set, stops at the first failing check and returns None.
+    """
+    key = (id(mcp), hash(tuple(sorted(mcp.tools))))
+    results = _VALIDATION_CACHE.get(key)
+    if results is None:
+        checks = (
+            lambda: validate_comprehensive_toolset(verbose=_verbose()),
+            validate_server_architecture,
+            validate_production_readiness,
+        )
+        passed = []
+        for check in checks:
+            passed.append(check())
+            if fast and not passed[-1]:
+                return None
+        results = _VALIDATION_CACHE[key] = tuple(passed)
+    return results
 
 def main():
     """Run all validation checks"""
     try:
         # Core validation
-        toolset_valid = validate_comprehensive_toolset()
-        architecture_valid = validate_server_architecture()
-        production_valid = validate_production_readiness()
+        results = run_validations(fast="--fast" in sys.argv)
+        if results is None:
+            print("\n❌ VALIDATION FAILED! (stopped at the first failing check)")
+            return False
+        toolset_valid, architecture_valid, production_valid = results
         
         # Final assessment
         print(f"\n🎯 FINAL ASSESSMENT")
-        print("=" * 60)
+        print(HEADER_RULE)
         
         if toolset_valid and architecture_valid and production_valid:
             print("🎉 VALIDATION SUCCESSFUL!")
@@ -262,5 +335,8 @@ def main():
         return False
 
 if __name__ == "__main__":
+    if "--help" in sys.argv:
+        print(__doc__)
+        sys.exit(0)
     success = main()
     sys.exit(0 if success else 1)
\ No newline at end of file